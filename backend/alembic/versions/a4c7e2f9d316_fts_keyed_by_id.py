@@ -0,0 +1,29 @@
+"""key sqlite full-text tables by id instead of rowid
+
+Revision ID: a4c7e2f9d316
+Revises: f2b6d9a3c158
+Create Date: 2026-10-17 19:40:12.311842
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.search import ensure_search_schema
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c7e2f9d316'
+down_revision: Union[str, None] = 'f2b6d9a3c158'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rebuilds rowid-keyed SQLite FTS tables; a no-op elsewhere
+    ensure_search_schema(op.get_bind())
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,28 @@
+"""activity_logs task_id/created_at index
+
+Revision ID: b7c4e1a9d2f3
+Revises: ca0addd2be8e
+Create Date: 2026-10-17 10:12:40.418223
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c4e1a9d2f3'
+down_revision: Union[str, None] = 'ca0addd2be8e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_activity_logs_task_created', 'activity_logs', ['task_id', 'created_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_activity_logs_task_created', table_name='activity_logs')
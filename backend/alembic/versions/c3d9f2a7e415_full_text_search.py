@@ -0,0 +1,29 @@
+"""full-text search for tasks and comments
+
+Revision ID: c3d9f2a7e415
+Revises: b7c4e1a9d2f3
+Create Date: 2026-10-17 11:02:18.270915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.search import drop_search_schema, ensure_search_schema
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d9f2a7e415'
+down_revision: Union[str, None] = 'b7c4e1a9d2f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The DDL lives in app.core.search, which init_db also runs
+    ensure_search_schema(op.get_bind())
+
+
+def downgrade() -> None:
+    drop_search_schema(op.get_bind())
@@ -0,0 +1,44 @@
+"""trigram indexes for autocomplete
+
+Revision ID: d5a8b3e6f172
+Revises: c3d9f2a7e415
+Create Date: 2026-10-17 14:26:40.518330
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a8b3e6f172'
+down_revision: Union[str, None] = 'c3d9f2a7e415'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_COLUMNS = (
+    ('users', 'username'),
+    ('users', 'full_name'),
+    ('agents', 'name'),
+    ('projects', 'name'),
+    ('boards', 'name'),
+)
+
+
+def upgrade() -> None:
+    # SQLite serves autocomplete from the in-memory mention index instead
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, column in TRIGRAM_COLUMNS:
+        op.execute(
+            f"CREATE INDEX ix_{table}_{column}_trgm ON {table} USING GIN ({column} gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, column in TRIGRAM_COLUMNS:
+        op.drop_index(f'ix_{table}_{column}_trgm', table_name=table)
@@ -0,0 +1,31 @@
+"""webhook batching and compression
+
+Revision ID: f2b6d9a3c158
+Revises: e8f1c4b7a925
+Create Date: 2026-10-17 17:12:54.086291
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b6d9a3c158'
+down_revision: Union[str, None] = 'e8f1c4b7a925'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('webhooks', sa.Column('batch_window_seconds', sa.Integer(), nullable=True))
+    op.add_column('webhooks', sa.Column('batch_max_size', sa.Integer(), server_default='100', nullable=False))
+    op.add_column('webhooks', sa.Column('compress', sa.Boolean(), server_default=sa.false(), nullable=False))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('webhooks') as batch_op:
+        batch_op.drop_column('compress')
+        batch_op.drop_column('batch_max_size')
+        batch_op.drop_column('batch_window_seconds')
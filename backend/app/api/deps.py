@@ -1,23 +1,38 @@
+import copy
+from collections.abc import AsyncGenerator
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from uuid import UUID
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.security import APIKeyHeader, OAuth2PasswordBearer
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
-from app.core.database import get_db
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import get_db, recent_writers, replica_session
 from app.core.errors import AuthError, NotFoundError, PermissionError_
 from app.core.security import decode_token, hash_api_key
 from app.crud import crud_agent, crud_api_key, crud_board, crud_board_member, crud_project, crud_project_member
+from app.middleware.read_your_writes import wants_primary
 from app.models.agent import Agent
 from app.models.board import Board
 from app.models.project import Project
 from app.models.user import User
+from app.services import cache_invalidation
+from app.services.api_key_usage import api_key_usage
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login", auto_error=False)
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
+# Granted access checks keyed by (actor, project_id, board_id | None). Only
+# grants are cached, so new members never wait out a stale denial.
+access_cache = TTLCache(settings.ACCESS_CACHE_TTL, settings.ACCESS_CACHE_SIZE)
+# Resolved actors keyed by ("user", user_id) for JWTs or ("api_key", key_hash)
+actor_cache = TTLCache(settings.ACTOR_CACHE_TTL, settings.ACTOR_CACHE_SIZE)
+
 
 @dataclass
 class Actor:
@@ -36,28 +51,72 @@ class Actor:
         return self.user.full_name or self.user.username
 
 
-async def get_current_actor(
-    db: AsyncSession = Depends(get_db),
-    token: str | None = Depends(oauth2_scheme),
-    api_key: str | None = Depends(api_key_header),
+def _actor_key(actor: Actor) -> str:
+    return f"agent:{actor.agent.id}" if actor.is_agent else f"user:{actor.user.id}"
+
+
+@dataclass
+class _CachedActor:
+    """Column snapshots of a resolved actor, safe to share across sessions."""
+    user: dict
+    agent: dict | None = None
+    api_key_id: UUID | None = None
+    expires_at: datetime | None = None
+
+
+def _snapshot(obj) -> dict:
+    return {attr.key: getattr(obj, attr.key) for attr in inspect(obj).mapper.column_attrs}
+
+
+async def _restore(db: AsyncSession, model, data: dict):
+    # Attach a copy to this session as an already-loaded row (no SQL)
+    obj = model(**copy.deepcopy(data))
+    make_transient_to_detached(obj)
+    return await db.merge(obj, load=False)
+
+
+async def _actor_from_cache(db: AsyncSession, cached: _CachedActor) -> Actor:
+    user = await _restore(db, User, cached.user)
+    agent = await _restore(db, Agent, cached.agent) if cached.agent else None
+    return Actor(user=user, agent=agent)
+
+
+async def _resolve_actor(
+    db: AsyncSession, token: str | None, api_key: str | None
 ) -> Actor:
     if token:
         payload = decode_token(token)
+        user_id = UUID(payload["sub"])
+        cache_key = ("user", user_id)
+        cached = actor_cache.get(cache_key)
+        if cached:
+            return await _actor_from_cache(db, cached)
+
         from app.crud import crud_user
 
-        user = await crud_user.get(db, UUID(payload["sub"]))
+        user = await crud_user.get(db, user_id)
         if not user or not user.is_active:
             raise AuthError("Invalid or inactive user")
+        actor_cache.set(cache_key, _CachedActor(user=_snapshot(user)))
         return Actor(user=user)
 
     if api_key:
         key_hash = hash_api_key(api_key)
+        cache_key = ("api_key", key_hash)
+        cached = actor_cache.get(cache_key)
+        if cached:
+            if cached.expires_at and cached.expires_at < datetime.now(UTC):
+                actor_cache.pop(cache_key)
+                raise AuthError("API key has expired")
+            api_key_usage.touch(cached.api_key_id)
+            return await _actor_from_cache(db, cached)
+
         ak = await crud_api_key.get_by_key_hash(db, key_hash)
         if not ak or not ak.is_active:
             raise AuthError("Invalid API key")
         if ak.expires_at and ak.expires_at < datetime.now(UTC):
             raise AuthError("API key has expired")
-        await crud_api_key.update_last_used(db, ak)
+        api_key_usage.touch(ak.id)
         from app.crud import crud_user
 
         user = await crud_user.get(db, ak.user_id)
@@ -65,70 +124,133 @@ async def get_current_actor(
             raise AuthError("API key owner not found")
 
         # If key is linked to an agent, return agent actor
+        actor = Actor(user=user)
         if ak.agent_id:
             agent = await crud_agent.get(db, ak.agent_id)
             if agent and agent.is_active and not agent.deleted_at:
-                return Actor(user=user, agent=agent)
+                actor = Actor(user=user, agent=agent)
 
-        return Actor(user=user)
+        actor_cache.set(cache_key, _CachedActor(
+            user=_snapshot(user),
+            agent=_snapshot(actor.agent) if actor.agent else None,
+            api_key_id=ak.id,
+            expires_at=ak.expires_at,
+        ))
+        return actor
 
     raise AuthError("Not authenticated")
 
 
+async def get_current_actor(
+    db: AsyncSession = Depends(get_db),
+    token: str | None = Depends(oauth2_scheme),
+    api_key: str | None = Depends(api_key_header),
+) -> Actor:
+    actor = await _resolve_actor(db, token, api_key)
+    # Lets get_db record this actor as a recent writer (read-your-writes)
+    db.info["actor_key"] = _actor_key(actor)
+    return actor
+
+
+async def get_read_db(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    actor: Actor = Depends(get_current_actor),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Session for read-only endpoints.
+
+    Uses the read replica when one is configured, except for actors who
+    committed a write within READ_YOUR_WRITES_SECONDS — they get the
+    request's primary session so they always see their own changes. Writes
+    made through this worker are remembered here; writes through other
+    workers are recognised by the marker ``ReadYourWritesMiddleware`` sets.
+    """
+    if (
+        replica_session is None
+        or recent_writers.get(_actor_key(actor))
+        or wants_primary(request)
+    ):
+        yield db
+        return
+    async with replica_session() as session:
+        yield session
+
+
+cache_invalidation.register(
+    "user", actor_cache, lambda user_id: lambda key, value: str(value.user["id"]) == user_id
+)
+cache_invalidation.register(
+    "api_key", actor_cache, lambda key_hash: lambda key, value: key == ("api_key", key_hash)
+)
+cache_invalidation.register(
+    "agent", actor_cache,
+    lambda agent_id: lambda key, value: value.agent is not None and str(value.agent["id"]) == agent_id,
+)
+cache_invalidation.register(
+    "project_access", access_cache, lambda project_id: lambda key, value: str(key[1]) == project_id
+)
+cache_invalidation.register(
+    "agent_access", access_cache, lambda agent_id: lambda key, value: key[0] == f"agent:{agent_id}"
+)
+
+
+def invalidate_user(db: AsyncSession, user_id: UUID) -> None:
+    """Drop cached actors for a user (profile/preferences change, deactivation)."""
+    cache_invalidation.invalidate_after_commit(db, "user", user_id)
+
+
+def invalidate_api_key(db: AsyncSession, key_hash: str) -> None:
+    """Drop the cached actor for a revoked API key."""
+    cache_invalidation.invalidate_after_commit(db, "api_key", key_hash)
+
+
 async def get_current_user(
     actor: Actor = Depends(get_current_actor),
 ) -> User:
     return actor.user
 
 
-async def check_project_access(
-    project_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    actor: Actor = Depends(get_current_actor),
-) -> Project:
-    project = await crud_project.get(db, project_id)
-    if not project:
-        raise NotFoundError("Project not found")
+def invalidate_project_access(db: AsyncSession, project_id: UUID) -> None:
+    """Drop cached access grants for a project after a membership change."""
+    cache_invalidation.invalidate_after_commit(db, "project_access", project_id)
+
 
+def invalidate_agent_access(db: AsyncSession, agent_id: UUID) -> None:
+    """Drop cached actors and access grants for an agent (unlinked, deactivated or deleted)."""
+    cache_invalidation.invalidate_after_commit(db, "agent_access", agent_id)
+    cache_invalidation.invalidate_after_commit(db, "agent", agent_id)
+
+
+async def _verify_project_access(
+    db: AsyncSession, actor: Actor, project: Project
+) -> None:
     # Agent access: check agent_projects
     if actor.is_agent:
-        if await crud_agent.is_in_project(db, actor.agent.id, project_id):
-            return project
-        raise PermissionError_("Agent doesn't have access to this project")
+        if not await crud_agent.is_in_project(db, actor.agent.id, project.id):
+            raise PermissionError_("Agent doesn't have access to this project")
+        return
 
     # User access: owner or member
     if project.owner_id != actor.user.id:
         is_member = await crud_project_member.is_member(
-            db, project_id, actor.user.id
+            db, project.id, actor.user.id
         )
         if not is_member:
             raise PermissionError_("You don't have access to this project")
-    return project
 
 
-async def check_board_access(
-    project_id: UUID,
-    board_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    actor: Actor = Depends(get_current_actor),
-) -> Board:
-    project = await crud_project.get(db, project_id)
-    if not project:
-        raise NotFoundError("Project not found")
-
-    board = await crud_board.get(db, board_id)
-    if not board or board.project_id != project.id:
-        raise NotFoundError("Board not found")
-
+async def _verify_board_access(
+    db: AsyncSession, actor: Actor, project: Project, board_id: UUID
+) -> None:
     # Agent access: check agent_projects (agents get full board access within their projects)
     if actor.is_agent:
-        if await crud_agent.is_in_project(db, actor.agent.id, project_id):
-            return board
-        raise PermissionError_("Agent doesn't have access to this project")
+        if not await crud_agent.is_in_project(db, actor.agent.id, project.id):
+            raise PermissionError_("Agent doesn't have access to this project")
+        return
 
     # Project owner or admin -> access all boards
     if project.owner_id == actor.user.id:
-        return board
+        return
 
     project_member = await crud_project_member.get_by_project_and_user(
         db, project.id, actor.user.id
@@ -136,7 +258,7 @@ async def check_board_access(
     if not project_member:
         raise PermissionError_("You don't have access to this project")
     if project_member.role == "admin":
-        return board
+        return
 
     # Regular member -> must be board member
     is_board_member = await crud_board_member.is_member(
@@ -144,4 +266,46 @@ async def check_board_access(
     )
     if not is_board_member:
         raise PermissionError_("You don't have access to this board")
+
+
+async def check_project_access(
+    project_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    actor: Actor = Depends(get_current_actor),
+) -> Project:
+    project = await crud_project.get_for_access(db, project_id)
+    if not project:
+        raise NotFoundError("Project not found")
+
+    key = (_actor_key(actor), project_id, None)
+    if not access_cache.get(key):
+        await _verify_project_access(db, actor, project)
+        access_cache.set(key, True)
+    return project
+
+
+async def check_board_access(
+    project_id: UUID,
+    board_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    actor: Actor = Depends(get_current_actor),
+) -> Board:
+    key = (_actor_key(actor), project_id, board_id)
+    granted = access_cache.get(key)
+
+    # A cached grant implies the project existed; the board load below
+    # still catches deletion and cross-project ids
+    project = None
+    if not granted:
+        project = await crud_project.get_for_access(db, project_id)
+        if not project:
+            raise NotFoundError("Project not found")
+
+    board = await crud_board.get(db, board_id)
+    if not board or board.project_id != project_id:
+        raise NotFoundError("Board not found")
+
+    if not granted:
+        await _verify_board_access(db, actor, project, board_id)
+        access_cache.set(key, True)
     return board
@@ -1,10 +1,11 @@
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import check_project_access
-from app.core.database import get_db
+from app.api.deps import check_project_access, get_read_db
+from app.core.pagination import decode_cursor, next_cursor, total_pages
 from app.crud import crud_activity_log
 from app.models.project import Project
 from app.schemas.activity_log import ActivityLogResponse
@@ -21,21 +22,30 @@ async def list_activity(
     entity_type: str | None = Query(None),
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(None, description="next_cursor from a previous page"),
+    include_total: bool = Query(True),
+    db: AsyncSession = Depends(get_read_db),
     project: Project = Depends(check_project_access),
 ):
     skip = (page - 1) * per_page
     logs = await crud_activity_log.get_multi_by_project(
-        db, project.id, action=action, entity_type=entity_type, skip=skip, limit=per_page
+        db, project.id, action=action, entity_type=entity_type, skip=skip, limit=per_page,
+        cursor=decode_cursor(cursor, (datetime, UUID)) if cursor else None,
+    )
+    total = (
+        await crud_activity_log.count_by_project(
+            db, project.id, action=action, entity_type=entity_type
+        )
+        if include_total else None
     )
-    total = await crud_activity_log.count(db, filters={"project_id": project.id})
     return PaginatedResponse(
         data=[ActivityLogResponse.model_validate(l) for l in logs],
         pagination=PaginationMeta(
             page=page,
             per_page=per_page,
             total=total,
-            total_pages=(total + per_page - 1) // per_page if total else 0,
+            total_pages=total_pages(total, per_page),
+            next_cursor=next_cursor(logs, per_page, "created_at", "id"),
         ),
     )
 
@@ -45,18 +55,27 @@ async def task_activity(
     task_id: UUID,
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(None, description="next_cursor from a previous page"),
+    include_total: bool = Query(True),
+    db: AsyncSession = Depends(get_read_db),
     project: Project = Depends(check_project_access),
 ):
     skip = (page - 1) * per_page
-    logs = await crud_activity_log.get_multi_by_task(db, task_id)
-    paginated = logs[skip : skip + per_page]
+    logs = await crud_activity_log.get_multi_by_task(
+        db, task_id, project_id=project.id, skip=skip, limit=per_page,
+        cursor=decode_cursor(cursor, (datetime, UUID)) if cursor else None,
+    )
+    total = (
+        await crud_activity_log.count_by_task(db, task_id, project_id=project.id)
+        if include_total else None
+    )
     return PaginatedResponse(
-        data=[ActivityLogResponse.model_validate(l) for l in paginated],
+        data=[ActivityLogResponse.model_validate(l) for l in logs],
         pagination=PaginationMeta(
             page=page,
             per_page=per_page,
-            total=len(logs),
-            total_pages=(len(logs) + per_page - 1) // per_page if logs else 0,
+            total=total,
+            total_pages=total_pages(total, per_page),
+            next_cursor=next_cursor(logs, per_page, "created_at", "id"),
         ),
     )
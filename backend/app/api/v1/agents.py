@@ -3,7 +3,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import check_project_access, get_current_user
+from app.api.deps import check_project_access, get_current_user, invalidate_agent_access
 from app.core.errors import DuplicateError, NotFoundError
 from app.core.database import get_db
 from app.crud import crud_agent
@@ -18,6 +18,7 @@ from app.schemas.agent import (
     ProjectBrief,
 )
 from app.schemas.base import ResponseBase
+from app.services.autocomplete_service import AutocompleteService
 
 router = APIRouter(
     prefix="/projects/{project_id}/agents", tags=["Agents"]
@@ -89,6 +90,8 @@ async def update_global_agent(
         setattr(agent, field, value)
     db.add(agent)
     await db.flush()
+    invalidate_agent_access(db, agent_id)
+    AutocompleteService.invalidate(db)
     agent = await crud_agent.get_with_projects(db, agent_id)
     return ResponseBase(data=_agent_with_projects(agent))
 
@@ -105,6 +108,8 @@ async def delete_global_agent(
         raise NotFoundError("Agent not found")
     await crud_agent.remove_from_all_projects(db, agent_id)
     await crud_agent.soft_delete(db, agent)
+    invalidate_agent_access(db, agent_id)
+    AutocompleteService.invalidate(db)
 
 
 @router.get("/", response_model=ResponseBase[list[AgentResponse]])
@@ -141,6 +146,7 @@ async def create_agent(
     await db.refresh(agent)
     # Link agent to this project
     await crud_agent.add_to_project(db, agent.id, project.id)
+    AutocompleteService.invalidate(db, project.id)
     return ResponseBase(data=AgentResponse.model_validate(agent))
 
 
@@ -159,6 +165,7 @@ async def link_agent_to_project(
     if already:
         raise DuplicateError("Agent already linked to this project")
     await crud_agent.add_to_project(db, agent_id, project.id)
+    AutocompleteService.invalidate(db, project.id)
     return ResponseBase(data=AgentResponse.model_validate(agent))
 
 
@@ -187,6 +194,8 @@ async def update_agent(
     db.add(agent)
     await db.flush()
     await db.refresh(agent)
+    invalidate_agent_access(db, agent_id)
+    AutocompleteService.invalidate(db)
     return ResponseBase(data=AgentResponse.model_validate(agent))
 
 
@@ -206,3 +215,5 @@ async def delete_agent(
     # Soft-delete if agent has no remaining projects
     if not await crud_agent.has_any_project(db, agent_id):
         await crud_agent.soft_delete(db, agent)
+    invalidate_agent_access(db, agent_id)
+    AutocompleteService.invalidate(db, project.id)
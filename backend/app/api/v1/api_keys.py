@@ -3,7 +3,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, invalidate_api_key
 from app.core.database import get_db
 from app.crud import crud_api_key
 from app.models.user import User
@@ -72,3 +72,4 @@ async def delete_api_key(
     key.is_active = False
     db.add(key)
     await db.flush()
+    invalidate_api_key(db, key.key_hash)
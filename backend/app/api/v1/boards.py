@@ -3,7 +3,12 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import check_board_access, check_project_access, get_current_user
+from app.api.deps import (
+    check_board_access,
+    check_project_access,
+    get_current_user,
+    invalidate_project_access,
+)
 from app.core.database import get_db
 from app.crud import crud_board, crud_board_member
 from app.models.board import Board
@@ -151,6 +156,7 @@ async def update_board_member(
     member.role = member_in.role
     db.add(member)
     await db.flush()
+    invalidate_project_access(db, board.project_id)
     await db.refresh(member)
     return ResponseBase(data=BoardMemberResponse.model_validate(member))
 
@@ -168,3 +174,4 @@ async def remove_board_member(
             detail="Board member not found",
         )
     await crud_board_member.remove(db, id=member_id)
+    invalidate_project_access(db, board.project_id)
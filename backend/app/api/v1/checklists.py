@@ -21,8 +21,8 @@ from app.schemas.checklist import (
     ChecklistResponse,
     ChecklistUpdate,
 )
+from app.services import event_outbox
 from app.services.checklist_service import ChecklistService
-from app.services.websocket_manager import manager
 
 router = APIRouter(
     prefix="/projects/{project_id}/boards/{board_id}/tasks/{task_id}/checklists",
@@ -44,8 +44,9 @@ async def _get_checklist_or_404(checklist_id: UUID, task_id: UUID, db: AsyncSess
     return checklist
 
 
-async def _broadcast_checklist_update(board: Board, task_id: UUID):
-    await manager.broadcast_to_board(
+def _broadcast_checklist_update(db: AsyncSession, board: Board, task_id: UUID):
+    event_outbox.broadcast_to_board(
+        db,
         str(board.project_id),
         str(board.id),
         {
@@ -80,7 +81,7 @@ async def create_checklist(
 ):
     task = await _get_task_or_404(task_id, board, db)
     checklist = await ChecklistService.create_checklist(db, task, current_user.id, body)
-    await _broadcast_checklist_update(board, task_id)
+    _broadcast_checklist_update(db, board, task_id)
     return ResponseBase(data=ChecklistResponse.model_validate(checklist))
 
 
@@ -95,7 +96,7 @@ async def update_checklist(
 ):
     checklist = await _get_checklist_or_404(checklist_id, task_id, db)
     updated = await ChecklistService.update_checklist(db, checklist, current_user.id, body)
-    await _broadcast_checklist_update(board, task_id)
+    _broadcast_checklist_update(db, board, task_id)
     return ResponseBase(data=ChecklistResponse.model_validate(updated))
 
 
@@ -109,7 +110,7 @@ async def delete_checklist(
 ):
     checklist = await _get_checklist_or_404(checklist_id, task_id, db)
     await ChecklistService.delete_checklist(db, checklist, current_user.id)
-    await _broadcast_checklist_update(board, task_id)
+    _broadcast_checklist_update(db, board, task_id)
 
 
 @router.patch("/{checklist_id}/reorder", response_model=ResponseBase[ChecklistResponse])
@@ -125,7 +126,7 @@ async def reorder_checklist(
     db.add(checklist)
     await db.flush()
     await db.refresh(checklist)
-    await _broadcast_checklist_update(board, task_id)
+    _broadcast_checklist_update(db, board, task_id)
     return ResponseBase(data=ChecklistResponse.model_validate(checklist))
 
 
@@ -142,7 +143,7 @@ async def create_item(
 ):
     checklist = await _get_checklist_or_404(checklist_id, task_id, db)
     item = await ChecklistService.create_item(db, checklist, current_user.id, body)
-    await _broadcast_checklist_update(board, task_id)
+    _broadcast_checklist_update(db, board, task_id)
     return ResponseBase(data=ChecklistItemResponse.model_validate(item))
 
 
@@ -161,7 +162,7 @@ async def update_item(
     if not item or item.checklist_id != checklist_id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
     updated = await ChecklistService.update_item(db, item, current_user.id, body)
-    await _broadcast_checklist_update(board, task_id)
+    _broadcast_checklist_update(db, board, task_id)
     return ResponseBase(data=ChecklistItemResponse.model_validate(updated))
 
 
@@ -188,7 +189,7 @@ async def delete_item(
         changes={"checklist_item": f'removed "{item.title}"'},
     )
     await crud_checklist_item.remove(db, id=item_id)
-    await _broadcast_checklist_update(board, task_id)
+    _broadcast_checklist_update(db, board, task_id)
 
 
 @router.post("/{checklist_id}/items/{item_id}/toggle", response_model=ResponseBase[ChecklistItemResponse])
@@ -205,7 +206,7 @@ async def toggle_item(
     if not item or item.checklist_id != checklist_id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
     toggled = await ChecklistService.toggle_item(db, item, current_user.id)
-    await _broadcast_checklist_update(board, task_id)
+    _broadcast_checklist_update(db, board, task_id)
     return ResponseBase(data=ChecklistItemResponse.model_validate(toggled))
 
 
@@ -226,5 +227,5 @@ async def reorder_item(
     db.add(item)
     await db.flush()
     await db.refresh(item)
-    await _broadcast_checklist_update(board, task_id)
+    _broadcast_checklist_update(db, board, task_id)
     return ResponseBase(data=ChecklistItemResponse.model_validate(item))
@@ -1,3 +1,4 @@
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -6,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.deps import Actor, check_board_access, get_current_actor, get_current_user
 from app.core.errors import NotFoundError, PermissionError_, ValidationError
 from app.core.database import get_db
+from app.core.pagination import decode_cursor, next_cursor, total_pages
 from app.crud import crud_activity_log, crud_agent, crud_attachment, crud_comment, crud_reaction, crud_task
 from app.models.board import Board
 from app.models.comment import Comment
@@ -13,7 +15,7 @@ from app.models.user import User
 from app.schemas.base import PaginatedResponse, PaginationMeta, ResponseBase
 from app.schemas.comment import CommentCreate, CommentResponse, CommentUpdate
 from app.services.content_service import extract_mentions, extract_plain_text, normalize_content
-from app.services.notification_service import NotificationService
+from app.services.notification_service import NotificationDraft, NotificationService
 from app.services.reaction_service import ReactionService
 
 router = APIRouter(
@@ -36,14 +38,22 @@ async def list_comments(
     task_id: UUID,
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
+    cursor: str | None = Query(None, description="next_cursor from a previous page"),
+    include_total: bool = Query(True),
     db: AsyncSession = Depends(get_db),
     board: Board = Depends(check_board_access),
     current_user: User = Depends(get_current_user),
 ):
     await _get_task_or_404(task_id, board, db)
     skip = (page - 1) * per_page
-    comments = await crud_comment.get_multi_by_task(db, task_id, skip=skip, limit=per_page)
-    total = await crud_comment.count(db, filters={"task_id": task_id})
+    comments = await crud_comment.get_multi_by_task(
+        db, task_id, skip=skip, limit=per_page,
+        cursor=decode_cursor(cursor, (datetime, UUID)) if cursor else None,
+    )
+    total = (
+        await crud_comment.count(db, filters={"task_id": task_id})
+        if include_total else None
+    )
 
     comment_ids = [c.id for c in comments]
     reaction_summaries = await crud_reaction.get_summaries_batch(
@@ -61,7 +71,8 @@ async def list_comments(
             page=page,
             per_page=per_page,
             total=total,
-            total_pages=(total + per_page - 1) // per_page if total else 0,
+            total_pages=total_pages(total, per_page),
+            next_cursor=next_cursor(comments, per_page, "created_at", "id"),
         ),
     )
 
@@ -120,40 +131,20 @@ async def create_comment(
     )
 
     commenter_name = actor.display_name
-    notified_uids: set[str] = set()
-    for assignee in task.assignees:
-        if not assignee.user_id or assignee.user_id == actor.user.id:
-            continue
-        notif = await NotificationService.create_notification(
-            db,
-            user_id=assignee.user_id,
-            actor_id=actor.user.id,
-            project_id=board.project_id,
-            type="task_comment",
-            title="New Comment",
-            message=f'{commenter_name} commented on "{task.title}": {preview}',
-            data={"task_id": str(task_id), "board_id": str(board.id)},
-        )
-        if notif:
-            notified_uids.add(str(assignee.user_id))
-    # Notify watchers (skip already notified assignees and self)
-    for watcher in task.watchers:
-        if not watcher.user_id or watcher.user_id == actor.user.id:
-            continue
-        if str(watcher.user_id) in notified_uids:
-            continue
-        notif = await NotificationService.create_notification(
-            db,
-            user_id=watcher.user_id,
-            actor_id=actor.user.id,
-            project_id=board.project_id,
-            type="task_comment",
-            title="Watching: New Comment",
-            message=f'{commenter_name} commented on "{task.title}": {preview}',
-            data={"task_id": str(task_id), "board_id": str(board.id)},
-        )
-        if notif:
-            notified_uids.add(str(watcher.user_id))
+    data = {"task_id": str(task_id), "board_id": str(board.id)}
+    drafts: list[NotificationDraft] = []
+    # Assignees first, then watchers (skip already notified assignees and self)
+    notified_uids: set[UUID] = {actor.user.id}
+    for title, people in (("New Comment", task.assignees), ("Watching: New Comment", task.watchers)):
+        for p in people:
+            if not p.user_id or p.user_id in notified_uids:
+                continue
+            notified_uids.add(p.user_id)
+            drafts.append(NotificationDraft(
+                user_id=p.user_id, type="task_comment", title=title,
+                message=f'{commenter_name} commented on "{task.title}": {preview}',
+                project_id=board.project_id, data=data,
+            ))
 
     # Notify @mentioned users in comment
     if content_doc:
@@ -164,16 +155,12 @@ async def create_comment(
             if uid_str in notified_mention or uid_str == str(actor.user.id):
                 continue
             notified_mention.add(uid_str)
-            notif = await NotificationService.create_notification(
-                db,
-                user_id=UUID(uid_str),
-                actor_id=actor.user.id,
-                project_id=board.project_id,
-                type="mentioned",
-                title="Mentioned in Comment",
+            drafts.append(NotificationDraft(
+                user_id=UUID(uid_str), type="mentioned", title="Mentioned in Comment",
                 message=f'{commenter_name} mentioned you in a comment on "{task.title}"',
-                data={"task_id": str(task_id), "board_id": str(board.id)},
-            )
+                project_id=board.project_id, data=data,
+            ))
+    await NotificationService.create_notifications_bulk(db, drafts, actor_id=actor.user.id)
 
     await NotificationService.fire_webhooks(
         db, board.project_id, "comment.created",
@@ -221,19 +208,20 @@ async def update_comment(
     if newly_mentioned:
         task = await crud_task.get(db, task_id)
         commenter_name = current_user.full_name or current_user.username
-        for uid_str in newly_mentioned:
-            if uid_str == str(current_user.id):
-                continue
-            notif = await NotificationService.create_notification(
-                db,
-                user_id=UUID(uid_str),
-                actor_id=current_user.id,
-                project_id=board.project_id,
-                type="mentioned",
-                title="Mentioned in Comment",
-                message=f'{commenter_name} mentioned you in a comment on "{task.title if task else "a task"}"',
-                data={"task_id": str(task_id), "board_id": str(board.id)},
-            )
+        await NotificationService.create_notifications_bulk(
+            db,
+            [
+                NotificationDraft(
+                    user_id=UUID(uid_str), type="mentioned", title="Mentioned in Comment",
+                    message=f'{commenter_name} mentioned you in a comment on "{task.title if task else "a task"}"',
+                    project_id=board.project_id,
+                    data={"task_id": str(task_id), "board_id": str(board.id)},
+                )
+                for uid_str in newly_mentioned
+                if uid_str != str(current_user.id)
+            ],
+            actor_id=current_user.id,
+        )
 
     return ResponseBase(data=CommentResponse.model_validate(comment))
 
@@ -265,37 +253,23 @@ async def delete_comment(
     task = await crud_task.get_with_relations(db, task_id)
     if task:
         deleter_name = current_user.full_name or current_user.username
-        notified_uids: set[str] = set()
-        for a in task.assignees:
-            if not a.user_id or a.user_id == current_user.id:
-                continue
-            notif = await NotificationService.create_notification(
-                db,
-                user_id=a.user_id,
-                actor_id=current_user.id,
-                project_id=board.project_id,
-                type="comment_deleted",
-                title="Comment Deleted",
-                message=f'{deleter_name} deleted a comment on "{task.title}"',
-                data={"task_id": str(task_id), "board_id": str(board.id)},
-            )
-            if notif:
-                notified_uids.add(str(a.user_id))
-        for w in task.watchers:
-            if not w.user_id or w.user_id == current_user.id or str(w.user_id) in notified_uids:
-                continue
-            notif = await NotificationService.create_notification(
-                db,
-                user_id=w.user_id,
-                actor_id=current_user.id,
-                project_id=board.project_id,
-                type="comment_deleted",
-                title="Watching: Comment Deleted",
-                message=f'{deleter_name} deleted a comment on "{task.title}"',
-                data={"task_id": str(task_id), "board_id": str(board.id)},
-            )
-            if notif:
-                notified_uids.add(str(w.user_id))
+        data = {"task_id": str(task_id), "board_id": str(board.id)}
+        drafts: list[NotificationDraft] = []
+        notified_uids: set[UUID] = {current_user.id}
+        for title, people in (
+            ("Comment Deleted", task.assignees),
+            ("Watching: Comment Deleted", task.watchers),
+        ):
+            for p in people:
+                if not p.user_id or p.user_id in notified_uids:
+                    continue
+                notified_uids.add(p.user_id)
+                drafts.append(NotificationDraft(
+                    user_id=p.user_id, type="comment_deleted", title=title,
+                    message=f'{deleter_name} deleted a comment on "{task.title}"',
+                    project_id=board.project_id, data=data,
+                ))
+        await NotificationService.create_notifications_bulk(db, drafts, actor_id=current_user.id)
 
     await ReactionService.delete_reactions_for_entity(db, "comment", comment_id)
     await crud_comment.remove(db, id=comment_id)
@@ -19,8 +19,8 @@ from app.schemas.custom_field import (
     CustomFieldValueResponse,
     CustomFieldValueSet,
 )
+from app.services import event_outbox
 from app.services.custom_field_service import CustomFieldService
-from app.services.websocket_manager import manager
 
 router = APIRouter(tags=["Custom Fields"])
 
@@ -94,7 +94,7 @@ async def create_custom_field(
     definition = await CustomFieldService.create_definition(db, board.id, field_in)
     response = CustomFieldDefinitionResponse.model_validate(definition)
 
-    await manager.broadcast_to_board(str(board.project_id), str(board.id), {
+    event_outbox.broadcast_to_board(db, str(board.project_id), str(board.id), {
         "type": "custom_field.created",
         "project_id": str(board.project_id),
         "board_id": str(board.id),
@@ -129,7 +129,7 @@ async def update_custom_field(
     updated = await CustomFieldService.update_definition(db, definition, field_in)
     response = CustomFieldDefinitionResponse.model_validate(updated)
 
-    await manager.broadcast_to_board(str(board.project_id), str(board.id), {
+    event_outbox.broadcast_to_board(db, str(board.project_id), str(board.id), {
         "type": "custom_field.updated",
         "project_id": str(board.project_id),
         "board_id": str(board.id),
@@ -155,7 +155,7 @@ async def delete_custom_field(
 
     await crud_custom_field_definition.remove(db, id=field_id)
 
-    await manager.broadcast_to_board(str(board.project_id), str(board.id), {
+    event_outbox.broadcast_to_board(db, str(board.project_id), str(board.id), {
         "type": "custom_field.deleted",
         "project_id": str(board.project_id),
         "board_id": str(board.id),
@@ -184,7 +184,7 @@ async def reorder_custom_fields(
     definitions = await crud_custom_field_definition.get_multi_by_board(db, board.id)
     responses = [CustomFieldDefinitionResponse.model_validate(d) for d in definitions]
 
-    await manager.broadcast_to_board(str(board.project_id), str(board.id), {
+    event_outbox.broadcast_to_board(db, str(board.project_id), str(board.id), {
         "type": "custom_field.reordered",
         "project_id": str(board.project_id),
         "board_id": str(board.id),
@@ -270,7 +270,7 @@ async def bulk_set_field_values(
     if refreshed:
         from app.schemas.task import TaskResponse
         task_resp = TaskResponse.model_validate(refreshed)
-        await manager.broadcast_to_board(str(board.project_id), str(board.id), {
+        event_outbox.broadcast_to_board(db, str(board.project_id), str(board.id), {
             "type": "task.updated",
             "project_id": str(board.project_id),
             "board_id": str(board.id),
@@ -331,7 +331,7 @@ async def set_field_value(
     if refreshed:
         from app.schemas.task import TaskResponse
         task_resp = TaskResponse.model_validate(refreshed)
-        await manager.broadcast_to_board(str(board.project_id), str(board.id), {
+        event_outbox.broadcast_to_board(db, str(board.project_id), str(board.id), {
             "type": "task.updated",
             "project_id": str(board.project_id),
             "board_id": str(board.id),
@@ -382,7 +382,7 @@ async def clear_field_value(
     if refreshed:
         from app.schemas.task import TaskResponse
         task_resp = TaskResponse.model_validate(refreshed)
-        await manager.broadcast_to_board(str(board.project_id), str(board.id), {
+        event_outbox.broadcast_to_board(db, str(board.project_id), str(board.id), {
             "type": "task.updated",
             "project_id": str(board.project_id),
             "board_id": str(board.id),
@@ -5,8 +5,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user
-from app.core.database import get_db
+from app.api.deps import get_current_user, get_read_db
 from app.crud import crud_task
 from app.models.project import Project
 from app.models.project_member import ProjectMember
@@ -25,7 +24,7 @@ router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
 @router.get("/stats", response_model=ResponseBase[dict])
 async def get_dashboard_stats(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     user_projects = select(Project.id).where(
@@ -83,7 +82,7 @@ async def get_dashboard_stats(
 @router.get("/my-tasks", response_model=ResponseBase[MyTasksResponse])
 async def get_my_tasks(
     agent_id: UUID | None = Query(None),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     now = datetime.now(UTC)
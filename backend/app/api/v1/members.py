@@ -3,7 +3,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import check_project_access, get_current_user
+from app.api.deps import check_project_access, get_current_user, invalidate_project_access
 from app.core.database import get_db
 from app.crud import crud_project_member
 from app.models.project import Project
@@ -15,6 +15,7 @@ from app.schemas.project_member import (
     ProjectMemberResponse,
     ProjectMemberUpdate,
 )
+from app.services.autocomplete_service import AutocompleteService
 
 router = APIRouter(
     prefix="/projects/{project_id}/members", tags=["Members"]
@@ -54,6 +55,7 @@ async def add_member(
     db.add(member)
     await db.flush()
     await db.refresh(member)
+    AutocompleteService.invalidate(db, project.id)
     return ResponseBase(data=ProjectMemberResponse.model_validate(member))
 
 
@@ -70,6 +72,8 @@ async def update_member(
             status_code=status.HTTP_404_NOT_FOUND, detail="Member not found"
         )
     updated = await crud_project_member.update(db, db_obj=member, obj_in=member_in)
+    invalidate_project_access(db, project.id)
+    AutocompleteService.invalidate(db, project.id)
     return ResponseBase(data=ProjectMemberResponse.model_validate(updated))
 
 
@@ -85,3 +89,5 @@ async def remove_member(
             status_code=status.HTTP_404_NOT_FOUND, detail="Member not found"
         )
     await crud_project_member.remove(db, id=member_id)
+    invalidate_project_access(db, project.id)
+    AutocompleteService.invalidate(db, project.id)
@@ -1,8 +1,12 @@
+from datetime import datetime
+from uuid import UUID
+
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, invalidate_user
 from app.core.database import get_db
+from app.core.pagination import decode_cursor, next_cursor, total_pages
 from app.crud import crud_notification
 from app.models.user import User
 from app.schemas.base import PaginatedResponse, PaginationMeta, ResponseBase
@@ -19,15 +23,19 @@ router = APIRouter(prefix="/notifications", tags=["Notifications"])
 async def list_notifications(
     page: int = Query(1, ge=1),
     per_page: int = Query(30, ge=1, le=100),
+    cursor: str | None = Query(None, description="next_cursor from a previous page"),
+    include_total: bool = Query(True),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     skip = (page - 1) * per_page
     items = await crud_notification.get_by_user(
-        db, current_user.id, skip=skip, limit=per_page
+        db, current_user.id, skip=skip, limit=per_page,
+        cursor=decode_cursor(cursor, (datetime, UUID)) if cursor else None,
     )
-    total = await crud_notification.count(
-        db, filters={"user_id": current_user.id}
+    total = (
+        await crud_notification.count(db, filters={"user_id": current_user.id})
+        if include_total else None
     )
     return PaginatedResponse(
         data=[NotificationResponse.model_validate(n) for n in items],
@@ -35,7 +43,8 @@ async def list_notifications(
             page=page,
             per_page=per_page,
             total=total,
-            total_pages=(total + per_page - 1) // per_page if total else 0,
+            total_pages=total_pages(total, per_page),
+            next_cursor=next_cursor(items, per_page, "created_at", "id"),
         ),
     )
 
@@ -89,5 +98,6 @@ async def update_preferences(
 ):
     current_user.notification_preferences = body.model_dump()
     db.add(current_user)
+    invalidate_user(db, current_user.id)
     await db.commit()
     return ResponseBase(data=body)
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import check_project_access, get_current_user
 from app.core.database import get_db
+from app.core.pagination import total_pages
 from app.crud import crud_project
 from app.models.project import Project
 from app.models.user import User
@@ -30,17 +31,19 @@ async def list_projects(
 ):
     skip = (page - 1) * per_page
     projects = await crud_project.get_multi_by_user(
+        db, current_user.id, include_archived=include_archived,
+        skip=skip, limit=per_page,
+    )
+    total = await crud_project.count_by_user(
         db, current_user.id, include_archived=include_archived
     )
-    total = len(projects)
-    page_data = projects[skip : skip + per_page]
     return PaginatedResponse(
-        data=[ProjectResponse.model_validate(p) for p in page_data],
+        data=[ProjectResponse.model_validate(p) for p in projects],
         pagination=PaginationMeta(
             page=page,
             per_page=per_page,
             total=total,
-            total_pages=(total + per_page - 1) // per_page if total else 0,
+            total_pages=total_pages(total, per_page),
         ),
     )
 
@@ -57,8 +60,10 @@ async def create_project(
 
 @router.get("/{project_id}", response_model=ResponseBase[ProjectDetailResponse])
 async def get_project(
+    db: AsyncSession = Depends(get_db),
     project: Project = Depends(check_project_access),
 ):
+    project = await crud_project.get(db, project.id)
     return ResponseBase(data=ProjectDetailResponse.model_validate(project))
 
 
@@ -9,8 +9,8 @@ from app.models.board import Board
 from app.models.user import User
 from app.schemas.base import ResponseBase
 from app.schemas.reaction import ReactionSummary, ReactionToggle, ToggleResult
+from app.services import event_outbox
 from app.services.reaction_service import ReactionService
-from app.services.websocket_manager import manager
 
 task_router = APIRouter(
     prefix="/projects/{project_id}/boards/{board_id}/tasks/{task_id}/reactions",
@@ -43,7 +43,7 @@ async def toggle_task_reaction(
         user_id=actor.user.id,
         agent_id=agent_id,
     )
-    await manager.broadcast_to_board(str(board.project_id), str(board.id), {
+    event_outbox.broadcast_to_board(db, str(board.project_id), str(board.id), {
         "type": "reaction.updated",
         "entity_type": "task",
         "entity_id": str(task_id),
@@ -92,7 +92,7 @@ async def toggle_comment_reaction(
         user_id=actor.user.id,
         agent_id=agent_id,
     )
-    await manager.broadcast_to_board(str(board.project_id), str(board.id), {
+    event_outbox.broadcast_to_board(db, str(board.project_id), str(board.id), {
         "type": "reaction.updated",
         "entity_type": "comment",
         "entity_id": str(comment_id),
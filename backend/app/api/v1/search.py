@@ -1,79 +1,53 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.api.deps import get_current_user
-from app.core.database import get_db
-from app.models.project import Project
-from app.models.project_member import ProjectMember
-from app.models.task import Task
+from app.api.deps import get_current_user, get_read_db
+from app.core.errors import ValidationError
+from app.core.pagination import total_pages
 from app.models.user import User
 from app.schemas.base import PaginatedResponse, PaginationMeta
+from app.schemas.search import SearchResult
+from app.services.search_service import SEARCH_TYPES, SearchService
 
 router = APIRouter(prefix="/search", tags=["Search"])
 
 
-@router.get("/")
+@router.get("/", response_model=PaginatedResponse[SearchResult])
 async def global_search(
     q: str = Query(..., min_length=1),
-    type: str | None = Query(None),
+    types: str | None = Query(None, description="Comma-separated: project,board,task,comment"),
+    type: str | None = Query(None, description="Single result type (use types instead)"),
     project_id: UUID | None = Query(None),
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    include_total: bool = Query(True),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    skip = (page - 1) * per_page
-    results = []
-
-    if type is None or type == "project":
-        query = (
-            select(Project)
-            .outerjoin(ProjectMember)
-            .where(
-                or_(
-                    Project.owner_id == current_user.id,
-                    ProjectMember.user_id == current_user.id,
-                ),
-                Project.name.ilike(f"%{q}%"),
-            )
-            .distinct()
-            .offset(skip)
-            .limit(per_page)
-        )
-        res = await db.execute(query)
-        for p in res.scalars().all():
-            results.append({"type": "project", "id": str(p.id), "title": p.name, "slug": p.slug})
-
-    if type is None or type == "task":
-        query = select(Task).where(
-            or_(
-                Task.title.ilike(f"%{q}%"),
-                Task.description_text.ilike(f"%{q}%"),
-            ),
-        )
-        if project_id:
-            query = query.where(Task.project_id == project_id)
-        query = query.offset(skip).limit(per_page)
-        res = await db.execute(query)
-        for t in res.scalars().all():
-            results.append({
-                "type": "task",
-                "id": str(t.id),
-                "title": t.title,
-                "project_id": str(t.project_id),
-                "board_id": str(t.board_id),
-            })
+    requested = {t.strip() for t in (types or type or "").split(",") if t.strip()}
+    unknown = requested - set(SEARCH_TYPES)
+    if unknown:
+        raise ValidationError(f"Unknown search type: {', '.join(sorted(unknown))}")
 
+    skip = (page - 1) * per_page
+    results, total = await SearchService.search(
+        db,
+        current_user.id,
+        q,
+        types=requested or None,
+        project_id=project_id,
+        skip=skip,
+        limit=per_page,
+        include_total=include_total,
+    )
     return PaginatedResponse(
         data=results,
         pagination=PaginationMeta(
             page=page,
             per_page=per_page,
-            total=len(results),
-            total_pages=1,
+            total=total,
+            total_pages=total_pages(total, per_page),
         ),
     )
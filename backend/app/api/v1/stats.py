@@ -2,8 +2,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import check_project_access
-from app.core.database import get_db
+from app.api.deps import check_project_access, get_read_db
 from app.crud import crud_task
 from app.models.project import Project
 from app.models.task import Task
@@ -16,7 +15,7 @@ router = APIRouter(
 
 @router.get("/", response_model=ResponseBase[dict])
 async def get_stats(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     project: Project = Depends(check_project_access),
 ):
     tasks_by_status = await crud_task.count_by_status(db, project.id)
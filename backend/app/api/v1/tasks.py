@@ -1,12 +1,20 @@
+from typing import Literal
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import Actor, check_board_access, get_current_actor, get_current_user
+from app.api.deps import (
+    Actor,
+    check_board_access,
+    get_current_actor,
+    get_current_user,
+    get_read_db,
+)
 from app.core.errors import NotFoundError
 from app.core.database import get_db
-from app.crud import crud_activity_log, crud_reaction, crud_task
+from app.core.pagination import decode_cursor, next_cursor, total_pages
+from app.crud import crud_reaction, crud_task
 from app.models.board import Board
 from app.models.user import User
 from app.schemas.base import PaginatedResponse, PaginationMeta, ResponseBase
@@ -16,46 +24,69 @@ from app.schemas.task import (
     BulkTaskUpdate,
     ConvertToSubtask,
     SubtaskReorder,
+    TaskCardResponse,
     TaskCreate,
     TaskMove,
     TaskResponse,
     TaskUpdate,
 )
+from app.services import event_outbox
 from app.services.notification_service import NotificationService
 from app.services.position_service import PositionService
 from app.services.reaction_service import ReactionService
 from app.services.task_service import TaskService
-from app.services.websocket_manager import manager
+from app.services.websocket_manager import BroadcastEvent
 
 router = APIRouter(
     prefix="/projects/{project_id}/boards/{board_id}/tasks", tags=["Tasks"]
 )
 
 
-@router.get("/", response_model=PaginatedResponse[TaskResponse])
+def _ws_user(actor: Actor) -> dict:
+    """Who made a change, as shown in WebSocket events (agents by name)."""
+    user = {"id": str(actor.user.id), "username": actor.user.username}
+    if actor.is_agent:
+        user["agent"] = {"id": str(actor.agent.id), "name": actor.agent.name}
+    return user
+
+
+@router.get(
+    "/", response_model=PaginatedResponse[TaskResponse] | PaginatedResponse[TaskCardResponse]
+)
 async def list_tasks(
     status_id: UUID | None = Query(None),
     priority: str | None = Query(None),
     assignee_id: UUID | None = Query(None),
     search: str | None = Query(None),
+    view: Literal["full", "card"] = Query(
+        "full", description="card returns only the fields the Kanban card renders"
+    ),
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(None, description="next_cursor from a previous page"),
+    include_total: bool = Query(True),
+    db: AsyncSession = Depends(get_read_db),
     board: Board = Depends(check_board_access),
     current_user: User = Depends(get_current_user),
 ):
+    filters = dict(
+        status_id=status_id, priority=priority,
+        assignee_id=assignee_id, search=search,
+    )
+    if view == "card":
+        get_tasks, schema = crud_task.get_cards_by_board, TaskCardResponse
+    else:
+        get_tasks, schema = crud_task.get_multi_by_board, TaskResponse
     skip = (page - 1) * per_page
-    tasks = await crud_task.get_multi_by_board(
+    tasks = await get_tasks(
         db,
         board.id,
-        status_id=status_id,
-        priority=priority,
-        assignee_id=assignee_id,
-        search=search,
+        **filters,
         skip=skip,
         limit=per_page,
+        cursor=decode_cursor(cursor, (float, UUID)) if cursor else None,
     )
-    total = await crud_task.count(db, filters={"board_id": board.id})
+    total = await crud_task.count_by_board(db, board.id, **filters) if include_total else None
 
     task_ids = [t.id for t in tasks]
     reaction_summaries = await crud_reaction.get_summaries_batch(
@@ -63,22 +94,22 @@ async def list_tasks(
     )
     responses = []
     for t in tasks:
-        resp = TaskResponse.model_validate(t)
+        resp = schema.model_validate(t)
         resp.reactions = reaction_summaries.get(t.id)
         responses.append(resp)
 
-    return PaginatedResponse(
+    return PaginatedResponse[schema](
         data=responses,
         pagination=PaginationMeta(
             page=page,
             per_page=per_page,
             total=total,
-            total_pages=(total + per_page - 1) // per_page if total else 0,
+            total_pages=total_pages(total, per_page),
+            next_cursor=next_cursor(tasks, per_page, "position", "id"),
         ),
     )
 
 
-
 @router.post("/", response_model=ResponseBase[TaskResponse], status_code=201)
 async def create_task(
     task_in: TaskCreate,
@@ -92,16 +123,13 @@ async def create_task(
         agent_creator_id=agent_creator_id,
     )
     response = TaskResponse.model_validate(task)
-    ws_user = {"id": str(actor.user.id), "username": actor.user.username}
-    if actor.is_agent:
-        ws_user["agent"] = {"id": str(actor.agent.id), "name": actor.agent.name}
-    await manager.broadcast_to_board(str(board.project_id), str(board.id), {
-        "type": "task.created",
-        "project_id": str(board.project_id),
-        "board_id": str(board.id),
-        "data": response.model_dump(mode="json"),
-        "user": ws_user,
-    })
+    event_outbox.broadcast_to_board(db, str(board.project_id), str(board.id), BroadcastEvent(
+        type="task.created",
+        project_id=str(board.project_id),
+        board_id=str(board.id),
+        data=response,
+        user=_ws_user(actor),
+    ))
     await NotificationService.fire_webhooks(
         db, board.project_id, "task.created",
         {"task_id": str(task.id), "title": task.title, "board_id": str(board.id)},
@@ -139,16 +167,13 @@ async def update_task(
         raise NotFoundError("Task not found")
     updated = await TaskService.update_task(db, task, actor.user.id, task_in)
     response = TaskResponse.model_validate(updated)
-    ws_user = {"id": str(actor.user.id), "username": actor.user.username}
-    if actor.is_agent:
-        ws_user["agent"] = {"id": str(actor.agent.id), "name": actor.agent.name}
-    await manager.broadcast_to_board(str(board.project_id), str(board.id), {
-        "type": "task.updated",
-        "project_id": str(board.project_id),
-        "board_id": str(board.id),
-        "data": response.model_dump(mode="json"),
-        "user": ws_user,
-    })
+    event_outbox.broadcast_to_board(db, str(board.project_id), str(board.id), BroadcastEvent(
+        type="task.updated",
+        project_id=str(board.project_id),
+        board_id=str(board.id),
+        data=response,
+        user=_ws_user(actor),
+    ))
     await NotificationService.fire_webhooks(
         db, board.project_id, "task.updated",
         {"task_id": str(task_id), "title": updated.title, "board_id": str(board.id)},
@@ -172,12 +197,12 @@ async def delete_task(
 
     result = await TaskService.delete_task_with_strategy(db, task, current_user.id, mode)
 
-    await manager.broadcast_to_board(str(board.project_id), str(board.id), {
-        "type": "task.deleted",
-        "project_id": str(board.project_id),
-        "board_id": str(board.id),
-        "data": {"task_id": str(task_id), "mode": mode, "children_count": children_count},
-    })
+    event_outbox.broadcast_to_board(db, str(board.project_id), str(board.id), BroadcastEvent(
+        type="task.deleted",
+        project_id=str(board.project_id),
+        board_id=str(board.id),
+        data={"task_id": str(task_id), "mode": mode, "children_count": children_count},
+    ))
     await NotificationService.fire_webhooks(
         db, board.project_id, "task.deleted",
         {"task_id": str(task_id), "mode": mode},
@@ -199,16 +224,13 @@ async def move_task(
         db, task, actor.user.id, body.status_id, body.position
     )
     response = TaskResponse.model_validate(moved)
-    ws_user = {"id": str(actor.user.id), "username": actor.user.username}
-    if actor.is_agent:
-        ws_user["agent"] = {"id": str(actor.agent.id), "name": actor.agent.name}
-    await manager.broadcast_to_board(str(board.project_id), str(board.id), {
-        "type": "task.moved",
-        "project_id": str(board.project_id),
-        "board_id": str(board.id),
-        "data": response.model_dump(mode="json"),
-        "user": ws_user,
-    })
+    event_outbox.broadcast_to_board(db, str(board.project_id), str(board.id), BroadcastEvent(
+        type="task.moved",
+        project_id=str(board.project_id),
+        board_id=str(board.id),
+        data=response,
+        user=_ws_user(actor),
+    ))
     await NotificationService.fire_webhooks(
         db, board.project_id, "task.moved",
         {"task_id": str(task_id), "title": moved.title, "status_id": str(body.status_id)},
@@ -221,52 +243,24 @@ async def bulk_update_tasks(
     body: BulkTaskUpdate,
     db: AsyncSession = Depends(get_db),
     board: Board = Depends(check_board_access),
-    current_user: User = Depends(get_current_user),
+    actor: Actor = Depends(get_current_actor),
 ):
     tasks = await TaskService.bulk_update(
-        db, board.project_id, current_user.id, body.task_ids, body.updates
+        db, board.project_id, actor.user.id, body.task_ids, body.updates
     )
     responses = [TaskResponse.model_validate(t) for t in tasks]
-    notified_users: set[str] = set()
-    for r in responses:
-        await manager.broadcast_to_board(str(board.project_id), str(board.id), {
-            "type": "task.updated",
-            "project_id": str(board.project_id),
-            "board_id": str(board.id),
-            "data": r.model_dump(mode="json"),
-            "user": {"id": str(current_user.id), "username": current_user.username},
-        })
-        updater_name = current_user.full_name or current_user.username
-        for a in r.assignees:
-            if a.user and a.user.id != current_user.id:
-                uid = str(a.user.id)
-                notif = await NotificationService.create_notification(
-                    db,
-                    user_id=a.user.id,
-                    actor_id=current_user.id,
-                    project_id=board.project_id,
-                    type="task_updated",
-                    title="Task Updated",
-                    message=f'{updater_name} updated "{r.title}"',
-                    data={"task_id": str(r.id), "board_id": str(board.id)},
-                )
-                if notif:
-                    notified_users.add(uid)
-        for w in r.watchers:
-            if w.user and str(w.user.id) not in notified_users and w.user.id != current_user.id:
-                uid = str(w.user.id)
-                notif = await NotificationService.create_notification(
-                    db,
-                    user_id=w.user.id,
-                    actor_id=current_user.id,
-                    project_id=board.project_id,
-                    type="task_updated",
-                    title="Watching: Task Updated",
-                    message=f'{updater_name} updated "{r.title}"',
-                    data={"task_id": str(r.id), "board_id": str(board.id)},
-                )
-                if notif:
-                    notified_users.add(uid)
+    if responses:
+        event_outbox.broadcast_to_board(db, str(board.project_id), str(board.id), BroadcastEvent(
+            type="task.bulk_updated",
+            project_id=str(board.project_id),
+            board_id=str(board.id),
+            data=responses,
+            user=_ws_user(actor),
+        ))
+        await NotificationService.fire_webhooks(
+            db, board.project_id, "task.bulk_updated",
+            {"task_ids": [str(t.id) for t in tasks], "board_id": str(board.id)},
+        )
     return ResponseBase(data=responses)
 
 
@@ -275,52 +269,28 @@ async def bulk_move_tasks(
     body: BulkTaskMove,
     db: AsyncSession = Depends(get_db),
     board: Board = Depends(check_board_access),
-    current_user: User = Depends(get_current_user),
+    actor: Actor = Depends(get_current_actor),
 ):
     tasks = await TaskService.bulk_move(
-        db, board.project_id, current_user.id, body.task_ids, body.status_id
+        db, board.project_id, actor.user.id, body.task_ids, body.status_id
     )
     responses = [TaskResponse.model_validate(t) for t in tasks]
-    notified_users: set[str] = set()
-    for r in responses:
-        await manager.broadcast_to_board(str(board.project_id), str(board.id), {
-            "type": "task.moved",
-            "project_id": str(board.project_id),
-            "board_id": str(board.id),
-            "data": r.model_dump(mode="json"),
-            "user": {"id": str(current_user.id), "username": current_user.username},
-        })
-        mover_name = current_user.full_name or current_user.username
-        for a in r.assignees:
-            if a.user and a.user.id != current_user.id:
-                uid = str(a.user.id)
-                notif = await NotificationService.create_notification(
-                    db,
-                    user_id=a.user.id,
-                    actor_id=current_user.id,
-                    project_id=board.project_id,
-                    type="task_moved",
-                    title="Task Moved",
-                    message=f'{mover_name} moved "{r.title}"',
-                    data={"task_id": str(r.id), "board_id": str(board.id)},
-                )
-                if notif:
-                    notified_users.add(uid)
-        for w in r.watchers:
-            if w.user and str(w.user.id) not in notified_users and w.user.id != current_user.id:
-                uid = str(w.user.id)
-                notif = await NotificationService.create_notification(
-                    db,
-                    user_id=w.user.id,
-                    actor_id=current_user.id,
-                    project_id=board.project_id,
-                    type="task_moved",
-                    title="Watching: Task Moved",
-                    message=f'{mover_name} moved "{r.title}"',
-                    data={"task_id": str(r.id), "board_id": str(board.id)},
-                )
-                if notif:
-                    notified_users.add(uid)
+    if responses:
+        event_outbox.broadcast_to_board(db, str(board.project_id), str(board.id), BroadcastEvent(
+            type="task.bulk_moved",
+            project_id=str(board.project_id),
+            board_id=str(board.id),
+            data=responses,
+            user=_ws_user(actor),
+        ))
+        await NotificationService.fire_webhooks(
+            db, board.project_id, "task.bulk_moved",
+            {
+                "task_ids": [str(t.id) for t in tasks],
+                "board_id": str(board.id),
+                "status_id": str(body.status_id),
+            },
+        )
     return ResponseBase(data=responses)
 
 
@@ -329,66 +299,23 @@ async def bulk_delete_tasks(
     body: BulkTaskDelete,
     db: AsyncSession = Depends(get_db),
     board: Board = Depends(check_board_access),
-    current_user: User = Depends(get_current_user),
+    actor: Actor = Depends(get_current_actor),
 ):
-    notified_users: set[str] = set()
-    for task_id in body.task_ids:
-        task = await crud_task.get_with_relations(db, task_id)
-        if task and task.board_id == board.id:
-            task_title = task.title
-            assignee_user_ids = [a.user_id for a in task.assignees if a.user_id]
-            watcher_user_ids = [w.user_id for w in task.watchers if w.user_id]
-            await crud_activity_log.log(
-                db,
-                project_id=board.project_id,
-                user_id=current_user.id,
-                action="deleted",
-                entity_type="task",
-                task_id=None,
-                changes={"title": task_title},
-            )
-            await crud_task.remove(db, id=task_id)
-            await manager.broadcast_to_board(str(board.project_id), str(board.id), {
-                "type": "task.deleted",
-                "project_id": str(board.project_id),
-                "board_id": str(board.id),
-                "data": {"task_id": str(task_id)},
-            })
-            deleter_name = current_user.full_name or current_user.username
-            for uid in assignee_user_ids:
-                if uid == current_user.id:
-                    continue
-                uid_str = str(uid)
-                notif = await NotificationService.create_notification(
-                    db,
-                    user_id=uid,
-                    actor_id=current_user.id,
-                    project_id=board.project_id,
-                    type="task_deleted",
-                    title="Task Deleted",
-                    message=f'{deleter_name} deleted "{task_title}"',
-                    data={"task_id": str(task_id)},
-                )
-                if notif:
-                    notified_users.add(uid_str)
-            for wuid in watcher_user_ids:
-                if wuid == current_user.id:
-                    continue
-                wuid_str = str(wuid)
-                if wuid_str in notified_users:
-                    continue
-                notif = await NotificationService.create_notification(
-                    db,
-                    user_id=wuid,
-                    actor_id=current_user.id,
-                    project_id=board.project_id,
-                    type="task_deleted",
-                    title="Watching: Task Deleted",
-                    message=f'{deleter_name} deleted "{task_title}"',
-                    data={"task_id": str(task_id)},
-                )
-                if notif:
-                    notified_users.add(wuid_str)
+    deleted_ids = await TaskService.bulk_delete(
+        db, board.id, actor.user.id, body.task_ids
+    )
+    if deleted_ids:
+        event_outbox.broadcast_to_board(db, str(board.project_id), str(board.id), BroadcastEvent(
+            type="task.bulk_deleted",
+            project_id=str(board.project_id),
+            board_id=str(board.id),
+            data={"task_ids": [str(tid) for tid in deleted_ids]},
+            user=_ws_user(actor),
+        ))
+        await NotificationService.fire_webhooks(
+            db, board.project_id, "task.bulk_deleted",
+            {"task_ids": [str(tid) for tid in deleted_ids], "board_id": str(board.id)},
+        )
 
 
 # ── Subtask endpoints ──────────────────────────────────────────────
@@ -437,16 +364,13 @@ async def create_subtask(
         agent_creator_id=agent_creator_id,
     )
     response = TaskResponse.model_validate(task)
-    ws_user = {"id": str(actor.user.id), "username": actor.user.username}
-    if actor.is_agent:
-        ws_user["agent"] = {"id": str(actor.agent.id), "name": actor.agent.name}
-    await manager.broadcast_to_board(str(board.project_id), str(board.id), {
-        "type": "subtask.created",
-        "project_id": str(board.project_id),
-        "board_id": str(board.id),
-        "data": {**response.model_dump(mode="json"), "parent_id": str(task_id)},
-        "user": ws_user,
-    })
+    event_outbox.broadcast_to_board(db, str(board.project_id), str(board.id), BroadcastEvent(
+        type="subtask.created",
+        project_id=str(board.project_id),
+        board_id=str(board.id),
+        data={**response.model_dump(mode="json"), "parent_id": str(task_id)},
+        user=_ws_user(actor),
+    ))
     return ResponseBase(data=response)
 
 
@@ -473,12 +397,12 @@ async def reorder_subtask(
 
     refreshed = await crud_task.get_with_relations(db, body.subtask_id)
     response = TaskResponse.model_validate(refreshed)
-    await manager.broadcast_to_board(str(board.project_id), str(board.id), {
-        "type": "subtask.reordered",
-        "project_id": str(board.project_id),
-        "board_id": str(board.id),
-        "data": {"parent_id": str(task_id), "subtask_id": str(body.subtask_id)},
-    })
+    event_outbox.broadcast_to_board(db, str(board.project_id), str(board.id), BroadcastEvent(
+        type="subtask.reordered",
+        project_id=str(board.project_id),
+        board_id=str(board.id),
+        data={"parent_id": str(task_id), "subtask_id": str(body.subtask_id)},
+    ))
     return ResponseBase(data=response)
 
 
@@ -503,12 +427,12 @@ async def convert_to_subtask(
         db, child_task, task_id, current_user.id
     )
     response = TaskResponse.model_validate(updated)
-    await manager.broadcast_to_board(str(board.project_id), str(board.id), {
-        "type": "subtask.created",
-        "project_id": str(board.project_id),
-        "board_id": str(board.id),
-        "data": {**response.model_dump(mode="json"), "parent_id": str(task_id)},
-    })
+    event_outbox.broadcast_to_board(db, str(board.project_id), str(board.id), BroadcastEvent(
+        type="subtask.created",
+        project_id=str(board.project_id),
+        board_id=str(board.id),
+        data={**response.model_dump(mode="json"), "parent_id": str(task_id)},
+    ))
     return ResponseBase(data=response)
 
 
@@ -527,17 +451,17 @@ async def promote_subtask(
     old_parent_id = task.parent_id
     promoted = await TaskService.promote_to_task(db, task, current_user.id)
     response = TaskResponse.model_validate(promoted)
-    await manager.broadcast_to_board(str(board.project_id), str(board.id), {
-        "type": "task.created",
-        "project_id": str(board.project_id),
-        "board_id": str(board.id),
-        "data": response.model_dump(mode="json"),
-    })
+    event_outbox.broadcast_to_board(db, str(board.project_id), str(board.id), BroadcastEvent(
+        type="task.created",
+        project_id=str(board.project_id),
+        board_id=str(board.id),
+        data=response,
+    ))
     if old_parent_id:
-        await manager.broadcast_to_board(str(board.project_id), str(board.id), {
-            "type": "subtask.deleted",
-            "project_id": str(board.project_id),
-            "board_id": str(board.id),
-            "data": {"parent_id": str(old_parent_id), "subtask_id": str(task_id)},
-        })
+        event_outbox.broadcast_to_board(db, str(board.project_id), str(board.id), BroadcastEvent(
+            type="subtask.deleted",
+            project_id=str(board.project_id),
+            board_id=str(board.id),
+            data={"parent_id": str(old_parent_id), "subtask_id": str(task_id)},
+        ))
     return ResponseBase(data=response)
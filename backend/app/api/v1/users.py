@@ -3,13 +3,14 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, invalidate_user
 from app.core.database import get_db
 from app.crud import crud_user
 from app.models.user import User
 from app.schemas.base import ResponseBase
 from app.core.security import hash_password, verify_password
 from app.schemas.user import PasswordChange, UserResponse, UserUpdate
+from app.services.autocomplete_service import AutocompleteService
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -26,6 +27,8 @@ async def update_me(
     current_user: User = Depends(get_current_user),
 ):
     user = await crud_user.update(db, db_obj=current_user, obj_in=user_in)
+    invalidate_user(db, current_user.id)
+    AutocompleteService.invalidate(db)
     return ResponseBase(data=UserResponse.model_validate(user))
 
 
@@ -43,6 +46,7 @@ async def change_password(
     current_user.password_hash = hash_password(body.new_password)
     db.add(current_user)
     await db.flush()
+    invalidate_user(db, current_user.id)
     return ResponseBase(data={"message": "Password changed"})
 
 
@@ -1,18 +1,25 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
 from app.core.database import get_db
 from app.core.errors import NotFoundError, PermissionError_
-from app.crud import crud_project, crud_webhook
+from app.core.pagination import total_pages
+from app.crud import crud_project, crud_webhook, crud_webhook_delivery
 from app.models.user import User
-from app.schemas.base import ResponseBase
-from app.schemas.webhook import WebhookCreate, WebhookResponse, WebhookUpdate
+from app.schemas.base import PaginatedResponse, PaginationMeta, ResponseBase
+from app.schemas.webhook import (
+    WebhookCreate,
+    WebhookDeliveryResponse,
+    WebhookResponse,
+    WebhookUpdate,
+)
 
 VALID_EVENTS = {
     "task.created", "task.updated", "task.moved", "task.deleted",
+    "task.bulk_updated", "task.bulk_moved", "task.bulk_deleted",
     "comment.created", "comment.deleted",
     "subtask.created", "subtask.deleted",
     "reaction.added",
@@ -26,7 +33,7 @@ router = APIRouter(
 async def _check_project_owner(
     project_id: UUID, current_user: User, db: AsyncSession
 ) -> None:
-    project = await crud_project.get(db, project_id)
+    project = await crud_project.get_for_access(db, project_id)
     if not project:
         raise NotFoundError("Project not found")
     if project.owner_id != current_user.id:
@@ -58,9 +65,13 @@ async def create_webhook(
         url=str(body.url),
         events=body.events,
         secret=body.secret,
+        batch_window_seconds=body.batch_window_seconds,
+        batch_max_size=body.batch_max_size,
+        compress=body.compress,
     )
     db.add(webhook)
     await db.commit()
+    crud_webhook.invalidate_subscriptions(project_id)
     await db.refresh(webhook)
     return ResponseBase(data=WebhookResponse.model_validate(webhook))
 
@@ -84,6 +95,7 @@ async def update_webhook(
         setattr(webhook, field, value)
     db.add(webhook)
     await db.commit()
+    crud_webhook.invalidate_subscriptions(project_id)
     await db.refresh(webhook)
     return ResponseBase(data=WebhookResponse.model_validate(webhook))
 
@@ -100,3 +112,38 @@ async def delete_webhook(
     if not webhook or webhook.project_id != project_id:
         raise NotFoundError("Webhook not found")
     await crud_webhook.remove(db, id=webhook_id)
+    await db.commit()
+    crud_webhook.invalidate_subscriptions(project_id)
+
+
+@router.get(
+    "/{webhook_id}/deliveries",
+    response_model=PaginatedResponse[WebhookDeliveryResponse],
+)
+async def list_deliveries(
+    project_id: UUID,
+    webhook_id: UUID,
+    status: str | None = Query(None, pattern="^(pending|delivered|failed)$"),
+    page: int = Query(1, ge=1),
+    per_page: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Delivery log for a webhook, newest first."""
+    await _check_project_owner(project_id, current_user, db)
+    webhook = await crud_webhook.get(db, webhook_id)
+    if not webhook or webhook.project_id != project_id:
+        raise NotFoundError("Webhook not found")
+    deliveries = await crud_webhook_delivery.get_multi_by_webhook(
+        db, webhook_id, status=status, skip=(page - 1) * per_page, limit=per_page
+    )
+    total = await crud_webhook_delivery.count_by_webhook(db, webhook_id, status=status)
+    return PaginatedResponse(
+        data=[WebhookDeliveryResponse.model_validate(d) for d in deliveries],
+        pagination=PaginationMeta(
+            page=page,
+            per_page=per_page,
+            total=total,
+            total_pages=total_pages(total, per_page),
+        ),
+    )
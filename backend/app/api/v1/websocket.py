@@ -40,8 +40,10 @@ async def websocket_endpoint(
                 msg_type = raw
 
             if msg_type == "ping":
-                await websocket.send_text(json.dumps({"type": "pong"}))
+                manager.send_personal(websocket, {"type": "pong"})
     except WebSocketDisconnect:
+        pass
+    finally:
         manager.disconnect(board_key, websocket)
         if user_key:
             manager.disconnect(user_key, websocket)
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import field_validator
 from pydantic_settings import BaseSettings
 
@@ -19,6 +21,66 @@ class Settings(BaseSettings):
     UPLOAD_DIR: str = "uploads"
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
 
+    # Optional read replica for list/get endpoints. Actors who wrote within
+    # READ_YOUR_WRITES_SECONDS keep reading from the primary.
+    DATABASE_READ_URL: str | None = None
+    READ_YOUR_WRITES_SECONDS: float = 5.0
+
+    # Connection pool (non-SQLite). Limits are per worker process, so the
+    # database sees up to workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # Serve pool usage at the unauthenticated /health/db (keep it off the public internet)
+    DB_POOL_STATS: bool = False
+    # asyncpg prepared statement cache per connection (0 behind PgBouncer transaction pooling)
+    DB_STATEMENT_CACHE_SIZE: int = 100
+
+    # SQLite tuning (file databases only). Reads use a pool of SQLITE_POOL_SIZE
+    # connections; writes share one dedicated connection.
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_CACHE_SIZE_KB: int = 64 * 1024
+    SQLITE_POOL_SIZE: int = 5
+
+    # WebSocket fan-out: "memory" (single worker) or "redis" (multi-worker)
+    WS_BROKER: Literal["memory", "redis"] = "memory"
+    WS_BROKER_CHANNEL: str = "agentboard:ws"
+    # Per-socket outbound queue; policy when full: drop_oldest | coalesce | disconnect
+    WS_SEND_QUEUE_SIZE: int = 256
+    WS_SLOW_CLIENT_POLICY: Literal["drop_oldest", "coalesce", "disconnect"] = "drop_oldest"
+    WS_SEND_TIMEOUT: float = 10.0
+
+    # Seconds a granted project/board access check is reused (0 disables)
+    ACCESS_CACHE_TTL: float = 30.0
+    ACCESS_CACHE_SIZE: int = 10_000
+    # Seconds a resolved JWT/API-key actor is reused (0 disables)
+    ACTOR_CACHE_TTL: float = 60.0
+    ACTOR_CACHE_SIZE: int = 10_000
+    # API key last_used_at is buffered in memory and written every N seconds
+    API_KEY_USAGE_FLUSH_INTERVAL: float = 30.0
+
+    # Seconds a project's in-memory @mention index is reused (non-PostgreSQL)
+    AUTOCOMPLETE_CACHE_TTL: float = 300.0
+
+    # Webhook delivery queue: concurrent deliveries overall and per endpoint URL
+    WEBHOOK_WORKERS: int = 8
+    WEBHOOK_MAX_PER_ENDPOINT: int = 2
+    WEBHOOK_TIMEOUT: float = 10.0
+    # Retries back off exponentially from BASE seconds up to MAX seconds
+    WEBHOOK_MAX_ATTEMPTS: int = 8
+    WEBHOOK_RETRY_BASE: float = 10.0
+    WEBHOOK_RETRY_MAX: float = 3600.0
+    WEBHOOK_POLL_INTERVAL: float = 5.0
+    # Delivered/failed delivery logs are kept this many days
+    WEBHOOK_DELIVERY_RETENTION_DAYS: int = 7
+    # Seconds a project's event -> webhooks index is reused (0 disables)
+    WEBHOOK_INDEX_TTL: float = 30.0
+
     RESEND_API_KEY: str | None = None
     EMAIL_FROM: str = "AgentBoard <onboarding@resend.dev>"
 
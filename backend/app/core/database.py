@@ -1,16 +1,22 @@
+import time
 from collections.abc import AsyncGenerator
 from datetime import UTC, datetime
 
-from sqlalchemy import DateTime
+from sqlalchemy import DateTime, event
+from sqlalchemy import exc as sa_exc
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.elements import TextClause
 from sqlalchemy.types import TypeDecorator
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 
 
@@ -34,26 +40,175 @@ class TZDateTime(TypeDecorator):
         return value
 
 
-def _build_engine():
-    url = settings.DATABASE_URL
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except sa_exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(self.wait_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+            "max_wait_ms": round(self.wait_max * 1000, 3),
+        }
+
+
+def _is_sqlite_file(url: str) -> bool:
+    return url.startswith("sqlite") and ":memory:" not in url and "mode=memory" not in url
+
+
+def _apply_sqlite_pragmas(dbapi_connection, _record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute(f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}")
+    # Negative cache_size is in KiB rather than pages
+    cursor.execute(f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KB}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def _sqlite_autobegin(dbapi_connection, _record) -> None:
+    # pysqlite only opens transactions lazily before DML, which breaks
+    # SAVEPOINTs; take over and emit BEGIN ourselves (see _sqlite_begin)
+    dbapi_connection.isolation_level = None
+
+
+def _sqlite_begin(conn) -> None:
+    conn.exec_driver_sql("BEGIN")
+
+
+def _build_engine(url: str | None = None, *, pool_size: int | None = None) -> AsyncEngine:
+    url = url or settings.DATABASE_URL
     kwargs: dict = {}
 
     if url.startswith("sqlite"):
         kwargs["connect_args"] = {"check_same_thread": False}
-        kwargs["poolclass"] = StaticPool
+        if _is_sqlite_file(url):
+            kwargs["poolclass"] = InstrumentedPool
+            kwargs["pool_size"] = pool_size or settings.SQLITE_POOL_SIZE
+            kwargs["max_overflow"] = 0
+        else:
+            # In-memory databases exist per connection, so share exactly one
+            kwargs["poolclass"] = StaticPool
+    else:
+        kwargs["poolclass"] = InstrumentedPool
+        kwargs["pool_size"] = pool_size or settings.DB_POOL_SIZE
+        kwargs["max_overflow"] = settings.DB_MAX_OVERFLOW
+        kwargs["pool_timeout"] = settings.DB_POOL_TIMEOUT
+        kwargs["pool_recycle"] = settings.DB_POOL_RECYCLE
+        kwargs["pool_pre_ping"] = settings.DB_POOL_PRE_PING
+        if "+asyncpg" in url:
+            kwargs["connect_args"] = {
+                "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            }
+
+    created = create_async_engine(url, echo=False, **kwargs)
+    if _is_sqlite_file(url):
+        event.listen(created.sync_engine, "connect", _apply_sqlite_pragmas)
+    if url.startswith("sqlite"):
+        event.listen(created.sync_engine, "connect", _sqlite_autobegin)
+        event.listen(created.sync_engine, "begin", _sqlite_begin)
+    return created
 
-    return create_async_engine(url, echo=False, **kwargs)
 
+engine = _build_engine(
+    # SQLite has a single writer: give writes one dedicated connection so
+    # concurrent writers queue on the pool instead of failing with SQLITE_BUSY
+    pool_size=1 if _is_sqlite_file(settings.DATABASE_URL) else None,
+)
+
+# Pooled read connections; WAL lets them run alongside the writer
+read_engine = _build_engine() if _is_sqlite_file(settings.DATABASE_URL) else engine
+
+# Optional streaming replica for read-only endpoints (see api.deps.get_read_db)
+replica_engine = (
+    _build_engine(settings.DATABASE_READ_URL) if settings.DATABASE_READ_URL else None
+)
+
+# Actors who committed a write recently; their reads stay on the primary
+# until the replica has had time to catch up
+recent_writers = TTLCache(settings.READ_YOUR_WRITES_SECONDS)
+
+
+def _is_write(clause) -> bool:
+    if isinstance(clause, UpdateBase):
+        return True
+    # Raw SQL is only trusted as a read when it is a plain SELECT
+    return isinstance(clause, TextClause) and clause.text.lstrip()[:6].upper() != "SELECT"
+
+
+class RoutingSession(Session):
+    """Routes reads to ``read_engine`` until the session first writes.
+
+    From the first flush, DML statement or non-SELECT ``text()`` on, the
+    session is pinned to the primary ``engine`` so it reads its own
+    uncommitted changes.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self.info.get("wrote") or self._flushing or _is_write(clause):
+            self.info["wrote"] = True
+            return engine.sync_engine
+        return read_engine.sync_engine
+
+
+def pool_stats() -> dict:
+    """Connection pool usage per engine (for the /health/db endpoint)."""
+    engines = {"primary": engine}
+    if read_engine is not engine:
+        engines["read"] = read_engine
+    if replica_engine is not None:
+        engines["replica"] = replica_engine
+    return {
+        name: e.pool.stats() if isinstance(e.pool, InstrumentedPool) else {"pool": e.pool.status()}
+        for name, e in engines.items()
+    }
 
-engine = _build_engine()
 
 async_session = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
+    **({"sync_session_class": RoutingSession} if read_engine is not engine else {}),
+)
+
+replica_session = (
+    async_sessionmaker(replica_engine, class_=AsyncSession, expire_on_commit=False)
+    if replica_engine is not None
+    else None
 )
 
 
+@event.listens_for(Session, "after_flush")
+def _mark_wrote(session: Session, _flush_context) -> None:
+    session.info["wrote"] = True
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -63,11 +218,18 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         try:
             yield session
             await session.commit()
+            # get_current_actor tags the session with the actor it resolved
+            actor_key = session.info.get("actor_key")
+            if actor_key and session.info.get("wrote"):
+                recent_writers.set(actor_key, True)
         except Exception:
             await session.rollback()
             raise
 
 
 async def init_db() -> None:
+    from app.core.search import ensure_search_schema
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(ensure_search_schema)
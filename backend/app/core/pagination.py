@@ -0,0 +1,59 @@
+"""Opaque keyset (cursor) pagination helpers.
+
+A cursor encodes the sort key of the last row on a page, e.g.
+``(created_at, id)`` or ``(position, id)``. The next page is everything
+strictly after that key in sort order, which stays an index range scan no
+matter how deep the client pages.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import tuple_
+
+from app.core.errors import ValidationError
+
+
+def encode_cursor(*values: Any) -> str:
+    raw = json.dumps([
+        v.isoformat() if isinstance(v, datetime) else str(v) if isinstance(v, UUID) else v
+        for v in values
+    ])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: tuple[type, ...]) -> tuple:
+    """Decode a cursor into values of ``types`` (datetime, UUID, float, ...)."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if len(raw) != len(types):
+            raise ValueError("cursor arity mismatch")
+        return tuple(
+            datetime.fromisoformat(v) if t is datetime else t(v)
+            for t, v in zip(types, raw)
+        )
+    except (ValueError, TypeError, json.JSONDecodeError):
+        raise ValidationError("Invalid pagination cursor")
+
+
+def after_cursor(columns: tuple, values: tuple, *, descending: bool = False):
+    """WHERE clause selecting rows that sort strictly after ``values``."""
+    key = tuple_(*columns)
+    return key < values if descending else key > values
+
+
+def total_pages(total: int | None, per_page: int) -> int | None:
+    if total is None:
+        return None
+    return (total + per_page - 1) // per_page if total else 0
+
+
+def next_cursor(items: list, limit: int, *attrs: str) -> str | None:
+    """Cursor for the page after ``items``, or None when this was the last page."""
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(*(getattr(last, a) for a in attrs))
@@ -0,0 +1,270 @@
+"""Full-text search over tasks and comments.
+
+PostgreSQL uses stored ``tsvector`` columns with GIN indexes; SQLite uses
+external-content FTS5 tables kept in sync by triggers. Any other backend
+falls back to ``ILIKE``. Callers only deal with the ``*_hits`` subqueries,
+which expose an id, a ``rank`` (higher is better) and a ``snippet``
+regardless of backend; pass snippets through ``highlight`` before display.
+"""
+import html
+import re
+
+from sqlalchemy import Connection, column, false, func, literal, literal_column, or_, select, table
+
+from app.core.database import engine
+from app.models.comment import Comment
+from app.models.task import Task
+
+TS_CONFIG = "english"
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+# Emitted by snippet()/ts_headline and swapped for the tags by highlight()
+MARK_START = "\x02"
+MARK_END = "\x03"
+
+_tasks_fts = table("tasks_fts", column("task_id"))
+_comments_fts = table("comments_fts", column("comment_id"))
+
+SEARCH_SCHEMA: dict[str, list[str]] = {
+    "postgresql": [
+        f"""ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('{TS_CONFIG}', coalesce(title, '')), 'A')
+                || setweight(to_tsvector('{TS_CONFIG}', coalesce(description_text, '')), 'B')
+            ) STORED""",
+        "CREATE INDEX IF NOT EXISTS ix_tasks_search_vector ON tasks USING GIN (search_vector)",
+        f"""ALTER TABLE comments ADD COLUMN IF NOT EXISTS search_vector tsvector
+            GENERATED ALWAYS AS (to_tsvector('{TS_CONFIG}', coalesce(content_text, ''))) STORED""",
+        "CREATE INDEX IF NOT EXISTS ix_comments_search_vector ON comments USING GIN (search_vector)",
+    ],
+    "sqlite": [
+        # Rows are keyed by the UUID primary key: implicit rowids of tables
+        # without an INTEGER PRIMARY KEY may change on VACUUM
+        """CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+            task_id UNINDEXED, title, description_text, tokenize='porter unicode61')""",
+        """CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+            INSERT INTO tasks_fts(task_id, title, description_text)
+            VALUES (new.id, new.title, new.description_text);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+            DELETE FROM tasks_fts WHERE task_id = old.id;
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description_text ON tasks BEGIN
+            UPDATE tasks_fts SET title = new.title, description_text = new.description_text
+            WHERE task_id = old.id;
+        END""",
+        """CREATE VIRTUAL TABLE IF NOT EXISTS comments_fts USING fts5(
+            comment_id UNINDEXED, content_text, tokenize='porter unicode61')""",
+        """CREATE TRIGGER IF NOT EXISTS comments_fts_ai AFTER INSERT ON comments BEGIN
+            INSERT INTO comments_fts(comment_id, content_text) VALUES (new.id, new.content_text);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS comments_fts_ad AFTER DELETE ON comments BEGIN
+            DELETE FROM comments_fts WHERE comment_id = old.id;
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS comments_fts_au AFTER UPDATE OF content_text ON comments BEGIN
+            UPDATE comments_fts SET content_text = new.content_text WHERE comment_id = old.id;
+        END""",
+    ],
+}
+
+
+SQLITE_FTS_TRIGGERS = (
+    "tasks_fts_ai", "tasks_fts_ad", "tasks_fts_au",
+    "comments_fts_ai", "comments_fts_ad", "comments_fts_au",
+)
+
+
+def ensure_search_schema(connection: Connection) -> None:
+    """Create the search columns/tables if missing.
+
+    This is the only definition of the search schema: ``init_db`` runs it at
+    startup and the Alembic migrations call it as well.
+    """
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        tables = dict(
+            connection.exec_driver_sql(
+                "SELECT name, sql FROM sqlite_master WHERE name IN ('tasks_fts', 'comments_fts')"
+            ).all()
+        )
+        if tables and "task_id" not in tables.get("tasks_fts", ""):
+            # Earlier layout keyed on rowid; rebuild it
+            for trigger in SQLITE_FTS_TRIGGERS:
+                connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger}")
+            connection.exec_driver_sql("DROP TABLE IF EXISTS tasks_fts")
+            connection.exec_driver_sql("DROP TABLE IF EXISTS comments_fts")
+            tables = {}
+        for statement in SEARCH_SCHEMA["sqlite"]:
+            connection.exec_driver_sql(statement)
+        if "tasks_fts" not in tables:
+            # Index rows written before the FTS tables existed
+            connection.exec_driver_sql(
+                "INSERT INTO tasks_fts(task_id, title, description_text) "
+                "SELECT id, title, description_text FROM tasks"
+            )
+        if "comments_fts" not in tables:
+            connection.exec_driver_sql(
+                "INSERT INTO comments_fts(comment_id, content_text) "
+                "SELECT id, content_text FROM comments"
+            )
+    else:
+        for statement in SEARCH_SCHEMA.get(dialect, []):
+            connection.exec_driver_sql(statement)
+
+
+def drop_search_schema(connection: Connection) -> None:
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        for trigger in SQLITE_FTS_TRIGGERS:
+            connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger}")
+        connection.exec_driver_sql("DROP TABLE IF EXISTS comments_fts")
+        connection.exec_driver_sql("DROP TABLE IF EXISTS tasks_fts")
+    elif dialect == "postgresql":
+        connection.exec_driver_sql("DROP INDEX IF EXISTS ix_comments_search_vector")
+        connection.exec_driver_sql("ALTER TABLE comments DROP COLUMN IF EXISTS search_vector")
+        connection.exec_driver_sql("DROP INDEX IF EXISTS ix_tasks_search_vector")
+        connection.exec_driver_sql("ALTER TABLE tasks DROP COLUMN IF EXISTS search_vector")
+
+
+def highlight(snippet: str | None) -> str | None:
+    """HTML-escape a ``*_hits`` snippet and turn its match markers into ``<mark>``.
+
+    Snippets are cut from user content, so the markers are control
+    characters that can't be confused with (or injected as) markup.
+    """
+    if snippet is None:
+        return None
+    return (
+        html.escape(snippet)
+        .replace(MARK_START, HIGHLIGHT_START)
+        .replace(MARK_END, HIGHLIGHT_END)
+    )
+
+
+def like_escape(q: str) -> str:
+    return q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_tokens(q: str) -> list[str]:
+    """Words in ``q``; user input never reaches the FTS query parser verbatim."""
+    return re.findall(r"\w+", q.lower())
+
+
+def _fts5_query(tokens: list[str]) -> str:
+    # Every word must match; the last one as a prefix so partial words hit
+    quoted = [f'"{t}"' for t in tokens]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def _tsquery(tokens: list[str]):
+    return func.to_tsquery(TS_CONFIG, " & ".join(f"{t}:*" for t in tokens))
+
+
+def _highlight_options() -> str:
+    return f"StartSel={MARK_START}, StopSel={MARK_END}, MaxWords=24, MinWords=8"
+
+
+def task_hits(q: str, *, with_snippet: bool = True):
+    """Subquery of tasks matching ``q``: ``task_id``, ``rank``, ``snippet``."""
+    tokens = search_tokens(q)
+    dialect = engine.dialect.name
+
+    if tokens and dialect == "sqlite":
+        fts = literal_column("tasks_fts")
+        return (
+            select(
+                Task.id.label("task_id"),
+                (-func.bm25(fts, 0.0, 10.0, 1.0)).label("rank"),
+                (
+                    func.snippet(fts, -1, MARK_START, MARK_END, "…", 16)
+                    if with_snippet else literal(None)
+                ).label("snippet"),
+            )
+            .select_from(_tasks_fts)
+            .join(Task, Task.id == _tasks_fts.c.task_id)
+            .where(fts.op("MATCH")(_fts5_query(tokens)))
+            .subquery("task_hits")
+        )
+
+    if tokens and dialect == "postgresql":
+        vector = literal_column("tasks.search_vector")
+        ts_query = _tsquery(tokens)
+        return (
+            select(
+                Task.id.label("task_id"),
+                func.ts_rank_cd(vector, ts_query).label("rank"),
+                (
+                    func.ts_headline(
+                        TS_CONFIG,
+                        func.concat_ws(" — ", Task.title, Task.description_text),
+                        ts_query,
+                        _highlight_options(),
+                    )
+                    if with_snippet else literal(None)
+                ).label("snippet"),
+            )
+            .where(vector.op("@@")(ts_query))
+            .subquery("task_hits")
+        )
+
+    pattern = f"%{like_escape(q)}%"
+    return (
+        select(Task.id.label("task_id"), literal(0.0).label("rank"), literal(None).label("snippet"))
+        .where(
+            or_(
+                Task.title.ilike(pattern, escape="\\"),
+                Task.description_text.ilike(pattern, escape="\\"),
+            )
+            if q.strip() else false()
+        )
+        .subquery("task_hits")
+    )
+
+
+def comment_hits(q: str, *, with_snippet: bool = True):
+    """Subquery of comments matching ``q``: ``comment_id``, ``rank``, ``snippet``."""
+    tokens = search_tokens(q)
+    dialect = engine.dialect.name
+
+    if tokens and dialect == "sqlite":
+        fts = literal_column("comments_fts")
+        return (
+            select(
+                Comment.id.label("comment_id"),
+                (-func.bm25(fts)).label("rank"),
+                (
+                    func.snippet(fts, 1, MARK_START, MARK_END, "…", 16)
+                    if with_snippet else literal(None)
+                ).label("snippet"),
+            )
+            .select_from(_comments_fts)
+            .join(Comment, Comment.id == _comments_fts.c.comment_id)
+            .where(fts.op("MATCH")(_fts5_query(tokens)))
+            .subquery("comment_hits")
+        )
+
+    if tokens and dialect == "postgresql":
+        vector = literal_column("comments.search_vector")
+        ts_query = _tsquery(tokens)
+        return (
+            select(
+                Comment.id.label("comment_id"),
+                func.ts_rank_cd(vector, ts_query).label("rank"),
+                (
+                    func.ts_headline(TS_CONFIG, Comment.content_text, ts_query, _highlight_options())
+                    if with_snippet else literal(None)
+                ).label("snippet"),
+            )
+            .where(vector.op("@@")(ts_query))
+            .subquery("comment_hits")
+        )
+
+    return (
+        select(Comment.id.label("comment_id"), literal(0.0).label("rank"), literal(None).label("snippet"))
+        .where(
+            Comment.content_text.ilike(f"%{like_escape(q)}%", escape="\\")
+            if q.strip() else false()
+        )
+        .subquery("comment_hits")
+    )
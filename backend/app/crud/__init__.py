@@ -17,6 +17,7 @@ from .status import crud_status
 from .task import crud_task
 from .user import crud_user
 from .webhook import crud_webhook
+from .webhook_delivery import crud_webhook_delivery
 
 __all__ = [
     "crud_user",
@@ -37,6 +38,7 @@ __all__ = [
     "crud_notification",
     "crud_reaction",
     "crud_webhook",
+    "crud_webhook_delivery",
     "crud_custom_field_definition",
     "crud_custom_field_value",
 ]
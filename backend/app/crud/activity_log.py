@@ -1,9 +1,11 @@
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
+from app.core.pagination import after_cursor
 from app.models.activity_log import ActivityLog
 from app.schemas.activity_log import ActivityLogResponse
 
@@ -20,6 +22,7 @@ class CRUDActivityLog(CRUDBase[ActivityLog, ActivityLogResponse, ActivityLogResp
         entity_type: str | None = None,
         skip: int = 0,
         limit: int = 50,
+        cursor: tuple[datetime, UUID] | None = None,
     ) -> list[ActivityLog]:
         query = select(ActivityLog).where(
             ActivityLog.project_id == project_id
@@ -28,26 +31,73 @@ class CRUDActivityLog(CRUDBase[ActivityLog, ActivityLogResponse, ActivityLogResp
             query = query.where(ActivityLog.action == action)
         if entity_type is not None:
             query = query.where(ActivityLog.entity_type == entity_type)
+        if cursor is not None:
+            query = query.where(
+                after_cursor((ActivityLog.created_at, ActivityLog.id), cursor, descending=True)
+            )
+            skip = 0
         query = (
-            query.options(joinedload(ActivityLog.agent))
-            .order_by(ActivityLog.created_at.desc())
+            query.options(joinedload(ActivityLog.user), joinedload(ActivityLog.agent))
+            .order_by(ActivityLog.created_at.desc(), ActivityLog.id.desc())
             .offset(skip)
             .limit(limit)
         )
         result = await db.execute(query)
         return list(result.scalars().all())
 
+    async def count_by_project(
+        self,
+        db: AsyncSession,
+        project_id: UUID,
+        *,
+        action: str | None = None,
+        entity_type: str | None = None,
+    ) -> int:
+        query = select(func.count(ActivityLog.id)).where(
+            ActivityLog.project_id == project_id
+        )
+        if action is not None:
+            query = query.where(ActivityLog.action == action)
+        if entity_type is not None:
+            query = query.where(ActivityLog.entity_type == entity_type)
+        result = await db.execute(query)
+        return result.scalar_one()
+
     async def get_multi_by_task(
-        self, db: AsyncSession, task_id: UUID
+        self,
+        db: AsyncSession,
+        task_id: UUID,
+        *,
+        project_id: UUID | None = None,
+        skip: int = 0,
+        limit: int = 50,
+        cursor: tuple[datetime, UUID] | None = None,
     ) -> list[ActivityLog]:
+        query = select(ActivityLog).where(ActivityLog.task_id == task_id)
+        if project_id is not None:
+            query = query.where(ActivityLog.project_id == project_id)
+        if cursor is not None:
+            query = query.where(
+                after_cursor((ActivityLog.created_at, ActivityLog.id), cursor, descending=True)
+            )
+            skip = 0
         result = await db.execute(
-            select(ActivityLog)
-            .where(ActivityLog.task_id == task_id)
-            .options(joinedload(ActivityLog.agent))
-            .order_by(ActivityLog.created_at.desc())
+            query.options(joinedload(ActivityLog.user), joinedload(ActivityLog.agent))
+            .order_by(ActivityLog.created_at.desc(), ActivityLog.id.desc())
+            .offset(skip)
+            .limit(limit)
         )
         return list(result.scalars().all())
 
+    async def count_by_task(
+        self, db: AsyncSession, task_id: UUID, *, project_id: UUID | None = None
+    ) -> int:
+        query = select(func.count(ActivityLog.id)).where(ActivityLog.task_id == task_id)
+        if project_id is not None:
+            query = query.where(ActivityLog.project_id == project_id)
+        result = await db.execute(query)
+        return result.scalar_one()
+
     async def log(
         self,
         db: AsyncSession,
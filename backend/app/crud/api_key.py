@@ -1,7 +1,7 @@
-from datetime import datetime, timezone
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -45,12 +45,17 @@ class CRUDAPIKey(CRUDBase[APIKey, APIKeyCreate, APIKeyResponse]):
         )
         return result.scalar_one_or_none()
 
-    async def update_last_used(
-        self, db: AsyncSession, api_key: APIKey
+    async def bulk_update_last_used(
+        self, db: AsyncSession, last_used: dict[UUID, datetime]
     ) -> None:
-        api_key.last_used_at = datetime.now(timezone.utc)
-        db.add(api_key)
-        await db.flush()
+        """Write many last_used_at values in one executemany UPDATE."""
+        table = APIKey.__table__
+        await db.execute(
+            update(table)
+            .where(table.c.id == bindparam("key_id"))
+            .values(last_used_at=bindparam("used_at")),
+            [{"key_id": key_id, "used_at": at} for key_id, at in last_used.items()],
+        )
 
 
 crud_api_key = CRUDAPIKey(APIKey)
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from typing import Any, Generic, TypeVar
 from uuid import UUID
 
@@ -7,6 +8,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import Base
 
+from .loader import get_loader
+
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
@@ -20,6 +23,16 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         result = await db.execute(select(self.model).where(self.model.id == id))
         return result.scalar_one_or_none()
 
+    async def load(self, db: AsyncSession, id: UUID | None) -> ModelType | None:
+        """Like ``get`` but memoized for the session (see crud.loader)."""
+        return await get_loader(db).load(self.model, id)
+
+    async def load_many(
+        self, db: AsyncSession, ids: Iterable[UUID | None]
+    ) -> dict[UUID, ModelType]:
+        """Batched, memoized ``get`` for several ids, keyed by id."""
+        return await get_loader(db).load_many(self.model, ids)
+
     async def get_multi(
         self,
         db: AsyncSession,
@@ -71,6 +84,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     async def remove(self, db: AsyncSession, *, id: UUID) -> ModelType | None:
         obj = await self.get(db, id)
         if obj:
+            get_loader(db).forget(self.model, id)
             await db.delete(obj)
             await db.flush()
         return obj
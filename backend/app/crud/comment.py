@@ -1,9 +1,11 @@
+from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 
+from app.core.pagination import after_cursor
 from app.models.attachment import Attachment
 from app.models.comment import Comment
 from app.schemas.comment import CommentCreate, CommentUpdate
@@ -18,16 +20,19 @@ class CRUDComment(CRUDBase[Comment, CommentCreate, CommentUpdate]):
         task_id: UUID,
         skip: int = 0,
         limit: int = 50,
+        cursor: tuple[datetime, UUID] | None = None,
     ) -> list[Comment]:
+        query = select(Comment).where(Comment.task_id == task_id)
+        if cursor is not None:
+            query = query.where(after_cursor((Comment.created_at, Comment.id), cursor))
+            skip = 0
         result = await db.execute(
-            select(Comment)
-            .where(Comment.task_id == task_id)
-            .options(
+            query.options(
                 joinedload(Comment.user),
                 joinedload(Comment.agent_creator),
                 selectinload(Comment.attachments).joinedload(Attachment.user),
             )
-            .order_by(Comment.created_at)
+            .order_by(Comment.created_at, Comment.id)
             .offset(skip)
             .limit(limit)
         )
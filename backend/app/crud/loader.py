@@ -0,0 +1,78 @@
+"""Request-scoped entity loader.
+
+Lookups by id are batched into one ``IN (...)`` query per model and the
+results (misses included) are memoized on the session, so a mutation that
+names the same actor, status or label several times loads it once. Rows
+the session already holds — e.g. the authenticated user — are reused
+without a query. The memo lives in ``session.info`` and is dropped on
+rollback, when the session's objects are expired.
+"""
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+
+LOADER_KEY = "entity_loader"
+
+
+class EntityLoader:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._loaded: dict[type, dict[UUID, Any]] = defaultdict(dict)
+
+    def _from_session(self, model: type, id: UUID) -> Any:
+        obj = self.db.identity_map.get(identity_key(model, id))
+        if obj is None:
+            return None
+        state = inspect(obj)
+        # Expired attributes would lazy-load, which async sessions can't do
+        if state.expired_attributes or state.deleted or state.detached:
+            return None
+        return obj
+
+    async def load_many(self, model: type, ids: Iterable[UUID | None]) -> dict[UUID, Any]:
+        """Rows for ``ids`` keyed by id; unknown ids are left out."""
+        ids = [i for i in ids if i is not None]
+        memo = self._loaded[model]
+        missing = set()
+        for i in ids:
+            if i in memo:
+                continue
+            obj = self._from_session(model, i)
+            if obj is None:
+                missing.add(i)
+            else:
+                memo[i] = obj
+        if missing:
+            result = await self.db.execute(select(model).where(model.id.in_(missing)))
+            for obj in result.scalars().all():
+                memo[obj.id] = obj
+            for i in missing:
+                memo.setdefault(i, None)
+        return {i: memo[i] for i in ids if memo[i] is not None}
+
+    async def load(self, model: type, id: UUID | None) -> Any:
+        if id is None:
+            return None
+        return (await self.load_many(model, [id])).get(id)
+
+    def forget(self, model: type, id: UUID) -> None:
+        self._loaded[model].pop(id, None)
+
+
+def get_loader(db: AsyncSession) -> EntityLoader:
+    """The loader bound to ``db``, created on first use."""
+    loader = db.info.get(LOADER_KEY)
+    if loader is None:
+        loader = db.info[LOADER_KEY] = EntityLoader(db)
+    return loader
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session: Session) -> None:
+    session.info.pop(LOADER_KEY, None)
@@ -1,8 +1,10 @@
+from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import after_cursor
 from app.models.notification import Notification
 from app.schemas.notification import NotificationResponse
 
@@ -13,12 +15,22 @@ class CRUDNotification(
     CRUDBase[Notification, NotificationResponse, NotificationResponse]
 ):
     async def get_by_user(
-        self, db: AsyncSession, user_id: UUID, *, skip: int = 0, limit: int = 50
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        *,
+        skip: int = 0,
+        limit: int = 50,
+        cursor: tuple[datetime, UUID] | None = None,
     ) -> list[Notification]:
+        query = select(Notification).where(Notification.user_id == user_id)
+        if cursor is not None:
+            query = query.where(
+                after_cursor((Notification.created_at, Notification.id), cursor, descending=True)
+            )
+            skip = 0
         result = await db.execute(
-            select(Notification)
-            .where(Notification.user_id == user_id)
-            .order_by(Notification.created_at.desc())
+            query.order_by(Notification.created_at.desc(), Notification.id.desc())
             .offset(skip)
             .limit(limit)
         )
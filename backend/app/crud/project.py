@@ -2,14 +2,15 @@ from typing import Any
 from uuid import UUID
 
 from pydantic import BaseModel
-from sqlalchemy import or_, select
+from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload
 
 from app.models.agent_project import AgentProject
 from app.models.board import Board
 from app.models.project import Project
 from app.models.project_member import ProjectMember
+from app.models.task import Task
 from app.schemas.project import ProjectCreate, ProjectUpdate
 
 from .base import CRUDBase
@@ -32,6 +33,15 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         )
         return result.scalar_one_or_none()
 
+    async def get_for_access(self, db: AsyncSession, id: UUID) -> Project | None:
+        """Load only the columns needed for permission checks (no relationships)."""
+        result = await db.execute(
+            select(Project)
+            .where(Project.id == id)
+            .options(load_only(Project.id, Project.owner_id, Project.is_archived))
+        )
+        return result.scalar_one_or_none()
+
     async def update(
         self,
         db: AsyncSession,
@@ -52,13 +62,8 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         await db.flush()
         return await self.get(db, db_obj.id)
 
-    async def get_multi_by_user(
-        self,
-        db: AsyncSession,
-        user_id: UUID,
-        include_archived: bool = False,
-    ) -> list[Project]:
-        query = select(Project).where(
+    def _user_projects_query(self, query, user_id: UUID, include_archived: bool):
+        query = query.where(
             or_(
                 Project.owner_id == user_id,
                 Project.id.in_(
@@ -70,13 +75,52 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         )
         if not include_archived:
             query = query.where(Project.is_archived == False)  # noqa: E712
-        query = query.options(
-            selectinload(Project.owner),
-            selectinload(Project.members),
-            selectinload(Project.tasks),
+        return query
+
+    async def get_multi_by_user(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        include_archived: bool = False,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[Project]:
+        member_count = (
+            select(func.count(ProjectMember.id))
+            .where(ProjectMember.project_id == Project.id)
+            .correlate(Project).scalar_subquery()
+        )
+        task_count = (
+            select(func.count(Task.id))
+            .where(Task.project_id == Project.id)
+            .correlate(Project).scalar_subquery()
+        )
+        query = self._user_projects_query(
+            select(Project, member_count, task_count), user_id, include_archived
+        )
+        query = (
+            query.options(selectinload(Project.owner))
+            .order_by(Project.created_at, Project.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await db.execute(query)
+        projects = []
+        for project, members, tasks in result.all():
+            project.member_count = members
+            project.task_count = tasks
+            projects.append(project)
+        return projects
+
+    async def count_by_user(
+        self, db: AsyncSession, user_id: UUID, include_archived: bool = False
+    ) -> int:
+        query = self._user_projects_query(
+            select(func.count(Project.id)), user_id, include_archived
         )
         result = await db.execute(query)
-        return list(result.scalars().all())
+        return result.scalar_one()
 
     async def get_by_slug(
         self, db: AsyncSession, slug: str
@@ -1,13 +1,16 @@
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import case, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm import aliased, joinedload, selectinload
 
+from app.core.pagination import after_cursor
+from app.core.search import like_escape, task_hits
 from app.models.attachment import Attachment
 from app.models.checklist import Checklist
 from app.models.checklist_item import ChecklistItem
+from app.models.comment import Comment
 from app.models.custom_field_value import CustomFieldValue
 from app.models.task import Task
 from app.models.task_assignee import TaskAssignee
@@ -17,6 +20,8 @@ from app.schemas.task import TaskCreate, TaskUpdate
 
 from .base import CRUDBase
 
+# Checklist items are never loaded for task responses — progress is counted
+# in SQL by CRUDTask.attach_progress().
 _task_load_options = (
     joinedload(Task.status),
     joinedload(Task.creator),
@@ -31,7 +36,6 @@ _task_load_options = (
         joinedload(TaskWatcher.user),
         joinedload(TaskWatcher.agent),
     ),
-    selectinload(Task.checklists).selectinload(Checklist.items).selectinload(ChecklistItem.assignee),
     selectinload(Task.custom_field_values),
     selectinload(Task.children).options(
         joinedload(Task.status),
@@ -42,8 +46,109 @@ _task_load_options = (
     ),
 )
 
+# Only what the Kanban card renders — no attachments, watchers, checklists,
+# custom fields or children; their counts come from CRUDTask.attach_progress().
+_card_load_options = (
+    joinedload(Task.status),
+    joinedload(Task.creator),
+    joinedload(Task.agent_creator),
+    selectinload(Task.assignees).options(
+        joinedload(TaskAssignee.user),
+        joinedload(TaskAssignee.agent),
+    ),
+    selectinload(Task.labels).joinedload(TaskLabel.label),
+)
+
+
+def _filter_board_tasks(
+    query,
+    board_id: UUID,
+    *,
+    status_id: UUID | None = None,
+    priority: str | None = None,
+    assignee_id: UUID | None = None,
+    search: str | None = None,
+):
+    query = query.where(
+        Task.board_id == board_id,
+        Task.parent_id.is_(None),
+    )
+    if status_id is not None:
+        query = query.where(Task.status_id == status_id)
+    if priority is not None:
+        query = query.where(Task.priority == priority)
+    if assignee_id is not None:
+        query = query.where(
+            Task.id.in_(
+                select(TaskAssignee.task_id).where(
+                    TaskAssignee.user_id == assignee_id
+                )
+            )
+        )
+    if search:
+        # Word-prefix FTS hits, plus substrings of the title like global search
+        hits = task_hits(search, with_snippet=False)
+        query = query.where(or_(
+            Task.id.in_(select(hits.c.task_id)),
+            Task.title.ilike(f"%{like_escape(search)}%", escape="\\"),
+        ))
+    return query
+
 
 class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
+    async def attach_progress(
+        self, db: AsyncSession, tasks: list[Task], *, comments: bool = False
+    ) -> list[Task]:
+        """Set checklist/subtask progress on tasks from grouped SQL counts.
+
+        With ``comments`` the comment count is attached the same way.
+        """
+        if not tasks:
+            return tasks
+        task_ids = [t.id for t in tasks]
+
+        checklist_result = await db.execute(
+            select(
+                Checklist.task_id,
+                func.count(ChecklistItem.id),
+                func.count(case((ChecklistItem.is_completed == True, 1))),  # noqa: E712
+            )
+            .join(ChecklistItem, ChecklistItem.checklist_id == Checklist.id)
+            .where(Checklist.task_id.in_(task_ids))
+            .group_by(Checklist.task_id)
+        )
+        checklist_counts = {row[0]: (row[1], row[2]) for row in checklist_result.all()}
+
+        child = aliased(Task)
+        subtask_result = await db.execute(
+            select(
+                child.parent_id,
+                func.count(child.id),
+                func.count(child.completed_at),
+            )
+            .where(child.parent_id.in_(task_ids))
+            .group_by(child.parent_id)
+        )
+        subtask_counts = {row[0]: (row[1], row[2]) for row in subtask_result.all()}
+
+        for task in tasks:
+            total, completed = checklist_counts.get(task.id, (0, 0))
+            task.checklist_progress = {"total": total, "completed": completed}
+            total, completed = subtask_counts.get(task.id, (0, 0))
+            task.subtask_progress = {"total": total, "completed": completed}
+            task.children_count = total
+
+        if comments:
+            comment_result = await db.execute(
+                select(Comment.task_id, func.count(Comment.id))
+                .where(Comment.task_id.in_(task_ids))
+                .group_by(Comment.task_id)
+            )
+            comment_counts = dict(comment_result.all())
+            for task in tasks:
+                task.comments_count = comment_counts.get(task.id, 0)
+        return tasks
+
     async def get_with_relations(
         self, db: AsyncSession, task_id: UUID
     ) -> Task | None:
@@ -52,7 +157,29 @@ class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
             .where(Task.id == task_id)
             .options(*_task_load_options)
         )
-        return result.unique().scalar_one_or_none()
+        task = result.unique().scalar_one_or_none()
+        if task:
+            await self.attach_progress(db, [task])
+        return task
+
+    async def get_many_with_relations(
+        self, db: AsyncSession, task_ids: list[UUID]
+    ) -> list[Task]:
+        """Load several tasks with full relations, in ``task_ids`` order.
+
+        Tasks already in the session are refreshed.
+        """
+        if not task_ids:
+            return []
+        result = await db.execute(
+            select(Task)
+            .where(Task.id.in_(task_ids))
+            .options(*_task_load_options)
+            .execution_options(populate_existing=True)
+        )
+        order = {task_id: i for i, task_id in enumerate(task_ids)}
+        tasks = sorted(result.unique().scalars().all(), key=lambda t: order[t.id])
+        return await self.attach_progress(db, tasks)
 
     async def get_multi_by_board(
         self,
@@ -65,41 +192,74 @@ class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
         search: str | None = None,
         skip: int = 0,
         limit: int = 50,
+        cursor: tuple[float, UUID] | None = None,
     ) -> list[Task]:
-        query = select(Task).where(
-            Task.board_id == board_id,
-            Task.parent_id.is_(None),
+        query = _filter_board_tasks(
+            select(Task), board_id,
+            status_id=status_id, priority=priority,
+            assignee_id=assignee_id, search=search,
         )
-
-        if status_id is not None:
-            query = query.where(Task.status_id == status_id)
-        if priority is not None:
-            query = query.where(Task.priority == priority)
-        if assignee_id is not None:
-            query = query.where(
-                Task.id.in_(
-                    select(TaskAssignee.task_id).where(
-                        TaskAssignee.user_id == assignee_id
-                    )
-                )
-            )
-        if search:
-            pattern = f"%{search}%"
-            query = query.where(
-                or_(
-                    Task.title.ilike(pattern),
-                    Task.description_text.ilike(pattern),
-                )
-            )
-
+        if cursor is not None:
+            query = query.where(after_cursor((Task.position, Task.id), cursor))
+            skip = 0
         query = (
             query.options(*_task_load_options)
-            .order_by(Task.position)
+            .order_by(Task.position, Task.id)
             .offset(skip)
             .limit(limit)
         )
         result = await db.execute(query)
-        return list(result.unique().scalars().all())
+        return await self.attach_progress(db, list(result.unique().scalars().all()))
+
+    async def get_cards_by_board(
+        self,
+        db: AsyncSession,
+        board_id: UUID,
+        *,
+        status_id: UUID | None = None,
+        priority: str | None = None,
+        assignee_id: UUID | None = None,
+        search: str | None = None,
+        skip: int = 0,
+        limit: int = 50,
+        cursor: tuple[float, UUID] | None = None,
+    ) -> list[Task]:
+        """Lean board listing: card relations only, counts from grouped SQL."""
+        query = _filter_board_tasks(
+            select(Task), board_id,
+            status_id=status_id, priority=priority,
+            assignee_id=assignee_id, search=search,
+        )
+        if cursor is not None:
+            query = query.where(after_cursor((Task.position, Task.id), cursor))
+            skip = 0
+        query = (
+            query.options(*_card_load_options)
+            .order_by(Task.position, Task.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await db.execute(query)
+        tasks = list(result.unique().scalars().all())
+        return await self.attach_progress(db, tasks, comments=True)
+
+    async def count_by_board(
+        self,
+        db: AsyncSession,
+        board_id: UUID,
+        *,
+        status_id: UUID | None = None,
+        priority: str | None = None,
+        assignee_id: UUID | None = None,
+        search: str | None = None,
+    ) -> int:
+        query = _filter_board_tasks(
+            select(func.count(Task.id)), board_id,
+            status_id=status_id, priority=priority,
+            assignee_id=assignee_id, search=search,
+        )
+        result = await db.execute(query)
+        return result.scalar_one()
 
     async def get_max_position(
         self, db: AsyncSession, status_id: UUID
@@ -134,7 +294,7 @@ class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
             )
             .order_by(Task.position)
         )
-        return list(result.unique().scalars().all())
+        return await self.attach_progress(db, list(result.unique().scalars().all()))
 
     async def get_all_descendant_ids(
         self, db: AsyncSession, task_id: UUID, max_depth: int = 10
@@ -286,7 +446,7 @@ class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
             task = row[0]
             task.comments_count = row[1]
             tasks.append(task)
-        return tasks
+        return await self.attach_progress(db, tasks)
 
     async def count_by_priority(
         self, db: AsyncSession, project_id: UUID
@@ -1,14 +1,31 @@
+from dataclasses import dataclass
 from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.models.webhook import Webhook
 from app.schemas.webhook import WebhookCreate, WebhookUpdate
 
 from .base import CRUDBase
 
 
+@dataclass(frozen=True)
+class WebhookSubscription:
+    """Detached snapshot of an active webhook, as kept in the subscription index."""
+
+    id: UUID
+    url: str
+    secret: str | None
+    batch_window_seconds: int | None = None
+
+
+# project_id -> {event_type: [WebhookSubscription, ...]}
+_subscriptions = TTLCache(settings.WEBHOOK_INDEX_TTL)
+
+
 class CRUDWebhook(CRUDBase[Webhook, WebhookCreate, WebhookUpdate]):
     async def get_multi_by_project(
         self, db: AsyncSession, project_id: UUID
@@ -20,15 +37,46 @@ class CRUDWebhook(CRUDBase[Webhook, WebhookCreate, WebhookUpdate]):
 
     async def get_active_for_event(
         self, db: AsyncSession, project_id: UUID, event_type: str
-    ) -> list[Webhook]:
-        result = await db.execute(
-            select(Webhook).where(
-                Webhook.project_id == project_id,
-                Webhook.is_active == True,  # noqa: E712
+    ) -> list[WebhookSubscription]:
+        """Active webhooks subscribed to ``event_type``, from the in-process index.
+
+        A project's index is built with one query and then reused until it
+        expires or a webhook endpoint invalidates it, so mutations in
+        projects without subscribers never touch the ``webhooks`` table.
+        """
+        index = _subscriptions.get(project_id)
+        if index is None:
+            result = await db.execute(
+                select(
+                    Webhook.id,
+                    Webhook.url,
+                    Webhook.secret,
+                    Webhook.events,
+                    Webhook.batch_window_seconds,
+                ).where(
+                    Webhook.project_id == project_id,
+                    Webhook.is_active == True,  # noqa: E712
+                )
             )
-        )
-        webhooks = result.scalars().all()
-        return [w for w in webhooks if event_type in (w.events or [])]
+            index = {}
+            for row in result.all():
+                subscription = WebhookSubscription(
+                    id=row.id,
+                    url=row.url,
+                    secret=row.secret,
+                    batch_window_seconds=row.batch_window_seconds,
+                )
+                for event in row.events or []:
+                    index.setdefault(event, []).append(subscription)
+            _subscriptions.set(project_id, index)
+        return index.get(event_type, [])
+
+    def invalidate_subscriptions(self, project_id: UUID | None = None) -> None:
+        """Drop a project's subscription index (or all of them)."""
+        if project_id is None:
+            _subscriptions.clear()
+        else:
+            _subscriptions.pop(project_id)
 
 
 crud_webhook = CRUDWebhook(Webhook)
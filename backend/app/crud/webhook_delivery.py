@@ -0,0 +1,156 @@
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.webhook import Webhook
+from app.models.webhook_delivery import WebhookDelivery
+from app.schemas.webhook import WebhookDeliveryResponse
+
+from .base import CRUDBase
+from .webhook import WebhookSubscription
+
+
+class CRUDWebhookDelivery(
+    CRUDBase[WebhookDelivery, WebhookDeliveryResponse, WebhookDeliveryResponse]
+):
+    async def enqueue(
+        self,
+        db: AsyncSession,
+        webhooks: list[WebhookSubscription],
+        event_type: str,
+        payload: dict,
+    ) -> None:
+        """Queue ``payload`` for each webhook as part of the caller's transaction.
+
+        ``webhooks`` may come from another worker's stale subscription index,
+        so the insert runs in a savepoint: a deleted webhook raises
+        IntegrityError without aborting the caller's transaction.
+        """
+        now = datetime.now(UTC)
+        deliveries = [
+            WebhookDelivery(
+                webhook_id=w.id,
+                event_type=event_type,
+                payload=payload,
+                # Batched events wait out the window unless the batch fills up
+                next_attempt_at=now + timedelta(seconds=w.batch_window_seconds or 0),
+            )
+            for w in webhooks
+        ]
+        async with db.begin_nested():
+            db.add_all(deliveries)
+
+    async def get_due(
+        self, db: AsyncSession, now: datetime, *, limit: int
+    ) -> list[tuple[WebhookDelivery, Webhook]]:
+        """Oldest pending deliveries whose retry time has come, with their webhook.
+
+        Rows are locked with SKIP LOCKED where supported so several API
+        processes can poll the same table without claiming a delivery twice.
+        """
+        result = await db.execute(
+            select(WebhookDelivery, Webhook)
+            .join(Webhook, Webhook.id == WebhookDelivery.webhook_id)
+            .where(
+                WebhookDelivery.status == "pending",
+                WebhookDelivery.next_attempt_at <= now,
+                Webhook.is_active == True,  # noqa: E712
+            )
+            .order_by(WebhookDelivery.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True, of=WebhookDelivery)
+        )
+        return [(row[0], row[1]) for row in result.all()]
+
+    async def get_full_batches(self, db: AsyncSession) -> list[Webhook]:
+        """Batching webhooks with at least ``batch_max_size`` new events waiting."""
+        result = await db.execute(
+            select(Webhook)
+            .join(WebhookDelivery, WebhookDelivery.webhook_id == Webhook.id)
+            .where(
+                Webhook.batch_window_seconds.is_not(None),
+                Webhook.is_active == True,  # noqa: E712
+                WebhookDelivery.status == "pending",
+                WebhookDelivery.attempts == 0,
+            )
+            .group_by(Webhook.id)
+            .having(func.count(WebhookDelivery.id) >= Webhook.batch_max_size)
+        )
+        return list(result.scalars().all())
+
+    async def get_batch(
+        self, db: AsyncSession, webhook_id: UUID, now: datetime, *, limit: int
+    ) -> list[WebhookDelivery]:
+        """Oldest sendable events for one batching webhook.
+
+        New events are taken before their window ends (the batch is being
+        sent anyway); events waiting out a retry backoff are not.
+        """
+        result = await db.execute(
+            select(WebhookDelivery)
+            .where(
+                WebhookDelivery.webhook_id == webhook_id,
+                WebhookDelivery.status == "pending",
+                or_(
+                    WebhookDelivery.attempts == 0,
+                    WebhookDelivery.next_attempt_at <= now,
+                ),
+            )
+            .order_by(WebhookDelivery.created_at, WebhookDelivery.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(result.scalars().all())
+
+    async def record_attempt(
+        self, db: AsyncSession, delivery_ids: list[UUID], **values
+    ) -> None:
+        await db.execute(
+            update(WebhookDelivery)
+            .where(WebhookDelivery.id.in_(delivery_ids))
+            .values(**values)
+        )
+
+    async def get_multi_by_webhook(
+        self,
+        db: AsyncSession,
+        webhook_id: UUID,
+        *,
+        status: str | None = None,
+        skip: int = 0,
+        limit: int = 50,
+    ) -> list[WebhookDelivery]:
+        query = select(WebhookDelivery).where(WebhookDelivery.webhook_id == webhook_id)
+        if status is not None:
+            query = query.where(WebhookDelivery.status == status)
+        query = query.order_by(WebhookDelivery.created_at.desc()).offset(skip).limit(limit)
+        result = await db.execute(query)
+        return list(result.scalars().all())
+
+    async def count_by_webhook(
+        self, db: AsyncSession, webhook_id: UUID, *, status: str | None = None
+    ) -> int:
+        query = select(func.count()).select_from(WebhookDelivery).where(
+            WebhookDelivery.webhook_id == webhook_id
+        )
+        if status is not None:
+            query = query.where(WebhookDelivery.status == status)
+        result = await db.execute(query)
+        return result.scalar_one()
+
+    async def purge_finished(self, db: AsyncSession, before: datetime) -> int:
+        result = await db.execute(
+            delete(WebhookDelivery).where(
+                or_(
+                    WebhookDelivery.status.in_(("delivered", "failed")),
+                    WebhookDelivery.webhook_id.not_in(select(Webhook.id)),
+                ),
+                WebhookDelivery.created_at < before,
+            )
+        )
+        return result.rowcount
+
+
+crud_webhook_delivery = CRUDWebhookDelivery(WebhookDelivery)
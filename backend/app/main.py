@@ -4,6 +4,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.core.database import init_db
 from app.middleware.error_handler import register_error_handlers
+from app.middleware.read_your_writes import ReadYourWritesMiddleware
 from app.middleware.request_id import RequestIDMiddleware
 
 app = FastAPI(
@@ -22,6 +23,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 app.add_middleware(RequestIDMiddleware)
+if settings.DATABASE_READ_URL:
+    app.add_middleware(ReadYourWritesMiddleware)
 
 register_error_handlers(app)
 
@@ -89,10 +92,39 @@ async def startup():
 
     from app.core.config import settings
 
+    from app.services.api_key_usage import api_key_usage
+    from app.services.webhook_dispatcher import webhook_dispatcher
+    from app.services.websocket_manager import manager
+
     Path(settings.UPLOAD_DIR).mkdir(exist_ok=True)
     await init_db()
+    await manager.start()
+    await api_key_usage.start()
+    await webhook_dispatcher.start()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    from app.services.api_key_usage import api_key_usage
+    from app.services.webhook_dispatcher import webhook_dispatcher
+    from app.services.websocket_manager import manager
+
+    await webhook_dispatcher.stop()
+    await api_key_usage.stop()
+    await manager.stop()
 
 
 @app.get("/health")
 async def health():
     return {"status": "healthy", "version": "1.0.0"}
+
+
+@app.get("/health/db")
+async def health_db():
+    from app.core.database import pool_stats
+    from app.core.errors import NotFoundError
+
+    # Pool internals are unauthenticated here, so they are opt-in
+    if not settings.DB_POOL_STATS:
+        raise NotFoundError("Not found")
+    return {"status": "healthy", "pools": pool_stats()}
@@ -0,0 +1,47 @@
+import time
+
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.config import settings
+
+# Unix time until which the client's reads should stay on the primary. Sent
+# as a cookie for browsers and a header that API clients may echo back.
+READ_PRIMARY_COOKIE = "read_primary_until"
+READ_PRIMARY_HEADER = "X-Read-Primary-Until"
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+def wants_primary(request: Request) -> bool:
+    """Whether the client wrote recently, possibly through another worker."""
+    marker = request.headers.get(READ_PRIMARY_HEADER) or request.cookies.get(READ_PRIMARY_COOKIE)
+    try:
+        return marker is not None and float(marker) > time.time()
+    except ValueError:
+        return False
+
+
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """Marks successful write responses so follow-up reads skip the replica.
+
+    The in-process ``recent_writers`` cache only helps when the next request
+    lands on the same worker; the marker travels with the client instead.
+    """
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        response = await call_next(request)
+        if request.method in WRITE_METHODS and response.status_code < 400:
+            until = f"{time.time() + settings.READ_YOUR_WRITES_SECONDS:.3f}"
+            response.headers[READ_PRIMARY_HEADER] = until
+            response.set_cookie(
+                READ_PRIMARY_COOKIE,
+                until,
+                max_age=max(int(settings.READ_YOUR_WRITES_SECONDS) + 1, 1),
+                httponly=True,
+                samesite="lax",
+            )
+        return response
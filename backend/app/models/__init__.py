@@ -23,6 +23,7 @@ from app.models.task_label import TaskLabel
 from app.models.task_watcher import TaskWatcher
 from app.models.user import User
 from app.models.webhook import Webhook
+from app.models.webhook_delivery import WebhookDelivery
 
 __all__ = [
     "ActivityLog",
@@ -50,4 +51,5 @@ __all__ = [
     "TaskWatcher",
     "User",
     "Webhook",
+    "WebhookDelivery",
 ]
@@ -15,6 +15,11 @@ class ActivityLog(Base):
             "project_id",
             "created_at",
         ),
+        Index(
+            "ix_activity_logs_task_created",
+            "task_id",
+            "created_at",
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -60,10 +60,23 @@ class Project(Base):
     def agents(self):
         return [ap.agent for ap in self.agent_projects if ap.agent.is_active and not ap.agent.deleted_at]
 
+    # Listing queries set these from SQL counts instead of loading the collections
     @property
     def member_count(self) -> int:
+        if "_member_count" in self.__dict__:
+            return self.__dict__["_member_count"]
         return len(self.members)
 
+    @member_count.setter
+    def member_count(self, value: int) -> None:
+        self.__dict__["_member_count"] = value
+
     @property
     def task_count(self) -> int:
+        if "_task_count" in self.__dict__:
+            return self.__dict__["_task_count"]
         return len(self.tasks)
+
+    @task_count.setter
+    def task_count(self, value: int) -> None:
+        self.__dict__["_task_count"] = value
@@ -1,7 +1,7 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, ForeignKey, JSON, String
+from sqlalchemy import Boolean, ForeignKey, Integer, JSON, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base, TZDateTime
@@ -20,6 +20,11 @@ class Webhook(Base):
     events: Mapped[dict] = mapped_column(JSON)
     secret: Mapped[str | None] = mapped_column(String(255))
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    # Batching is opt-in: events are held up to this many seconds and sent
+    # as one JSON array (sooner once batch_max_size are waiting)
+    batch_window_seconds: Mapped[int | None] = mapped_column(Integer)
+    batch_max_size: Mapped[int] = mapped_column(Integer, default=100)
+    compress: Mapped[bool] = mapped_column(Boolean, default=False)
 
     created_at: Mapped[datetime] = mapped_column(
         TZDateTime(), default=lambda: datetime.now(UTC)
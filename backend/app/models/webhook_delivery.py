@@ -0,0 +1,50 @@
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import ForeignKey, Index, Integer, JSON, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.core.database import Base, TZDateTime
+
+
+class WebhookDelivery(Base):
+    """One event queued for one webhook, plus the log of its last attempt."""
+
+    __tablename__ = "webhook_deliveries"
+    __table_args__ = (
+        Index(
+            "ix_webhook_deliveries_status_next_attempt",
+            "status",
+            "next_attempt_at",
+        ),
+        Index(
+            "ix_webhook_deliveries_webhook_created",
+            "webhook_id",
+            "created_at",
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True, default=uuid.uuid4
+    )
+    webhook_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("webhooks.id", ondelete="CASCADE")
+    )
+    event_type: Mapped[str] = mapped_column(String(100))
+    payload: Mapped[dict] = mapped_column(JSON)
+    # pending | delivered | failed
+    status: Mapped[str] = mapped_column(String(20), default="pending")
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        TZDateTime(), default=lambda: datetime.now(UTC)
+    )
+    response_status: Mapped[int | None] = mapped_column(Integer)
+    error: Mapped[str | None] = mapped_column(Text)
+    duration_ms: Mapped[int | None] = mapped_column(Integer)
+    delivered_at: Mapped[datetime | None] = mapped_column(TZDateTime())
+
+    created_at: Mapped[datetime] = mapped_column(
+        TZDateTime(), default=lambda: datetime.now(UTC)
+    )
+
+    webhook = relationship("Webhook")
@@ -66,11 +66,13 @@ from .project_member import (
     ProjectMemberResponse,
     ProjectMemberUpdate,
 )
+from .search import SearchResult
 from .status import StatusCreate, StatusReorder, StatusResponse, StatusUpdate
 from .task import (
     BulkTaskDelete,
     BulkTaskMove,
     BulkTaskUpdate,
+    TaskCardResponse,
     TaskCreate,
     TaskMove,
     TaskReorder,
@@ -78,7 +80,7 @@ from .task import (
     TaskUpdate,
 )
 from .user import UserBrief, UserCreate, UserResponse, UserUpdate
-from .webhook import WebhookCreate, WebhookResponse, WebhookUpdate
+from .webhook import WebhookCreate, WebhookDeliveryResponse, WebhookResponse, WebhookUpdate
 
 __all__ = [
     "ResponseBase",
@@ -112,6 +114,7 @@ __all__ = [
     "ProjectMemberCreate",
     "ProjectMemberUpdate",
     "ProjectMemberResponse",
+    "SearchResult",
     "StatusCreate",
     "StatusUpdate",
     "StatusResponse",
@@ -122,6 +125,7 @@ __all__ = [
     "TaskCreate",
     "TaskUpdate",
     "TaskResponse",
+    "TaskCardResponse",
     "TaskMove",
     "TaskReorder",
     "BulkTaskUpdate",
@@ -156,6 +160,7 @@ __all__ = [
     "WebhookCreate",
     "WebhookUpdate",
     "WebhookResponse",
+    "WebhookDeliveryResponse",
     "CustomFieldDefinitionCreate",
     "CustomFieldDefinitionUpdate",
     "CustomFieldDefinitionResponse",
@@ -17,8 +17,9 @@ class ResponseBase(BaseModel, Generic[T]):
 class PaginationMeta(BaseModel):
     page: int
     per_page: int
-    total: int
-    total_pages: int
+    total: int | None
+    total_pages: int | None
+    next_cursor: str | None = None
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -0,0 +1,16 @@
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class SearchResult(BaseModel):
+    type: Literal["project", "board", "task", "comment"]
+    id: UUID
+    title: str
+    snippet: str | None = None
+    rank: float
+    slug: str | None = None
+    project_id: UUID
+    board_id: UUID | None = None
+    task_id: UUID | None = None
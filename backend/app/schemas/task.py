@@ -89,6 +89,21 @@ class ConvertToSubtask(BaseModel):
     task_id_to_convert: UUID
 
 
+def _resolve_cover_image_url(data):
+    if hasattr(data, "cover_type") and data.cover_type == "image" and data.cover_value:
+        data.__dict__["cover_image_url"] = f"/api/v1/attachments/{data.cover_value}/download"
+    return data
+
+
+def _resolve_labels(data):
+    """Convert TaskLabel join objects to Label objects for serialization."""
+    if hasattr(data, "labels"):
+        raw = data.labels
+        if raw and hasattr(raw[0], "label"):
+            data.__dict__["labels"] = [tl.label for tl in raw if tl.label]
+    return data
+
+
 class TaskResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -127,7 +142,9 @@ class TaskResponse(BaseModel):
     @model_validator(mode="before")
     @classmethod
     def resolve_checklist_progress(cls, data):
-        if hasattr(data, "checklists"):
+        # Only count items when the collection is already loaded; otherwise
+        # keep the progress precomputed by crud_task.attach_progress().
+        if "checklists" in getattr(data, "__dict__", {}):
             total = 0
             completed = 0
             for cl in data.checklists:
@@ -141,24 +158,18 @@ class TaskResponse(BaseModel):
     @model_validator(mode="before")
     @classmethod
     def resolve_cover_image_url(cls, data):
-        if hasattr(data, "cover_type") and data.cover_type == "image" and data.cover_value:
-            data.__dict__["cover_image_url"] = f"/api/v1/attachments/{data.cover_value}/download"
-        return data
+        return _resolve_cover_image_url(data)
 
     @model_validator(mode="before")
     @classmethod
     def resolve_labels(cls, data):
-        """Convert TaskLabel join objects to Label objects for serialization."""
-        if hasattr(data, "labels"):
-            raw = data.labels
-            if raw and hasattr(raw[0], "label"):
-                data.__dict__["labels"] = [tl.label for tl in raw if tl.label]
-        return data
+        return _resolve_labels(data)
 
     @model_validator(mode="before")
     @classmethod
     def resolve_subtask_progress(cls, data):
-        if hasattr(data, "children"):
+        state = getattr(data, "__dict__", {})
+        if "subtask_progress" not in state and "children" in state:
             kids = data.children or []
             total = len(kids)
             completed = sum(1 for c in kids if c.completed_at is not None)
@@ -167,6 +178,50 @@ class TaskResponse(BaseModel):
         return data
 
 
+class TaskCardResponse(BaseModel):
+    """Kanban card projection — progress and counts are precomputed in SQL."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    project_id: UUID
+    board_id: UUID
+    title: str
+    description: dict | None = None
+    description_text: str | None = None
+    status: StatusResponse
+    priority: str
+    assignees: list[AssigneeBrief] = []
+    creator: UserBrief
+    agent_creator: AgentBrief | None = None
+    labels: list[LabelResponse]
+    due_date: datetime | None = None
+    position: float
+    parent_id: UUID | None = None
+    cover_type: str | None = None
+    cover_value: str | None = None
+    cover_size: str | None = None
+    cover_image_url: str | None = None
+    comments_count: int = 0
+    checklist_progress: ChecklistProgress = ChecklistProgress()
+    subtask_progress: SubtaskProgress = SubtaskProgress()
+    children_count: int = 0
+    reactions: ReactionSummary | None = None
+    created_at: datetime
+    updated_at: datetime | None = None
+    completed_at: datetime | None = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def resolve_cover_image_url(cls, data):
+        return _resolve_cover_image_url(data)
+
+    @model_validator(mode="before")
+    @classmethod
+    def resolve_labels(cls, data):
+        return _resolve_labels(data)
+
+
 def _validate_position(v: float) -> float:
     import math
     if not math.isfinite(v):
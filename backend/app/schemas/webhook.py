@@ -1,19 +1,25 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 
 class WebhookCreate(BaseModel):
     url: HttpUrl
     events: list[str]
     secret: str | None = None
+    batch_window_seconds: int | None = Field(None, ge=1, le=3600)
+    batch_max_size: int = Field(100, ge=1, le=1000)
+    compress: bool = False
 
 
 class WebhookUpdate(BaseModel):
     url: HttpUrl | None = None
     events: list[str] | None = None
     is_active: bool | None = None
+    batch_window_seconds: int | None = Field(None, ge=1, le=3600)
+    batch_max_size: int | None = Field(None, ge=1, le=1000)
+    compress: bool | None = None
 
 
 class WebhookResponse(BaseModel):
@@ -23,4 +29,22 @@ class WebhookResponse(BaseModel):
     url: str
     events: list[str]
     is_active: bool
+    batch_window_seconds: int | None = None
+    batch_max_size: int
+    compress: bool
+    created_at: datetime
+
+
+class WebhookDeliveryResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    event_type: str
+    status: str
+    attempts: int
+    next_attempt_at: datetime
+    response_status: int | None = None
+    error: str | None = None
+    duration_ms: int | None = None
+    delivered_at: datetime | None = None
     created_at: datetime
@@ -0,0 +1,60 @@
+"""Buffered API key ``last_used_at`` tracking.
+
+Authenticating with an API key only records the timestamp in memory; a
+background task writes all pending timestamps in one bulk UPDATE every
+``API_KEY_USAGE_FLUSH_INTERVAL`` seconds and once more on shutdown. Read-only
+agent requests therefore never open a write transaction on ``api_keys``.
+"""
+import asyncio
+import logging
+from datetime import UTC, datetime
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.crud import crud_api_key
+
+logger = logging.getLogger(__name__)
+
+
+class APIKeyUsageTracker:
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._pending: dict[UUID, datetime] = {}
+        self._task: asyncio.Task | None = None
+
+    def touch(self, api_key_id: UUID) -> None:
+        self._pending[api_key_id] = datetime.now(UTC)
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        try:
+            async with async_session() as db:
+                await crud_api_key.bulk_update_last_used(db, pending)
+                await db.commit()
+        except Exception:
+            # Timestamps are informational; drop this batch rather than retry
+            logger.exception("Failed to flush %d API key usage timestamps", len(pending))
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+
+api_key_usage = APIKeyUsageTracker(settings.API_KEY_USAGE_FLUSH_INTERVAL)
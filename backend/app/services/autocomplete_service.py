@@ -0,0 +1,284 @@
+"""@mention and #reference autocomplete.
+
+On PostgreSQL each keystroke is one ranked query, served by the pg_trgm
+indexes that migration d5a8b3e6f172 creates (the app never installs
+extensions itself; without them the queries still work, unindexed).
+Elsewhere a project's mentionable users and agents are loaded once into an
+in-memory word-prefix index (cached per project, invalidated on membership
+and agent changes) and keystrokes never touch the database.
+"""
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import Float, String, Uuid, cast, func, literal, null, or_, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import engine
+from app.core.search import like_escape, task_hits
+from app.models.agent import Agent
+from app.models.agent_project import AgentProject
+from app.models.board import Board
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.task import Task
+from app.models.user import User
+from app.services import cache_invalidation
+from app.services.search_service import SearchService
+
+MENTION_LIMIT = 20
+REFERENCE_LIMIT = 5
+# Longer queries are narrowed by prefix then filtered with startswith
+MAX_PREFIX = 8
+
+_mention_indexes = TTLCache(settings.AUTOCOMPLETE_CACHE_TTL)
+cache_invalidation.register(
+    "mention_index", _mention_indexes,
+    lambda project_id: lambda key, value: project_id == "*" or str(key) == project_id,
+)
+
+
+@dataclass
+class Mentionable:
+    kind: str
+    id: UUID
+    name: str
+    full_name: str | None = None
+    avatar_url: str | None = None
+    color: str | None = None
+
+    def to_dict(self) -> dict:
+        if self.kind == "agent":
+            return {"id": str(self.id), "name": self.name, "color": self.color}
+        return {
+            "id": str(self.id),
+            "username": self.name,
+            "full_name": self.full_name,
+            "avatar_url": self.avatar_url,
+        }
+
+
+class MentionIndex:
+    """Word-prefix index over one project's users and agents."""
+
+    def __init__(self, entries: list[Mentionable]):
+        self.entries = sorted(entries, key=lambda e: e.name.lower())
+        self._prefixes: dict[str, set[int]] = defaultdict(set)
+        for i, entry in enumerate(self.entries):
+            for word in self._words(entry):
+                for n in range(1, min(len(word), MAX_PREFIX) + 1):
+                    self._prefixes[word[:n]].add(i)
+
+    @staticmethod
+    def _words(entry: Mentionable) -> set[str]:
+        text = f"{entry.name} {entry.full_name or ''}".lower()
+        return {entry.name.lower(), *re.findall(r"\w+", text)}
+
+    def _score(self, entry: Mentionable, q: str) -> int:
+        name = entry.name.lower()
+        if name == q:
+            return 4
+        if name.startswith(q):
+            return 3
+        if any(w.startswith(q) for w in self._words(entry)):
+            return 2
+        if q in name or q in (entry.full_name or "").lower():
+            return 1
+        return 0
+
+    def search(self, q: str) -> list[Mentionable]:
+        q = q.strip().lower()
+        if not q:
+            return list(self.entries)
+        candidates = self._prefixes.get(q[:MAX_PREFIX], set())
+        scored = [(self._score(self.entries[i], q), i) for i in candidates]
+        if len(scored) < MENTION_LIMIT:
+            # Substring matches inside words, like the old behaviour
+            scored += [
+                (score, i) for i, e in enumerate(self.entries)
+                if i not in candidates and (score := self._score(e, q))
+            ]
+        scored = [(s, i) for s, i in scored if s]
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [self.entries[i] for _, i in scored]
+
+
+def _mentionables_query(project: Project, q: str | None = None):
+    member_ids = select(ProjectMember.user_id).where(ProjectMember.project_id == project.id)
+    users = select(
+        literal("user").label("kind"),
+        User.id.label("id"),
+        User.username.label("name"),
+        User.full_name.label("full_name"),
+        User.avatar_url.label("avatar_url"),
+        cast(null(), String).label("color"),
+        (
+            cast(func.greatest(
+                func.similarity(User.username, q),
+                func.similarity(func.coalesce(User.full_name, ""), q),
+            ), Float) + SearchService.name_rank(User.username, q)
+            if q else literal(0.0)
+        ).label("rank"),
+    ).where(or_(User.id.in_(member_ids), User.id == project.owner_id))
+    agents = (
+        select(
+            literal("agent").label("kind"),
+            Agent.id.label("id"),
+            Agent.name.label("name"),
+            cast(null(), String).label("full_name"),
+            cast(null(), String).label("avatar_url"),
+            Agent.color.label("color"),
+            (
+                cast(func.similarity(Agent.name, q), Float) + SearchService.name_rank(Agent.name, q)
+                if q else literal(0.0)
+            ).label("rank"),
+        )
+        .join(AgentProject, AgentProject.agent_id == Agent.id)
+        .where(
+            AgentProject.project_id == project.id,
+            Agent.is_active == True,  # noqa: E712
+            Agent.deleted_at.is_(None),
+        )
+    )
+    if q:
+        pattern = f"%{like_escape(q)}%"
+        users = users.where(or_(
+            User.username.ilike(pattern, escape="\\"),
+            User.full_name.ilike(pattern, escape="\\"),
+        ))
+        agents = agents.where(Agent.name.ilike(pattern, escape="\\"))
+    return union_all(users, agents).subquery("mentionables")
+
+
+def _top_per_kind(results, limit: int, order_by):
+    """Keep the best ``limit`` rows of each kind in the same query."""
+    position = func.row_number().over(partition_by=results.c.kind, order_by=order_by).label("position")
+    ranked = select(results, position).subquery("ranked")
+    return select(ranked).where(ranked.c.position <= limit).order_by(ranked.c.kind, ranked.c.position)
+
+
+class AutocompleteService:
+    @staticmethod
+    def invalidate(db: AsyncSession, project_id: UUID | None = None) -> None:
+        """Drop cached mention indexes for one project (or all), now and on commit."""
+        cache_invalidation.invalidate_after_commit(db, "mention_index", project_id or "*")
+
+    @staticmethod
+    async def _mention_index(db: AsyncSession, project: Project) -> MentionIndex:
+        index = _mention_indexes.get(project.id)
+        if index is None:
+            results = _mentionables_query(project)
+            rows = await db.execute(select(results))
+            index = MentionIndex([
+                Mentionable(
+                    kind=r.kind, id=r.id, name=r.name, full_name=r.full_name,
+                    avatar_url=r.avatar_url, color=r.color,
+                )
+                for r in rows.all()
+            ])
+            _mention_indexes.set(project.id, index)
+        return index
+
+    @staticmethod
+    async def mentionables(db: AsyncSession, project: Project, q: str) -> dict:
+        if engine.dialect.name == "postgresql":
+            results = _mentionables_query(project, q or None)
+            rows = await db.execute(_top_per_kind(
+                results, MENTION_LIMIT, (results.c.rank.desc(), results.c.name),
+            ))
+            matches = [
+                Mentionable(
+                    kind=r.kind, id=r.id, name=r.name, full_name=r.full_name,
+                    avatar_url=r.avatar_url, color=r.color,
+                )
+                for r in rows.all()
+            ]
+        else:
+            index = await AutocompleteService._mention_index(db, project)
+            matches = index.search(q)
+
+        users = [m.to_dict() for m in matches if m.kind == "user"][:MENTION_LIMIT]
+        agents = [m.to_dict() for m in matches if m.kind == "agent"][:MENTION_LIMIT]
+        return {"users": users, "agents": agents}
+
+    @staticmethod
+    async def referenceables(
+        db: AsyncSession, project_id: UUID, user_id: UUID, q: str
+    ) -> dict:
+        """Projects, boards and tasks for #reference, as one ranked query."""
+        pattern = f"%{like_escape(q)}%"
+        no_uuid = cast(null(), Uuid)
+        no_text = cast(null(), String)
+
+        projects = select(
+            literal("project").label("kind"),
+            Project.id.label("id"),
+            Project.name.label("name"),
+            Project.icon.label("icon"),
+            Project.color.label("color"),
+            Project.id.label("project_id"),
+            no_uuid.label("board_id"),
+            cast(SearchService.name_rank(Project.name, q) if q else literal(0.0), Float).label("rank"),
+        ).where(Project.id.in_(SearchService.accessible_project_ids(user_id)))
+        boards = select(
+            literal("board").label("kind"),
+            Board.id.label("id"),
+            Board.name.label("name"),
+            Board.icon.label("icon"),
+            Board.color.label("color"),
+            Board.project_id.label("project_id"),
+            Board.id.label("board_id"),
+            cast(SearchService.name_rank(Board.name, q) if q else literal(0.0), Float).label("rank"),
+        ).where(Board.project_id == project_id)
+        hits = task_hits(q, with_snippet=False) if q else None
+        tasks = select(
+            literal("task").label("kind"),
+            Task.id.label("id"),
+            Task.title.label("name"),
+            no_text.label("icon"),
+            no_text.label("color"),
+            Task.project_id.label("project_id"),
+            Task.board_id.label("board_id"),
+            cast(func.coalesce(hits.c.rank, 0.0) if q else literal(0.0), Float).label("rank"),
+        ).where(Task.project_id == project_id)
+
+        if q:
+            projects = projects.where(Project.name.ilike(pattern, escape="\\"))
+            boards = boards.where(Board.name.ilike(pattern, escape="\\"))
+            # Word-prefix FTS hits rank first; a substring of the title
+            # (e.g. "board" in "dashboard") still matches, unranked
+            tasks = tasks.outerjoin(hits, hits.c.task_id == Task.id).where(
+                or_(hits.c.task_id.is_not(None), Task.title.ilike(pattern, escape="\\"))
+            )
+
+        results = union_all(projects, boards, tasks).subquery("referenceables")
+        rows = await db.execute(_top_per_kind(
+            results, REFERENCE_LIMIT, (results.c.rank.desc(), results.c.name),
+        ))
+
+        data: dict[str, list[dict]] = {"projects": [], "boards": [], "tasks": []}
+        for r in rows.all():
+            if r.kind == "project":
+                data["projects"].append(
+                    {"id": str(r.id), "name": r.name, "icon": r.icon, "color": r.color}
+                )
+            elif r.kind == "board":
+                data["boards"].append({
+                    "id": str(r.id),
+                    "name": r.name,
+                    "icon": r.icon,
+                    "color": r.color,
+                    "project_id": str(r.project_id),
+                })
+            else:
+                data["tasks"].append({
+                    "id": str(r.id),
+                    "title": r.name,
+                    "board_id": str(r.board_id),
+                    "project_id": str(r.project_id),
+                    "status_name": "",
+                })
+        return data
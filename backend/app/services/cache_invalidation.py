@@ -0,0 +1,56 @@
+"""Cache invalidation that reaches every worker.
+
+The caches in app.core.cache live in one process. An invalidation is applied
+locally straight away and, once the session commits, published on the
+WebSocket broker so every worker (this one included) drops the entries
+again. The second pass also stops a request racing the uncommitted change
+from re-caching the old state.
+
+Invalidations travel as ``"<kind>:<arg>"`` strings; each kind maps to a cache
+and a function building the entry predicate from ``arg``.
+"""
+import logging
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.services import event_outbox
+from app.services.websocket_manager import manager
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "internal:cache-invalidation"
+
+Predicate = Callable[[Hashable, Any], bool]
+
+_kinds: dict[str, tuple[TTLCache, Callable[[str], Predicate]]] = {}
+
+
+def register(kind: str, cache: TTLCache, matcher: Callable[[str], Predicate]) -> None:
+    """Declare an invalidation ``kind``: ``matcher(arg)`` selects the entries to drop."""
+    _kinds[kind] = (cache, matcher)
+
+
+def apply(message: str) -> None:
+    kind, arg = message.split(":", 1)
+    if kind not in _kinds:
+        logger.warning("Unknown cache invalidation %r", kind)
+        return
+    cache, matcher = _kinds[kind]
+    cache.invalidate_where(matcher(arg))
+
+
+def invalidate_after_commit(db: AsyncSession, kind: str, arg: object) -> None:
+    """Drop matching entries now, and in every worker once ``db`` commits."""
+    message = f"{kind}:{arg}"
+
+    async def publish() -> None:
+        await manager.publish_message(CHANNEL, message)
+
+    apply(message)
+    event_outbox.add(db, publish)
+
+
+manager.subscribe(CHANNEL, apply)
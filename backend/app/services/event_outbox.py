@@ -0,0 +1,91 @@
+"""Post-commit event outbox.
+
+Handlers and services record side effects (WebSocket broadcasts, webhooks,
+notification emails) on the session instead of performing them inline. The
+queued effects are dispatched in the background once the transaction commits
+and are discarded if it rolls back (or, for effects recorded inside a
+savepoint, if that savepoint rolls back), so clients never see events for
+writes that did not happen and the request never waits on delivery.
+"""
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.services.websocket_manager import BroadcastEvent, manager
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_KEY = "event_outbox"
+# Outbox length when each open savepoint began, keyed by its transaction
+SAVEPOINTS_KEY = "event_outbox_savepoints"
+
+Effect = Callable[[], Awaitable[None]]
+
+# Strong refs so dispatch tasks aren't garbage-collected mid-flight
+_background: set[asyncio.Task] = set()
+
+
+def add(db: AsyncSession, effect: Effect) -> None:
+    """Queue an async side effect to run after ``db`` commits."""
+    db.info.setdefault(OUTBOX_KEY, []).append(effect)
+
+
+def broadcast_to_board(
+    db: AsyncSession, project_id: str, board_id: str, message: dict | BroadcastEvent
+) -> None:
+    add(db, lambda: manager.broadcast_to_board(project_id, board_id, message))
+
+
+async def _dispatch(effects: list[Effect]) -> None:
+    # Sequential so clients observe events in the order they were recorded
+    for effect in effects:
+        try:
+            await effect()
+        except Exception:
+            logger.exception("Outbox effect failed")
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    effects = session.info.pop(OUTBOX_KEY, None)
+    if not effects:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.warning("No running event loop; %d outbox effects dropped", len(effects))
+        return
+    task = loop.create_task(_dispatch(effects))
+    _background.add(task)
+    task.add_done_callback(_background.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session: Session) -> None:
+    session.info.pop(OUTBOX_KEY, None)
+    session.info.pop(SAVEPOINTS_KEY, None)
+
+
+@event.listens_for(Session, "after_transaction_create")
+def _after_transaction_create(session: Session, transaction) -> None:
+    if transaction.nested:
+        marks = session.info.setdefault(SAVEPOINTS_KEY, {})
+        marks[transaction] = len(session.info.get(OUTBOX_KEY, ()))
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _after_soft_rollback(session: Session, previous_transaction) -> None:
+    # Effects recorded inside a rolled-back savepoint describe undone writes
+    mark = session.info.get(SAVEPOINTS_KEY, {}).pop(previous_transaction, None)
+    if mark is not None and OUTBOX_KEY in session.info:
+        del session.info[OUTBOX_KEY][mark:]
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _after_transaction_end(session: Session, transaction) -> None:
+    if transaction.nested:
+        session.info.get(SAVEPOINTS_KEY, {}).pop(transaction, None)
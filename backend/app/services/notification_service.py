@@ -1,48 +1,82 @@
+import gzip
 import hashlib
 import hmac
 import json
 import logging
+from dataclasses import dataclass
 from uuid import UUID
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.crud import crud_user, crud_webhook
+from app.crud import crud_user, crud_webhook, crud_webhook_delivery
 from app.models.notification import Notification
 from app.schemas.notification import NotificationPreferences, NotificationType
+from app.services import event_outbox
+from app.services.websocket_manager import BroadcastEvent
 
 logger = logging.getLogger(__name__)
 
 
+# Tracks the user set pinged after the current transaction's commit
+PING_KEY = "notification_pings"
+
+NOTIFICATION_NEW = BroadcastEvent(type="notification.new")
+
+
+@dataclass
+class NotificationDraft:
+    """One notification to create via ``create_notifications_bulk``."""
+
+    user_id: UUID
+    type: str
+    title: str
+    message: str
+    project_id: UUID | None = None
+    data: dict | None = None
+
+
 class NotificationService:
     @staticmethod
     async def get_user_prefs(db: AsyncSession, user_id: UUID) -> NotificationPreferences:
-        user = await crud_user.get(db, user_id)
+        user = await crud_user.load(db, user_id)
         raw = (user.notification_preferences or {}) if user else {}
         return NotificationPreferences(**raw)
 
     @staticmethod
-    async def should_notify(
-        db: AsyncSession,
+    def prefs_allow(
+        prefs: NotificationPreferences,
         *,
         user_id: UUID,
         actor_id: UUID,
         notification_type: str,
         project_id: UUID | None = None,
     ) -> bool:
-        prefs = await NotificationService.get_user_prefs(db, user_id)
         if not prefs.self_notifications and user_id == actor_id:
             return False
-        if notification_type in NotificationType.ALL:
-            if not getattr(prefs, notification_type, True):
-                return False
-        else:
+        if notification_type not in NotificationType.ALL:
             logger.warning("Unknown notification type: %s — defaulting to notify", notification_type)
-            if not getattr(prefs, notification_type, True):
-                return False
+        if not getattr(prefs, notification_type, True):
+            return False
         if project_id and str(project_id) in prefs.muted_projects:
             return False
         return True
 
+    @staticmethod
+    async def should_notify(
+        db: AsyncSession,
+        *,
+        user_id: UUID,
+        actor_id: UUID,
+        notification_type: str,
+        project_id: UUID | None = None,
+    ) -> bool:
+        prefs = await NotificationService.get_user_prefs(db, user_id)
+        return NotificationService.prefs_allow(
+            prefs, user_id=user_id, actor_id=actor_id,
+            notification_type=notification_type, project_id=project_id,
+        )
+
     @staticmethod
     async def create_notification(
         db: AsyncSession,
@@ -55,51 +89,103 @@ class NotificationService:
         message: str,
         data: dict | None = None,
     ) -> Notification | None:
-        if actor_id is not None:
-            should = await NotificationService.should_notify(
-                db, user_id=user_id, actor_id=actor_id,
-                notification_type=type, project_id=project_id,
-            )
-            if not should:
-                return None
-
-        notif = Notification(
-            user_id=user_id,
-            project_id=project_id,
-            type=type,
-            title=title,
-            message=message,
-            data=data,
+        created = await NotificationService.create_notifications_bulk(
+            db,
+            [NotificationDraft(
+                user_id=user_id, type=type, title=title,
+                message=message, project_id=project_id, data=data,
+            )],
+            actor_id=actor_id,
         )
-        db.add(notif)
+        return created[0] if created else None
+
+    @staticmethod
+    async def create_notifications_bulk(
+        db: AsyncSession,
+        drafts: list[NotificationDraft],
+        *,
+        actor_id: UUID | None = None,
+    ) -> list[Notification]:
+        """Create many notifications with one preferences query and one INSERT.
+
+        Recipients' preferences are checked in memory (skipped when
+        ``actor_id`` is None, as for system notifications). Each recipient
+        gets a single WebSocket ping after commit however many rows they
+        received; instant emails go out per notification.
+        """
+        if not drafts:
+            return []
+
+        users = await crud_user.load_many(db, {d.user_id for d in drafts})
+        prefs = {
+            uid: NotificationPreferences(**(user.notification_preferences or {}))
+            for uid, user in users.items()
+        }
+
+        created: list[Notification] = []
+        emails: list[tuple[str, NotificationDraft]] = []
+        for draft in drafts:
+            user_prefs = prefs.get(draft.user_id) or NotificationPreferences()
+            if actor_id is not None and not NotificationService.prefs_allow(
+                user_prefs, user_id=draft.user_id, actor_id=actor_id,
+                notification_type=draft.type, project_id=draft.project_id,
+            ):
+                continue
+            created.append(Notification(
+                user_id=draft.user_id,
+                project_id=draft.project_id,
+                type=draft.type,
+                title=draft.title,
+                message=draft.message,
+                data=draft.data,
+            ))
+            user = users.get(draft.user_id)
+            if user and user.email and user_prefs.email_enabled and user_prefs.email_digest == "instant":
+                emails.append((user.email, draft))
+
+        if not created:
+            return []
+        # Client-side UUID keys let the flush batch these into one INSERT
+        db.add_all(created)
         await db.flush()
 
-        # Broadcast real-time notification via WebSocket
-        await NotificationService._broadcast_to_user(user_id)
+        NotificationService._ping_after_commit(db, {n.user_id for n in created})
+        for to, draft in emails:
+            event_outbox.add(db, lambda to=to, draft=draft: NotificationService._dispatch_email(
+                to=to, title=draft.title,
+                message=draft.message, notification_type=draft.type,
+            ))
 
-        # trigger email if user opted in
-        prefs = await NotificationService.get_user_prefs(db, user_id)
-        if prefs.email_enabled and prefs.email_digest == "instant":
-            user = await crud_user.get(db, user_id)
-            if user and user.email:
-                NotificationService._dispatch_email(
-                    to=user.email, title=title,
-                    message=message, notification_type=type,
-                )
+        return created
+
+    @staticmethod
+    def _ping_after_commit(db: AsyncSession, user_ids: set[UUID]) -> None:
+        """Queue one ``notification.new`` per user for the current transaction."""
+        outbox = db.info.get(event_outbox.OUTBOX_KEY)
+        pending = db.info.get(PING_KEY)
+        if outbox is not None and pending is not None and pending[0] is outbox:
+            pending[1].update(user_ids)
+            return
+
+        users = set(user_ids)
 
-        return notif
+        async def ping() -> None:
+            await NotificationService._broadcast_to_users(users)
+
+        event_outbox.add(db, ping)
+        db.info[PING_KEY] = (db.info[event_outbox.OUTBOX_KEY], users)
 
     @staticmethod
-    async def _broadcast_to_user(user_id: UUID) -> None:
-        """Send notification.new event to user's WS channel."""
+    async def _broadcast_to_users(user_ids: set[UUID]) -> None:
+        """Send one notification.new event, encoded once, to each user's WS channel."""
         try:
             from app.services.websocket_manager import manager
-            await manager.broadcast_to_user(str(user_id), {"type": "notification.new"})
+            await manager.publish(NOTIFICATION_NEW, users=[str(uid) for uid in user_ids])
         except Exception:
-            logger.debug("WS broadcast failed for user %s (not connected?)", user_id)
+            logger.debug("WS broadcast failed for users %s", user_ids)
 
     @staticmethod
-    def _dispatch_email(*, to: str, title: str, message: str, notification_type: str) -> None:
+    async def _dispatch_email(*, to: str, title: str, message: str, notification_type: str) -> None:
         from app.services.email_service import (
             email_configured,
             fire_and_forget_email,
@@ -114,40 +200,91 @@ class NotificationService:
         fire_and_forget_email(to, f"AgentBoard: {title}", html)
 
     @staticmethod
-    async def send_webhook(url: str, secret: str | None, event: dict) -> None:
-        import aiohttp
+    def webhook_signature(secret: str, body: bytes) -> str:
+        return hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
 
-        payload = json.dumps(event, default=str)
-        headers = {"Content-Type": "application/json"}
+    @staticmethod
+    async def _post_signed(
+        url: str, secret: str | None, payload, headers: dict[str, str], *, compress: bool
+    ) -> int:
+        from app.services.webhook_dispatcher import webhook_dispatcher
+
+        body = json.dumps(payload, default=str).encode()
+        headers = {"Content-Type": "application/json", **headers}
         if secret:
-            sig = hmac.new(secret.encode(), payload.encode(), hashlib.sha256).hexdigest()
-            headers["X-Webhook-Signature"] = sig
+            # Signed before compression: receivers verify the decoded JSON
+            headers["X-Webhook-Signature"] = NotificationService.webhook_signature(secret, body)
+        if compress:
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+        return await webhook_dispatcher.post(url, body, headers)
 
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url, data=payload, headers=headers, timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
-                    logger.info("Webhook sent to %s: status=%s", url, resp.status)
-        except Exception:
-            logger.exception("Failed to send webhook to %s", url)
+    @staticmethod
+    async def send_webhook(
+        url: str,
+        secret: str | None,
+        event: dict,
+        *,
+        delivery_id: UUID | None = None,
+        compress: bool = False,
+    ) -> int:
+        """POST one signed event; returns the HTTP status, raises on network errors."""
+        headers = {"X-Webhook-Event": event["event"]}
+        if delivery_id:
+            # Lets receivers de-duplicate retried deliveries
+            headers["X-Webhook-Delivery"] = str(delivery_id)
+        return await NotificationService._post_signed(
+            url, secret, event, headers, compress=compress
+        )
+
+    @staticmethod
+    async def send_webhook_batch(
+        url: str, secret: str | None, events: list[dict], *, compress: bool = False
+    ) -> int:
+        """POST events as one signed JSON array of ``{id, event, data}`` objects."""
+        headers = {"X-Webhook-Event": "batch", "X-Webhook-Batch-Size": str(len(events))}
+        return await NotificationService._post_signed(
+            url, secret, events, headers, compress=compress
+        )
 
     @staticmethod
     async def notify_project_event(
         db: AsyncSession, project_id: UUID, event_type: str, data: dict
-    ) -> None:
+    ) -> int:
+        """Queue ``data`` for every subscribed webhook; returns how many."""
         webhooks = await crud_webhook.get_active_for_event(db, project_id, event_type)
-        for wh in webhooks:
-            await NotificationService.send_webhook(
-                wh.url, wh.secret, {"event": event_type, "data": data}
-            )
+        if not webhooks:
+            return 0
+        try:
+            await crud_webhook_delivery.enqueue(db, webhooks, event_type, data)
+        except IntegrityError:
+            # Another worker deleted a webhook still in this process's index;
+            # enqueue's savepoint rolled back just the failed insert
+            crud_webhook.invalidate_subscriptions(project_id)
+            webhooks = await crud_webhook.get_active_for_event(db, project_id, event_type)
+            await crud_webhook_delivery.enqueue(db, webhooks, event_type, data)
+        return len(webhooks)
 
     @staticmethod
     async def fire_webhooks(
         db: AsyncSession, project_id: UUID, event_type: str, data: dict
     ) -> None:
-        """Fire-and-forget wrapper — logs errors, never raises."""
+        """Queue webhook deliveries in ``db``'s transaction; sent after commit.
+
+        Webhooks are best-effort: a failure is logged and rolled back to a
+        savepoint so it never undoes the caller's own write.
+        """
+        from app.services.webhook_dispatcher import webhook_dispatcher
+
+        # Flush first so errors in the caller's own changes still surface
+        await db.flush()
         try:
-            await NotificationService.notify_project_event(db, project_id, event_type, data)
+            async with db.begin_nested():
+                queued = await NotificationService.notify_project_event(
+                    db, project_id, event_type, data
+                )
         except Exception:
-            logger.exception("Webhook dispatch failed for %s", event_type)
+            logger.exception("Failed to queue %s webhooks for project %s", event_type, project_id)
+            return
+        if queued:
+            event_outbox.add(db, webhook_dispatcher.wake)
@@ -5,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.crud import crud_comment, crud_reaction, crud_task, crud_user
 from app.models.reaction import Reaction
 from app.schemas.reaction import ReactionSummary, ToggleResult
-from app.services.notification_service import NotificationService
+from app.services.notification_service import NotificationDraft, NotificationService
 
 
 class ReactionService:
@@ -70,86 +70,52 @@ class ReactionService:
             task = await crud_task.get_with_relations(db, entity_id)
             if not task:
                 return
-            actor = await crud_user.get(db, actor_id)
+            actor = await crud_user.load(db, actor_id)
             actor_name = (actor.full_name or actor.username) if actor else "Someone"
-            notified: set[UUID] = set()
-            # Notify task creator
-            if task.creator_id and task.creator_id != actor_id:
-                await NotificationService.create_notification(
-                    db, user_id=task.creator_id, actor_id=actor_id,
-                    project_id=project_id, type="task_reaction",
-                    title="Reaction on Task",
-                    message=f'{actor_name} reacted {emoji} to "{task.title}"',
-                    data={"task_id": str(entity_id), "board_id": str(board_id)},
-                )
-                notified.add(task.creator_id)
-            # Notify assignees
-            for a in task.assignees:
-                if not a.user_id or a.user_id == actor_id or a.user_id in notified:
-                    continue
-                await NotificationService.create_notification(
-                    db, user_id=a.user_id, actor_id=actor_id,
-                    project_id=project_id, type="task_reaction",
-                    title="Reaction on Task",
-                    message=f'{actor_name} reacted {emoji} to "{task.title}"',
-                    data={"task_id": str(entity_id), "board_id": str(board_id)},
-                )
-                notified.add(a.user_id)
-            # Notify watchers
-            for w in task.watchers:
-                if not w.user_id or w.user_id == actor_id or w.user_id in notified:
-                    continue
-                await NotificationService.create_notification(
-                    db, user_id=w.user_id, actor_id=actor_id,
-                    project_id=project_id, type="task_reaction",
-                    title="Watching: Reaction on Task",
-                    message=f'{actor_name} reacted {emoji} to "{task.title}"',
-                    data={"task_id": str(entity_id), "board_id": str(board_id)},
-                )
+            message = f'{actor_name} reacted {emoji} to "{task.title}"'
+            recipients = [
+                # Task creator, then assignees, then watchers
+                ([task.creator_id], "Reaction on Task", message),
+                ([a.user_id for a in task.assignees], "Reaction on Task", message),
+                ([w.user_id for w in task.watchers], "Watching: Reaction on Task", message),
+            ]
+            data = {"task_id": str(entity_id), "board_id": str(board_id)}
         elif entity_type == "comment":
             comment = await crud_comment.get(db, entity_id)
             if not comment:
                 return
             task = await crud_task.get_with_relations(db, comment.task_id)
-            actor = await crud_user.get(db, actor_id)
+            actor = await crud_user.load(db, actor_id)
             actor_name = (actor.full_name or actor.username) if actor else "Someone"
-            content_text = comment.content_text if hasattr(comment, "content_text") and comment.content_text else str(comment.content)
-            preview = content_text[:50] + ("..." if len(content_text) > 50 else "")
             task_title = task.title if task else "a task"
-            notified: set[UUID] = set()
-            # Notify comment author
-            if comment.user_id and comment.user_id != actor_id:
-                await NotificationService.create_notification(
-                    db, user_id=comment.user_id, actor_id=actor_id,
-                    project_id=project_id, type="task_reaction",
-                    title="Reaction on Comment",
-                    message=f'{actor_name} reacted {emoji} to your comment on "{task_title}"',
-                    data={"task_id": str(comment.task_id), "board_id": str(board_id)},
-                )
-                notified.add(comment.user_id)
-            # Notify task assignees/watchers
+            recipients = [
+                # Comment author, then task assignees/watchers
+                ([comment.user_id], "Reaction on Comment",
+                 f'{actor_name} reacted {emoji} to your comment on "{task_title}"'),
+            ]
             if task:
-                for a in task.assignees:
-                    if not a.user_id or a.user_id == actor_id or a.user_id in notified:
-                        continue
-                    await NotificationService.create_notification(
-                        db, user_id=a.user_id, actor_id=actor_id,
-                        project_id=project_id, type="task_reaction",
-                        title="Reaction on Comment",
-                        message=f'{actor_name} reacted {emoji} to a comment on "{task_title}"',
-                        data={"task_id": str(comment.task_id), "board_id": str(board_id)},
-                    )
-                    notified.add(a.user_id)
-                for w in task.watchers:
-                    if not w.user_id or w.user_id == actor_id or w.user_id in notified:
-                        continue
-                    await NotificationService.create_notification(
-                        db, user_id=w.user_id, actor_id=actor_id,
-                        project_id=project_id, type="task_reaction",
-                        title="Watching: Reaction on Comment",
-                        message=f'{actor_name} reacted {emoji} to a comment on "{task_title}"',
-                        data={"task_id": str(comment.task_id), "board_id": str(board_id)},
-                    )
+                message = f'{actor_name} reacted {emoji} to a comment on "{task_title}"'
+                recipients += [
+                    ([a.user_id for a in task.assignees], "Reaction on Comment", message),
+                    ([w.user_id for w in task.watchers], "Watching: Reaction on Comment", message),
+                ]
+            data = {"task_id": str(comment.task_id), "board_id": str(board_id)}
+        else:
+            return
+
+        drafts: list[NotificationDraft] = []
+        notified: set[UUID] = {actor_id}
+        for user_ids, title, message in recipients:
+            for uid in user_ids:
+                if not uid or uid in notified:
+                    continue
+                notified.add(uid)
+                drafts.append(NotificationDraft(
+                    user_id=uid, type="task_reaction", title=title,
+                    message=message,
+                    project_id=project_id, data=data,
+                ))
+        await NotificationService.create_notifications_bulk(db, drafts, actor_id=actor_id)
 
     @staticmethod
     async def delete_reactions_for_entity(
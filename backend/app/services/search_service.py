@@ -0,0 +1,205 @@
+from uuid import UUID
+
+from sqlalchemy import Float, String, Uuid, and_, case, cast, func, literal, null, or_, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.search import comment_hits, highlight, like_escape, task_hits
+from app.models.board import Board
+from app.models.board_member import BoardMember
+from app.models.comment import Comment
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.task import Task
+from app.schemas.search import SearchResult
+
+SEARCH_TYPES = ("project", "board", "task", "comment")
+
+
+class SearchService:
+    @staticmethod
+    def accessible_project_ids(user_id: UUID):
+        return select(Project.id).where(
+            or_(
+                Project.owner_id == user_id,
+                Project.id.in_(
+                    select(ProjectMember.project_id).where(ProjectMember.user_id == user_id)
+                ),
+            )
+        )
+
+    @staticmethod
+    def accessible_board_ids(user_id: UUID):
+        """Boards the user may open — mirrors check_board_access."""
+        all_boards_projects = select(Project.id).where(
+            or_(
+                Project.owner_id == user_id,
+                Project.id.in_(
+                    select(ProjectMember.project_id).where(
+                        ProjectMember.user_id == user_id,
+                        ProjectMember.role == "admin",
+                    )
+                ),
+            )
+        )
+        return select(Board.id).where(
+            or_(
+                Board.project_id.in_(all_boards_projects),
+                and_(
+                    Board.project_id.in_(SearchService.accessible_project_ids(user_id)),
+                    Board.id.in_(
+                        select(BoardMember.board_id).where(BoardMember.user_id == user_id)
+                    ),
+                ),
+            )
+        )
+
+    @staticmethod
+    def name_rank(column, q: str):
+        # Name matches have no FTS score: exact > prefix > substring
+        escaped = like_escape(q)
+        return case(
+            (func.lower(column) == q.lower(), 3.0),
+            (column.ilike(f"{escaped}%", escape="\\"), 2.0),
+            else_=1.0,
+        )
+
+    @staticmethod
+    def build_query(
+        user_id: UUID,
+        q: str,
+        *,
+        types: set[str] | None = None,
+        project_id: UUID | None = None,
+    ):
+        """One UNION ALL of every requested result type, access-filtered in SQL.
+
+        ``rank`` is relative within each type: 1.0 for its best hit.
+        """
+        types = types or set(SEARCH_TYPES)
+        pattern = f"%{like_escape(q)}%"
+        projects = SearchService.accessible_project_ids(user_id)
+        boards = SearchService.accessible_board_ids(user_id)
+        no_uuid = cast(null(), Uuid)
+        no_text = cast(null(), String)
+
+        parts = []
+        if "project" in types:
+            query = select(
+                literal("project").label("type"),
+                Project.id.label("id"),
+                Project.name.label("title"),
+                no_text.label("snippet"),
+                cast(SearchService.name_rank(Project.name, q), Float).label("rank"),
+                Project.slug.label("slug"),
+                Project.id.label("project_id"),
+                no_uuid.label("board_id"),
+                no_uuid.label("task_id"),
+            ).where(Project.id.in_(projects), Project.name.ilike(pattern, escape="\\"))
+            if project_id:
+                query = query.where(Project.id == project_id)
+            parts.append(query)
+
+        if "board" in types:
+            query = select(
+                literal("board").label("type"),
+                Board.id.label("id"),
+                Board.name.label("title"),
+                no_text.label("snippet"),
+                cast(SearchService.name_rank(Board.name, q), Float).label("rank"),
+                Board.slug.label("slug"),
+                Board.project_id.label("project_id"),
+                Board.id.label("board_id"),
+                no_uuid.label("task_id"),
+            ).where(Board.id.in_(boards), Board.name.ilike(pattern, escape="\\"))
+            if project_id:
+                query = query.where(Board.project_id == project_id)
+            parts.append(query)
+
+        if "task" in types:
+            hits = task_hits(q)
+            query = (
+                select(
+                    literal("task").label("type"),
+                    Task.id.label("id"),
+                    Task.title.label("title"),
+                    cast(hits.c.snippet, String).label("snippet"),
+                    cast(hits.c.rank, Float).label("rank"),
+                    no_text.label("slug"),
+                    Task.project_id.label("project_id"),
+                    Task.board_id.label("board_id"),
+                    Task.id.label("task_id"),
+                )
+                .join(hits, hits.c.task_id == Task.id)
+                .where(Task.board_id.in_(boards))
+            )
+            if project_id:
+                query = query.where(Task.project_id == project_id)
+            parts.append(query)
+
+        if "comment" in types:
+            hits = comment_hits(q)
+            query = (
+                select(
+                    literal("comment").label("type"),
+                    Comment.id.label("id"),
+                    Task.title.label("title"),
+                    cast(hits.c.snippet, String).label("snippet"),
+                    cast(hits.c.rank, Float).label("rank"),
+                    no_text.label("slug"),
+                    Task.project_id.label("project_id"),
+                    Task.board_id.label("board_id"),
+                    Task.id.label("task_id"),
+                )
+                .join(hits, hits.c.comment_id == Comment.id)
+                .join(Task, Task.id == Comment.task_id)
+                .where(Task.board_id.in_(boards))
+            )
+            if project_id:
+                query = query.where(Task.project_id == project_id)
+            parts.append(query)
+
+        if not parts:
+            return None
+        merged = union_all(*parts).subquery("merged_results")
+        # Name ranks (1-3), bm25 and ts_rank_cd have unrelated scales, so scale
+        # each type's ranks to 0-1 by its best hit before they're interleaved
+        best = func.max(merged.c.rank).over(partition_by=merged.c.type)
+        normalized = func.coalesce(merged.c.rank / func.nullif(best, 0.0), 0.0)
+        return select(
+            *(c for c in merged.c if c.name != "rank"),
+            cast(normalized, Float).label("rank"),
+        ).subquery("search_results")
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        user_id: UUID,
+        q: str,
+        *,
+        types: set[str] | None = None,
+        project_id: UUID | None = None,
+        skip: int = 0,
+        limit: int = 20,
+        include_total: bool = True,
+    ) -> tuple[list[SearchResult], int | None]:
+        results = SearchService.build_query(user_id, q, types=types, project_id=project_id)
+        if results is None:
+            return [], 0
+
+        rows = await db.execute(
+            select(results)
+            .order_by(results.c.rank.desc(), results.c.type, results.c.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        items = [
+            SearchResult.model_validate({**row, "snippet": highlight(row["snippet"])})
+            for row in rows.mappings()
+        ]
+
+        total = None
+        if include_total:
+            total = (
+                await db.execute(select(func.count()).select_from(results))
+            ).scalar_one()
+        return items, total
@@ -1,4 +1,5 @@
 import re
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from uuid import UUID
 
@@ -13,7 +14,7 @@ from app.models.task_label import TaskLabel
 from app.models.task_watcher import TaskWatcher
 from app.schemas.task import TaskCreate, TaskUpdate
 from app.services.content_service import extract_mentions, extract_plain_text, normalize_content
-from app.services.notification_service import NotificationService
+from app.services.notification_service import NotificationDraft, NotificationService
 from app.services.position_service import PositionService
 
 
@@ -144,23 +145,11 @@ async def _notify_watchers(
 ) -> list[UUID]:
     """Send notifications to all user-watchers (skipping assignees to avoid dups). Returns notified user IDs."""
     assignee_uids = _get_assignee_user_ids(task)
-    notified: list[UUID] = []
-    for w in task.watchers:
-        if not w.user_id:
-            continue
-        if w.user_id in assignee_uids:
-            continue
-        await NotificationService.create_notification(
-            db,
-            user_id=w.user_id,
-            actor_id=actor_id,
-            project_id=task.project_id,
-            type=notification_type,
-            title=title,
-            message=message,
-            data={"task_id": str(task.id), "board_id": str(task.board_id)},
-        )
-        notified.append(w.user_id)
+    notified = [
+        w.user_id for w in task.watchers
+        if w.user_id and w.user_id not in assignee_uids
+    ]
+    await _notify_users(db, task, actor_id, notified, notification_type, title, message)
     return notified
 
 
@@ -173,22 +162,86 @@ async def _notify_assignees(
     message: str,
 ) -> list[UUID]:
     """Notify all user-assignees. Returns notified user IDs."""
-    notified: list[UUID] = []
-    for a in task.assignees:
-        if not a.user_id:
+    notified = [a.user_id for a in task.assignees if a.user_id]
+    await _notify_users(db, task, actor_id, notified, notification_type, title, message)
+    return notified
+
+
+async def _notify_users(
+    db: AsyncSession,
+    task: Task,
+    actor_id: UUID,
+    user_ids: Iterable[UUID],
+    notification_type: str,
+    title: str,
+    message: str,
+) -> None:
+    """Send the same task notification to each user in one batch."""
+    data = {"task_id": str(task.id), "board_id": str(task.board_id)}
+    await NotificationService.create_notifications_bulk(
+        db,
+        [
+            NotificationDraft(
+                user_id=uid, type=notification_type, title=title,
+                message=message, project_id=task.project_id, data=data,
+            )
+            for uid in user_ids
+        ],
+        actor_id=actor_id,
+    )
+
+
+def _in_request_order(tasks: Iterable[Task], task_ids: list[UUID]) -> list[Task]:
+    order = {task_id: i for i, task_id in enumerate(task_ids)}
+    return sorted(tasks, key=lambda t: order[t.id])
+
+
+async def _notify_bulk(
+    db: AsyncSession,
+    tasks: list[Task],
+    actor_id: UUID,
+    notification_type: str,
+    title: str,
+    verb: str,
+) -> None:
+    """Send each assignee/watcher one notification summarising a bulk operation."""
+    if not tasks:
+        return
+    actor = await crud_user.load(db, actor_id)
+    actor_name = (actor.full_name or actor.username) if actor else "Someone"
+
+    assigned: dict[UUID, list[Task]] = {}
+    watched: dict[UUID, list[Task]] = {}
+    for task in tasks:
+        for uid in _get_assignee_user_ids(task):
+            assigned.setdefault(uid, []).append(task)
+        for w in task.watchers:
+            if w.user_id:
+                watched.setdefault(w.user_id, []).append(task)
+
+    board_id = str(tasks[0].board_id)
+    drafts: list[NotificationDraft] = []
+    for uid in assigned.keys() | watched.keys():
+        if uid == actor_id:
             continue
-        await NotificationService.create_notification(
-            db,
-            user_id=a.user_id,
-            actor_id=actor_id,
-            project_id=task.project_id,
+        seen: dict[UUID, Task] = {t.id: t for t in watched.get(uid, [])}
+        seen.update({t.id: t for t in assigned.get(uid, [])})
+        user_tasks = list(seen.values())
+        data: dict = {"task_ids": [str(t.id) for t in user_tasks], "board_id": board_id}
+        if len(user_tasks) == 1:
+            data["task_id"] = str(user_tasks[0].id)
+            message = f'{actor_name} {verb} "{user_tasks[0].title}"'
+        else:
+            message = f"{actor_name} {verb} {len(user_tasks)} tasks"
+        drafts.append(NotificationDraft(
+            user_id=uid,
             type=notification_type,
-            title=title,
+            title=title if uid in assigned else f"Watching: {title}",
             message=message,
-            data={"task_id": str(task.id), "board_id": str(task.board_id)},
-        )
-        notified.append(a.user_id)
-    return notified
+            project_id=tasks[0].project_id,
+            data=data,
+        ))
+    await NotificationService.create_notifications_bulk(db, drafts, actor_id=actor_id)
 
 
 class TaskService:
@@ -244,7 +297,7 @@ class TaskService:
             status_id = default_status.id
         else:
             # Validate status belongs to this board
-            target_status = await crud_status.get(db, status_id)
+            target_status = await crud_status.load(db, status_id)
             if not target_status or target_status.board_id != board_id:
                 raise NotFoundError("Status not found in this board")
 
@@ -255,14 +308,15 @@ class TaskService:
             position = await PositionService.get_end_position(db, status_id)
 
         # Validate agent IDs belong to project and are active
+        await crud_agent.load_many(db, [agent_creator_id, *task_in.assignee_agent_ids])
         if agent_creator_id:
-            agent = await crud_agent.get(db, agent_creator_id)
+            agent = await crud_agent.load(db, agent_creator_id)
             if not agent or agent.deleted_at or not agent.is_active:
                 raise ValidationError("Invalid or inactive agent creator")
             if not await crud_agent.is_in_project(db, agent.id, project_id):
                 raise ValidationError("Agent creator not in this project")
         for aid in task_in.assignee_agent_ids:
-            agent = await crud_agent.get(db, aid)
+            agent = await crud_agent.load(db, aid)
             if not agent or agent.deleted_at or not agent.is_active:
                 raise ValidationError("Invalid or inactive assignee agent")
             if not await crud_agent.is_in_project(db, agent.id, project_id):
@@ -305,7 +359,7 @@ class TaskService:
             )
 
         creation_changes: dict = {"title": task.title}
-        status_obj = await crud_status.get(db, status_id)
+        status_obj = await crud_status.load(db, status_id)
         if status_obj:
             creation_changes["status"] = status_obj.name
         if task_in.priority and task_in.priority != "none":
@@ -332,7 +386,7 @@ class TaskService:
         task = await crud_task.get_with_relations(db, task.id)
 
         if task and task.assignees:
-            creator = await crud_user.get(db, creator_id)
+            creator = await crud_user.load(db, creator_id)
             creator_name = (creator.full_name or creator.username) if creator else "Someone"
             await _notify_assignees(
                 db, task, creator_id,
@@ -341,7 +395,7 @@ class TaskService:
             )
 
         if task and task.watchers:
-            creator = await crud_user.get(db, creator_id)
+            creator = await crud_user.load(db, creator_id)
             creator_name = (creator.full_name or creator.username) if creator else "Someone"
             await _notify_watchers(
                 db, task, creator_id,
@@ -352,28 +406,20 @@ class TaskService:
         # Notify @mentioned users in description
         if desc_doc and task:
             user_mentions = extract_mentions(desc_doc, {"user"})
-            creator = await crud_user.get(db, creator_id)
+            creator = await crud_user.load(db, creator_id)
             creator_name = (creator.full_name or creator.username) if creator else "Someone"
-            for m in user_mentions:
-                uid = UUID(m["id"])
-                if uid == creator_id:
-                    continue
-                await NotificationService.create_notification(
-                    db,
-                    user_id=uid,
-                    actor_id=creator_id,
-                    project_id=project_id,
-                    type="mentioned",
-                    title="Mentioned in Task",
-                    message=f'{creator_name} mentioned you in "{task.title}"',
-                    data={"task_id": str(task.id), "board_id": str(task.board_id)},
-                )
+            mentioned = {UUID(m["id"]) for m in user_mentions} - {creator_id}
+            await _notify_users(
+                db, task, creator_id, mentioned,
+                "mentioned", "Mentioned in Task",
+                f'{creator_name} mentioned you in "{task.title}"',
+            )
 
         # Notify parent task's assignees/watchers about new subtask
         if task_in.parent_id and task:
             parent_with_rels = await crud_task.get_with_relations(db, task_in.parent_id)
             if parent_with_rels:
-                creator = await crud_user.get(db, creator_id)
+                creator = await crud_user.load(db, creator_id)
                 creator_name = (creator.full_name or creator.username) if creator else "Someone"
                 await _notify_assignees(
                     db, parent_with_rels, creator_id,
@@ -403,6 +449,16 @@ class TaskService:
         assignee_user_ids = update_data.pop("assignee_user_ids", None)
         assignee_agent_ids = update_data.pop("assignee_agent_ids", None)
 
+        # Batch the lookups below into one IN (...) query per model
+        await crud_user.load_many(
+            db, [user_id, *(watcher_user_ids or []), *(assignee_user_ids or [])]
+        )
+        await crud_agent.load_many(db, [*(watcher_agent_ids or []), *(assignee_agent_ids or [])])
+        if "status_id" in update_data:
+            await crud_status.load_many(db, [task.status_id, update_data["status_id"]])
+        if label_ids:
+            await crud_label.load_many(db, label_ids)
+
         # Cover validation
         if "cover_type" in update_data:
             ct = update_data.get("cover_type")
@@ -454,8 +510,8 @@ class TaskService:
             old_value = getattr(task, field, None)
             if old_value != value:
                 if field == "status_id":
-                    old_s = await crud_status.get(db, old_value) if old_value else None
-                    new_s = await crud_status.get(db, value) if value else None
+                    old_s = await crud_status.load(db, old_value) if old_value else None
+                    new_s = await crud_status.load(db, value) if value else None
                     changes[field] = {
                         "old": old_s.name if old_s else None,
                         "new": new_s.name if new_s else None,
@@ -475,7 +531,7 @@ class TaskService:
             if old_label_ids != new_label_set:
                 label_diff: dict = {"added": [], "removed": []}
                 for lid in new_label_set - old_label_ids:
-                    lbl = await crud_label.get(db, lid)
+                    lbl = await crud_label.load(db, lid)
                     label_diff["added"].append(lbl.name if lbl else str(lid))
                 for lid in old_label_ids - new_label_set:
                     tl_obj = next((tl for tl in task.labels if tl.label_id == lid), None)
@@ -497,10 +553,10 @@ class TaskService:
             if old_wuids != new_wuids or old_waids != new_waids:
                 watcher_diff: dict = {"added": [], "removed": []}
                 for uid in new_wuids - old_wuids:
-                    u = await crud_user.get(db, uid)
+                    u = await crud_user.load(db, uid)
                     watcher_diff["added"].append({"type": "user", "name": (u.full_name or u.username) if u else str(uid)})
                 for aid in new_waids - old_waids:
-                    a = await crud_agent.get(db, aid)
+                    a = await crud_agent.load(db, aid)
                     watcher_diff["added"].append({"type": "agent", "name": a.name if a else str(aid)})
                 for uid in old_wuids - new_wuids:
                     obj = next((w for w in task.watchers if w.user_id == uid), None)
@@ -518,24 +574,28 @@ class TaskService:
             )
             # Notify newly added/removed watchers
             if old_wuids != new_wuids:
-                actor = await crud_user.get(db, user_id)
+                actor = await crud_user.load(db, user_id)
                 actor_name = (actor.full_name or actor.username) if actor else "Someone"
-                for uid in new_wuids - old_wuids:
-                    await NotificationService.create_notification(
-                        db, user_id=uid, actor_id=user_id,
-                        project_id=task.project_id, type="watcher_added",
-                        title="Watching Task",
-                        message=f'{actor_name} added you as watcher on "{task.title}"',
-                        data={"task_id": str(task.id), "board_id": str(task.board_id)},
-                    )
-                for uid in old_wuids - new_wuids:
-                    await NotificationService.create_notification(
-                        db, user_id=uid, actor_id=user_id,
-                        project_id=task.project_id, type="watcher_removed",
-                        title="Removed from Watchers",
-                        message=f'{actor_name} removed you from watchers on "{task.title}"',
-                        data={"task_id": str(task.id), "board_id": str(task.board_id)},
-                    )
+                data = {"task_id": str(task.id), "board_id": str(task.board_id)}
+                await NotificationService.create_notifications_bulk(
+                    db,
+                    [
+                        NotificationDraft(
+                            user_id=uid, type="watcher_added", title="Watching Task",
+                            message=f'{actor_name} added you as watcher on "{task.title}"',
+                            project_id=task.project_id, data=data,
+                        )
+                        for uid in new_wuids - old_wuids
+                    ] + [
+                        NotificationDraft(
+                            user_id=uid, type="watcher_removed", title="Removed from Watchers",
+                            message=f'{actor_name} removed you from watchers on "{task.title}"',
+                            project_id=task.project_id, data=data,
+                        )
+                        for uid in old_wuids - new_wuids
+                    ],
+                    actor_id=user_id,
+                )
 
         assignees_changed = assignee_user_ids is not None or assignee_agent_ids is not None
         if assignees_changed:
@@ -546,7 +606,7 @@ class TaskService:
             new_aaids = set(assignee_agent_ids or [])
             # Validate agent IDs
             for aid in (assignee_agent_ids or []):
-                agent = await crud_agent.get(db, aid)
+                agent = await crud_agent.load(db, aid)
                 if not agent or agent.deleted_at or not agent.is_active:
                     raise ValidationError("Invalid or inactive assignee agent")
                 if not await crud_agent.is_in_project(db, agent.id, task.project_id):
@@ -554,10 +614,10 @@ class TaskService:
             if old_auids != new_auids or old_aaids != new_aaids:
                 assignee_diff: dict = {"added": [], "removed": []}
                 for uid in new_auids - old_auids:
-                    u = await crud_user.get(db, uid)
+                    u = await crud_user.load(db, uid)
                     assignee_diff["added"].append({"type": "user", "name": (u.full_name or u.username) if u else str(uid)})
                 for aid in new_aaids - old_aaids:
-                    a = await crud_agent.get(db, aid)
+                    a = await crud_agent.load(db, aid)
                     assignee_diff["added"].append({"type": "agent", "name": a.name if a else str(aid)})
                 for uid in old_auids - new_auids:
                     obj = next((a for a in task.assignees if a.user_id == uid), None)
@@ -575,24 +635,28 @@ class TaskService:
             )
             # Notify newly added/removed assignees
             if old_auids != new_auids:
-                actor = await crud_user.get(db, user_id)
+                actor = await crud_user.load(db, user_id)
                 actor_name = (actor.full_name or actor.username) if actor else "Someone"
-                for uid in new_auids - old_auids:
-                    await NotificationService.create_notification(
-                        db, user_id=uid, actor_id=user_id,
-                        project_id=task.project_id, type="assignee_added",
-                        title="Task Assigned",
-                        message=f'{actor_name} assigned you to "{task.title}"',
-                        data={"task_id": str(task.id), "board_id": str(task.board_id)},
-                    )
-                for uid in old_auids - new_auids:
-                    await NotificationService.create_notification(
-                        db, user_id=uid, actor_id=user_id,
-                        project_id=task.project_id, type="assignee_removed",
-                        title="Unassigned from Task",
-                        message=f'{actor_name} removed you from "{task.title}"',
-                        data={"task_id": str(task.id), "board_id": str(task.board_id)},
-                    )
+                data = {"task_id": str(task.id), "board_id": str(task.board_id)}
+                await NotificationService.create_notifications_bulk(
+                    db,
+                    [
+                        NotificationDraft(
+                            user_id=uid, type="assignee_added", title="Task Assigned",
+                            message=f'{actor_name} assigned you to "{task.title}"',
+                            project_id=task.project_id, data=data,
+                        )
+                        for uid in new_auids - old_auids
+                    ] + [
+                        NotificationDraft(
+                            user_id=uid, type="assignee_removed", title="Unassigned from Task",
+                            message=f'{actor_name} removed you from "{task.title}"',
+                            project_id=task.project_id, data=data,
+                        )
+                        for uid in old_auids - new_auids
+                    ],
+                    actor_id=user_id,
+                )
 
         if update_data:
             db.add(task)
@@ -615,7 +679,7 @@ class TaskService:
         refreshed = await crud_task.get_with_relations(db, task.id)
 
         if has_changes and refreshed:
-            updater = await crud_user.get(db, user_id)
+            updater = await crud_user.load(db, user_id)
             updater_name = (updater.full_name or updater.username) if updater else "Someone"
             non_assignee_changes = {k: v for k, v in changes.items() if k not in ("assignees", "watchers")}
 
@@ -641,7 +705,7 @@ class TaskService:
         if has_changes and refreshed and refreshed.parent_id:
             parent_with_rels = await crud_task.get_with_relations(db, refreshed.parent_id)
             if parent_with_rels:
-                updater = updater or await crud_user.get(db, user_id)
+                updater = updater or await crud_user.load(db, user_id)
                 updater_name = (updater.full_name or updater.username) if updater else "Someone"
                 detail = _describe_changes(changes)
                 await _notify_assignees(
@@ -657,22 +721,14 @@ class TaskService:
 
         # Notify newly @mentioned users
         if newly_mentioned_ids:
-            mention_updater = await crud_user.get(db, user_id)
+            mention_updater = await crud_user.load(db, user_id)
             mention_updater_name = (mention_updater.full_name or mention_updater.username) if mention_updater else "Someone"
-            for uid_str in newly_mentioned_ids:
-                uid = UUID(uid_str)
-                if uid == user_id:
-                    continue
-                await NotificationService.create_notification(
-                    db,
-                    user_id=uid,
-                    actor_id=user_id,
-                    project_id=task.project_id,
-                    type="mentioned",
-                    title="Mentioned in Task",
-                    message=f'{mention_updater_name} mentioned you in "{task.title}"',
-                    data={"task_id": str(task.id), "board_id": str(task.board_id)},
-                )
+            mentioned = {UUID(uid_str) for uid_str in newly_mentioned_ids} - {user_id}
+            await _notify_users(
+                db, task, user_id, mentioned,
+                "mentioned", "Mentioned in Task",
+                f'{mention_updater_name} mentioned you in "{task.title}"',
+            )
 
         task_id = task.id
         await db.commit()
@@ -695,19 +751,20 @@ class TaskService:
         old_status_id = task.status_id
         task.status_id = new_status_id
         task.position = position
+        await crud_status.load_many(db, [old_status_id, new_status_id])
 
-        new_status = await crud_status.get(db, new_status_id)
+        new_status = await crud_status.load(db, new_status_id)
         if new_status and new_status.is_terminal:
             task.completed_at = datetime.now(UTC)
         elif task.completed_at:
-            old_status = await crud_status.get(db, old_status_id)
+            old_status = await crud_status.load(db, old_status_id)
             if old_status and old_status.is_terminal:
                 task.completed_at = None
 
         db.add(task)
         await db.flush()
 
-        old_status = await crud_status.get(db, old_status_id)
+        old_status = await crud_status.load(db, old_status_id)
         await crud_activity_log.log(
             db,
             project_id=task.project_id,
@@ -723,7 +780,7 @@ class TaskService:
             },
         )
 
-        mover = await crud_user.get(db, user_id)
+        mover = await crud_user.load(db, user_id)
         mover_name = (mover.full_name or mover.username) if mover else "Someone"
         new_status_name = new_status.name if new_status else "another status"
 
@@ -776,7 +833,7 @@ class TaskService:
         result = await db.execute(
             select(Task).where(Task.id.in_(task_ids), Task.project_id == project_id)
         )
-        tasks = list(result.scalars().all())
+        tasks = _in_request_order(result.scalars().all(), task_ids)
         for task in tasks:
             for field, value in updates.items():
                 if hasattr(task, field):
@@ -792,6 +849,13 @@ class TaskService:
                 changes=updates,
             )
         await db.flush()
+
+        tasks = await crud_task.get_many_with_relations(db, [t.id for t in tasks])
+        count = len(tasks)
+        await _notify_bulk(
+            db, tasks, user_id,
+            "task_updated", "Tasks Updated" if count > 1 else "Task Updated", "updated",
+        )
         return tasks
 
     @staticmethod
@@ -810,7 +874,7 @@ class TaskService:
         result = await db.execute(
             select(Task).where(Task.id.in_(task_ids), Task.project_id == project_id)
         )
-        tasks = list(result.scalars().all())
+        tasks = _in_request_order(result.scalars().all(), task_ids)
         base_position = await PositionService.get_end_position(db, status_id)
         for i, task in enumerate(tasks):
             task.status_id = status_id
@@ -826,8 +890,50 @@ class TaskService:
                 changes={"status_id": str(status_id)},
             )
         await db.flush()
+
+        tasks = await crud_task.get_many_with_relations(db, [t.id for t in tasks])
+        count = len(tasks)
+        await _notify_bulk(
+            db, tasks, user_id,
+            "task_moved", "Tasks Moved" if count > 1 else "Task Moved", "moved",
+        )
         return tasks
 
+    @staticmethod
+    async def bulk_delete(
+        db: AsyncSession,
+        board_id: UUID,
+        user_id: UUID,
+        task_ids: list[UUID],
+    ) -> list[UUID]:
+        """Delete tasks on a board. Returns the IDs that were actually deleted."""
+        tasks = [
+            t for t in await crud_task.get_many_with_relations(db, task_ids)
+            if t.board_id == board_id
+        ]
+        for task in tasks:
+            await crud_activity_log.log(
+                db,
+                project_id=task.project_id,
+                user_id=user_id,
+                action="deleted",
+                entity_type="task",
+                task_id=None,
+                changes={"title": task.title},
+            )
+
+        count = len(tasks)
+        await _notify_bulk(
+            db, tasks, user_id,
+            "task_deleted", "Tasks Deleted" if count > 1 else "Task Deleted", "deleted",
+        )
+
+        deleted_ids = [t.id for t in tasks]
+        for task in tasks:
+            await db.delete(task)
+        await db.flush()
+        return deleted_ids
+
     @staticmethod
     async def delete_task_with_strategy(
         db: AsyncSession,
@@ -879,31 +985,25 @@ class TaskService:
         )
 
         # Notify assignees and watchers before deletion
-        deleter = await crud_user.get(db, user_id)
+        deleter = await crud_user.load(db, user_id)
         deleter_name = (deleter.full_name or deleter.username) if deleter else "Someone"
         notified: set[UUID] = set()
-        for a in task.assignees:
-            if not a.user_id or a.user_id == user_id:
-                continue
-            await NotificationService.create_notification(
-                db, user_id=a.user_id, actor_id=user_id,
-                project_id=task.project_id, type="task_deleted",
-                title="Task Deleted",
-                message=f'{deleter_name} deleted "{task_title}"',
-                data={"task_id": str(task.id), "board_id": str(task.board_id)},
-            )
-            notified.add(a.user_id)
-        for w in task.watchers:
-            if not w.user_id or w.user_id in notified or w.user_id == user_id:
-                continue
-            await NotificationService.create_notification(
-                db, user_id=w.user_id, actor_id=user_id,
-                project_id=task.project_id, type="task_deleted",
-                title="Watching: Task Deleted",
-                message=f'{deleter_name} deleted "{task_title}"',
-                data={"task_id": str(task.id), "board_id": str(task.board_id)},
-            )
-            notified.add(w.user_id)
+        drafts: list[NotificationDraft] = []
+        data = {"task_id": str(task.id), "board_id": str(task.board_id)}
+        for title, people in (
+            ("Task Deleted", task.assignees),
+            ("Watching: Task Deleted", task.watchers),
+        ):
+            for p in people:
+                if not p.user_id or p.user_id in notified or p.user_id == user_id:
+                    continue
+                drafts.append(NotificationDraft(
+                    user_id=p.user_id, type="task_deleted", title=title,
+                    message=f'{deleter_name} deleted "{task_title}"',
+                    project_id=task.project_id, data=data,
+                ))
+                notified.add(p.user_id)
+        await NotificationService.create_notifications_bulk(db, drafts, actor_id=user_id)
 
         # Notify parent task stakeholders if this was a subtask
         if task.parent_id:
@@ -960,7 +1060,7 @@ class TaskService:
         # Notify new parent's assignees/watchers
         parent_with_rels = await crud_task.get_with_relations(db, parent_id)
         if parent_with_rels:
-            actor = await crud_user.get(db, user_id)
+            actor = await crud_user.load(db, user_id)
             actor_name = (actor.full_name or actor.username) if actor else "Someone"
             await _notify_assignees(
                 db, parent_with_rels, user_id,
@@ -1010,7 +1110,7 @@ class TaskService:
         if old_parent:
             old_parent_with_rels = await crud_task.get_with_relations(db, old_parent.id)
             if old_parent_with_rels:
-                actor = await crud_user.get(db, user_id)
+                actor = await crud_user.load(db, user_id)
                 actor_name = (actor.full_name or actor.username) if actor else "Someone"
                 await _notify_assignees(
                     db, old_parent_with_rels, user_id,
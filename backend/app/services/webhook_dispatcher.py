@@ -0,0 +1,302 @@
+"""Durable webhook delivery.
+
+Events are written to ``webhook_deliveries`` in the same transaction as the
+change that produced them (``NotificationService.fire_webhooks``), so API
+requests never wait on customer endpoints. This dispatcher delivers them in
+the background over one pooled ``aiohttp`` session, keeping at most
+``WEBHOOK_WORKERS`` requests in flight and ``WEBHOOK_MAX_PER_ENDPOINT`` per
+URL, so one slow endpoint cannot hold up the others. Failures are retried
+with exponential backoff and every attempt's outcome is recorded on the
+delivery row.
+
+Webhooks with a ``batch_window_seconds`` get their events as one JSON array
+per POST: an event waits out the window (see ``crud_webhook_delivery.enqueue``)
+unless ``batch_max_size`` events pile up first, and the whole batch is then
+claimed, sent and retried together.
+
+A claimed delivery is leased by pushing its ``next_attempt_at`` past the
+request timeout; if the process dies mid-request the row simply becomes due
+again and is retried.
+"""
+import asyncio
+import logging
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.crud import crud_webhook_delivery
+from app.models.webhook import Webhook
+from app.models.webhook_delivery import WebhookDelivery
+
+logger = logging.getLogger(__name__)
+
+PURGE_INTERVAL = 3600.0
+
+
+@dataclass
+class _Claim:
+    delivery_ids: list[UUID]
+    attempts: int
+    events: list[dict]
+    url: str
+    secret: str | None
+    batch: bool
+    compress: bool
+
+    @property
+    def label(self) -> str:
+        if self.batch:
+            return f"batch of {len(self.events)}"
+        return self.events[0]["event"]
+
+
+class WebhookDispatcher:
+    def __init__(
+        self,
+        *,
+        workers: int,
+        per_endpoint: int,
+        timeout: float,
+        max_attempts: int,
+        retry_base: float,
+        retry_max: float,
+        poll_interval: float,
+        retention_days: int,
+    ):
+        self.workers = workers
+        self.per_endpoint = per_endpoint
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.poll_interval = poll_interval
+        self.retention = timedelta(days=retention_days)
+        self._client = None
+        self._wake = asyncio.Event()
+        self._in_flight: dict[str, int] = defaultdict(int)
+        self._deliveries: set[asyncio.Task] = set()
+        self._task: asyncio.Task | None = None
+        self._last_purge = 0.0
+
+    async def start(self) -> None:
+        import aiohttp
+
+        self._client = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.workers, limit_per_host=self.per_endpoint
+            ),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._deliveries:
+            # Unfinished deliveries are retried once their lease expires
+            await asyncio.wait(self._deliveries, timeout=self.timeout)
+        if self._client:
+            await self._client.close()
+            self._client = None
+
+    async def wake(self) -> None:
+        """Look for due deliveries now instead of at the next poll."""
+        self._wake.set()
+
+    async def post(self, url: str, body: bytes, headers: dict[str, str]) -> int:
+        """POST through the shared connection pool; returns the HTTP status."""
+        import aiohttp
+
+        if self._client is None:
+            # Outside the app lifecycle (scripts, shell): one-off session
+            async with aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as client:
+                async with client.post(url, data=body, headers=headers) as resp:
+                    return resp.status
+        async with self._client.post(url, data=body, headers=headers) as resp:
+            return resp.status
+
+    def backoff(self, attempts: int) -> float:
+        delay = min(self.retry_base * 2 ** (attempts - 1), self.retry_max)
+        # Jitter so endpoints recovering from an outage aren't hit in lockstep
+        return delay * random.uniform(0.8, 1.2)
+
+    async def _run(self) -> None:
+        while True:
+            self._wake.clear()
+            try:
+                await self._dispatch_due()
+                await self._purge()
+            except Exception:
+                logger.exception("Webhook dispatch pass failed")
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _dispatch_due(self) -> None:
+        free = self.workers - len(self._deliveries)
+        if free <= 0:
+            return
+        now = datetime.now(UTC)
+        lease = timedelta(seconds=self.timeout * 2)
+        claimed: list[_Claim] = []
+        async with async_session() as db:
+            # Over-fetch so deliveries to saturated endpoints don't starve the rest
+            due = await crud_webhook_delivery.get_due(db, now, limit=free * 4)
+            batching = {w.id: w for w in await crud_webhook_delivery.get_full_batches(db)}
+            claims: dict[str, int] = defaultdict(int)
+
+            def has_room(url: str) -> bool:
+                return (
+                    len(claimed) < free
+                    and self._in_flight[url] + claims[url] < self.per_endpoint
+                )
+
+            for delivery, webhook in due:
+                if webhook.batch_window_seconds:
+                    batching.setdefault(webhook.id, webhook)
+                    continue
+                if not has_room(webhook.url):
+                    continue
+                claims[webhook.url] += 1
+                claimed.append(self._claim(webhook, [delivery], now + lease, batch=False))
+
+            for webhook in batching.values():
+                if not has_room(webhook.url):
+                    continue
+                deliveries = await crud_webhook_delivery.get_batch(
+                    db, webhook.id, now, limit=webhook.batch_max_size
+                )
+                if deliveries:
+                    claims[webhook.url] += 1
+                    claimed.append(self._claim(webhook, deliveries, now + lease, batch=True))
+            await db.commit()
+
+        for claim in claimed:
+            self._in_flight[claim.url] += 1
+            task = asyncio.create_task(self._deliver(claim))
+            self._deliveries.add(task)
+            task.add_done_callback(lambda t, url=claim.url: self._finished(t, url))
+
+    @staticmethod
+    def _claim(
+        webhook: Webhook,
+        deliveries: list[WebhookDelivery],
+        lease_until: datetime,
+        *,
+        batch: bool,
+    ) -> _Claim:
+        for delivery in deliveries:
+            delivery.attempts += 1
+            delivery.next_attempt_at = lease_until
+        return _Claim(
+            delivery_ids=[d.id for d in deliveries],
+            attempts=max(d.attempts for d in deliveries),
+            events=[
+                {"id": str(d.id), "event": d.event_type, "data": d.payload}
+                for d in deliveries
+            ],
+            url=webhook.url,
+            secret=webhook.secret,
+            batch=batch,
+            compress=webhook.compress,
+        )
+
+    def _finished(self, task: asyncio.Task, url: str) -> None:
+        self._deliveries.discard(task)
+        self._in_flight[url] -= 1
+        if not self._in_flight[url]:
+            del self._in_flight[url]
+        # A slot opened up; pick up whatever is waiting for it
+        self._wake.set()
+
+    async def _deliver(self, claim: _Claim) -> None:
+        from app.services.notification_service import NotificationService
+
+        started = time.monotonic()
+        response_status: int | None = None
+        error: str | None = None
+        try:
+            if claim.batch:
+                response_status = await NotificationService.send_webhook_batch(
+                    claim.url, claim.secret, claim.events, compress=claim.compress
+                )
+            else:
+                event = claim.events[0]
+                response_status = await NotificationService.send_webhook(
+                    claim.url,
+                    claim.secret,
+                    {"event": event["event"], "data": event["data"]},
+                    delivery_id=claim.delivery_ids[0],
+                    compress=claim.compress,
+                )
+            if not 200 <= response_status < 300:
+                error = f"HTTP {response_status}"
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+
+        now = datetime.now(UTC)
+        values: dict = {
+            "response_status": response_status,
+            "error": error,
+            "duration_ms": int((time.monotonic() - started) * 1000),
+        }
+        if error is None:
+            values.update(status="delivered", delivered_at=now)
+            logger.info("Webhook %s delivered to %s", claim.label, claim.url)
+        elif claim.attempts >= self.max_attempts:
+            values.update(status="failed")
+            logger.warning(
+                "Webhook %s to %s failed after %d attempts: %s",
+                claim.label, claim.url, claim.attempts, error,
+            )
+        else:
+            values.update(next_attempt_at=now + timedelta(seconds=self.backoff(claim.attempts)))
+            logger.info(
+                "Webhook %s to %s failed (attempt %d), retrying: %s",
+                claim.label, claim.url, claim.attempts, error,
+            )
+
+        try:
+            async with async_session() as db:
+                await crud_webhook_delivery.record_attempt(db, claim.delivery_ids, **values)
+                await db.commit()
+        except Exception:
+            # The lease expires and the delivery is retried
+            logger.exception("Failed to record webhook delivery %s", claim.delivery_ids)
+
+    async def _purge(self) -> None:
+        if time.monotonic() - self._last_purge < PURGE_INTERVAL:
+            return
+        self._last_purge = time.monotonic()
+        async with async_session() as db:
+            purged = await crud_webhook_delivery.purge_finished(
+                db, datetime.now(UTC) - self.retention
+            )
+            await db.commit()
+        if purged:
+            logger.info("Purged %d old webhook deliveries", purged)
+
+
+webhook_dispatcher = WebhookDispatcher(
+    workers=settings.WEBHOOK_WORKERS,
+    per_endpoint=settings.WEBHOOK_MAX_PER_ENDPOINT,
+    timeout=settings.WEBHOOK_TIMEOUT,
+    max_attempts=settings.WEBHOOK_MAX_ATTEMPTS,
+    retry_base=settings.WEBHOOK_RETRY_BASE,
+    retry_max=settings.WEBHOOK_RETRY_MAX,
+    poll_interval=settings.WEBHOOK_POLL_INTERVAL,
+    retention_days=settings.WEBHOOK_DELIVERY_RETENTION_DAYS,
+)
@@ -1,13 +1,301 @@
+import asyncio
 import json
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
 
 from fastapi import WebSocket
+from pydantic import BaseModel
 
+from app.core.config import settings
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+DeliverFn = Callable[[str, str], Awaitable[None]]
+
+# Backoff between Redis resubscribe attempts, in seconds
+RECONNECT_MIN_DELAY = 0.5
+RECONNECT_MAX_DELAY = 30.0
+
+
+# Datetimes and dataclasses go through ``default=str`` as with json.dumps,
+# instead of orjson's native (ISO "T"-separated / dict) encodings
+ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None else 0
+)
+
+
+def dumps(obj: Any) -> str:
+    """JSON-encode with orjson when installed, stdlib json otherwise.
+
+    Both produce the same values (``json.dumps(obj, default=str)``); orjson
+    only omits insignificant whitespace and doesn't escape non-ASCII text.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=ORJSON_OPTIONS).decode()
+    return json.dumps(obj, default=str)
+
+
+@dataclass
+class BroadcastEvent:
+    """A WebSocket event that is serialized once and reused for every channel.
+
+    ``data`` may be a Pydantic model (or a list of them), in which case it is
+    dumped straight to JSON by Pydantic instead of via an intermediate dict.
+    """
+
+    type: str
+    data: Any = None
+    project_id: str | None = None
+    board_id: str | None = None
+    user: dict | None = None
+    extra: dict = field(default_factory=dict)
+    _encoded: str | None = field(default=None, init=False, repr=False)
+
+    def encode(self) -> str:
+        if self._encoded is None:
+            head: dict[str, Any] = {"type": self.type}
+            if self.project_id is not None:
+                head["project_id"] = self.project_id
+            if self.board_id is not None:
+                head["board_id"] = self.board_id
+            head.update(self.extra)
+            if self.user is not None:
+                head["user"] = self.user
+            encoded = dumps(head)
+            if self.data is not None:
+                if isinstance(self.data, BaseModel):
+                    data_json = self.data.model_dump_json()
+                elif isinstance(self.data, list) and self.data and isinstance(self.data[0], BaseModel):
+                    data_json = f'[{",".join(m.model_dump_json() for m in self.data)}]'
+                else:
+                    data_json = dumps(self.data)
+                # Splice pre-encoded data into the envelope's closing brace
+                encoded = f'{encoded[:-1]},"data":{data_json}}}'
+            self._encoded = encoded
+        return self._encoded
+
+
+class InMemoryBroker:
+    """Single-process broker — publishes straight back to the local manager.
+
+    Used for development, tests, and single-worker deployments.
+    """
 
-class ConnectionManager:
     def __init__(self):
+        self._deliver: DeliverFn | None = None
+
+    async def start(self, deliver: DeliverFn) -> None:
+        self._deliver = deliver
+
+    async def stop(self) -> None:
+        self._deliver = None
+
+    async def publish(self, key: str, payload: str) -> None:
+        if self._deliver:
+            await self._deliver(key, payload)
+
+
+class RedisBroker:
+    """Redis pub/sub broker — fans every broadcast out to all workers.
+
+    Each worker publishes once to a shared channel and delivers whatever it
+    receives to the sockets it holds locally.
+    """
+
+    def __init__(self, url: str, channel: str):
+        self.url = url
+        self.channel = channel
+        self._redis = None
+        self._pubsub = None
+        self._listener: asyncio.Task | None = None
+
+    async def start(self, deliver: DeliverFn) -> None:
+        import redis.asyncio as aioredis
+
+        self._redis = aioredis.from_url(self.url, decode_responses=True)
+        await self._subscribe()
+        self._listener = asyncio.create_task(self._listen(deliver))
+
+    async def stop(self) -> None:
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._pubsub:
+            await self._pubsub.unsubscribe(self.channel)
+            await self._pubsub.aclose()
+            self._pubsub = None
+        if self._redis:
+            await self._redis.aclose()
+            self._redis = None
+
+    async def publish(self, key: str, payload: str) -> None:
+        # Keys never contain newlines, so "key\npayload" avoids re-encoding
+        await self._redis.publish(self.channel, f"{key}\n{payload}")
+
+    async def _subscribe(self) -> None:
+        self._pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.subscribe(self.channel)
+
+    async def _drop_subscription(self) -> None:
+        pubsub, self._pubsub = self._pubsub, None
+        if pubsub is not None:
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
+
+    async def _listen(self, deliver: DeliverFn) -> None:
+        """Deliver channel messages, resubscribing whenever the connection drops.
+
+        Without this a Redis restart would silently stop cross-worker
+        broadcasts until the process restarted.
+        """
+        delay = RECONNECT_MIN_DELAY
+        while True:
+            try:
+                if self._pubsub is None:
+                    await self._subscribe()
+                    logger.info("Resubscribed to broker channel %s", self.channel)
+                async for raw in self._pubsub.listen():
+                    delay = RECONNECT_MIN_DELAY
+                    try:
+                        key, payload = raw["data"].split("\n", 1)
+                        await deliver(key, payload)
+                    except Exception:
+                        logger.exception("Failed to deliver broker message")
+                logger.warning("Broker subscription to %s ended", self.channel)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Broker subscription to %s lost", self.channel)
+            await self._drop_subscription()
+            # Broadcasts published meanwhile are missed; clients resync on reconnect
+            logger.warning("Reconnecting to broker in %.1fs", delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+
+def _build_broker() -> InMemoryBroker | RedisBroker:
+    if settings.WS_BROKER == "redis":
+        return RedisBroker(settings.REDIS_URL, settings.WS_BROKER_CHANNEL)
+    return InMemoryBroker()
+
+
+SYNC_REQUIRED = BroadcastEvent(type="sync.required").encode()
+
+
+class _ClientConnection:
+    """Outbound side of one socket: a bounded queue drained by its own writer.
+
+    Broadcasts only enqueue, so a slow client never blocks the caller. When
+    the queue is full the configured policy decides what happens:
+    ``drop_oldest`` discards the oldest pending frame, ``coalesce`` collapses
+    the backlog into a single ``sync.required`` frame, and ``disconnect``
+    closes the socket.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        on_dead: Callable[["_ClientConnection"], None],
+        *,
+        max_queue: int,
+        policy: str,
+        send_timeout: float,
+    ):
+        self.websocket = websocket
+        self.keys: set[str] = set()
+        self.policy = policy
+        self.send_timeout = send_timeout
+        self.closed = False
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=max_queue)
+        self._on_dead = on_dead
+        self._writer = asyncio.create_task(self._drain())
+        self._closer: asyncio.Task | None = None
+
+    def enqueue(self, msg: str) -> None:
+        if self.closed:
+            return
+        try:
+            self._queue.put_nowait(msg)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        if self.policy == "disconnect":
+            logger.info("Closing slow WebSocket client (queue full)")
+            self._on_dead(self)
+            self._closer = asyncio.create_task(self._close_socket())
+        elif self.policy == "coalesce":
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(SYNC_REQUIRED)
+        else:
+            self._queue.get_nowait()
+            self._queue.put_nowait(msg)
+
+    def close(self) -> None:
+        self.closed = True
+        self._writer.cancel()
+
+    async def _drain(self) -> None:
+        while True:
+            msg = await self._queue.get()
+            try:
+                await asyncio.wait_for(
+                    self.websocket.send_text(msg), timeout=self.send_timeout
+                )
+            except Exception:
+                self._on_dead(self)
+                return
+
+    async def _close_socket(self) -> None:
+        try:
+            await self.websocket.close(code=1013)
+        except Exception:
+            pass
+
+
+class ConnectionManager:
+    def __init__(self, broker: InMemoryBroker | RedisBroker | None = None):
         self.active_connections: dict[str, set[WebSocket]] = {}
+        self.broker = broker or InMemoryBroker()
+        self._clients: dict[WebSocket, _ClientConnection] = {}
+        self._handlers: dict[str, Callable[[str], None]] = {}
+        self._started = False
+
+    async def start(self) -> None:
+        await self.broker.start(self._deliver_local)
+        self._started = True
+
+    async def stop(self) -> None:
+        await self.broker.stop()
+        self._started = False
 
     async def connect(self, key: str, websocket: WebSocket) -> None:
+        client = self._clients.get(websocket)
+        if client is None:
+            client = _ClientConnection(
+                websocket,
+                self._drop_client,
+                max_queue=settings.WS_SEND_QUEUE_SIZE,
+                policy=settings.WS_SLOW_CLIENT_POLICY,
+                send_timeout=settings.WS_SEND_TIMEOUT,
+            )
+            self._clients[websocket] = client
+        client.keys.add(key)
         if key not in self.active_connections:
             self.active_connections[key] = set()
         self.active_connections[key].add(websocket)
@@ -17,35 +305,91 @@ class ConnectionManager:
             self.active_connections[key].discard(websocket)
             if not self.active_connections[key]:
                 del self.active_connections[key]
+        client = self._clients.get(websocket)
+        if client:
+            client.keys.discard(key)
+            if not client.keys:
+                del self._clients[websocket]
+                client.close()
 
-    async def _broadcast(self, key: str, message: dict) -> None:
-        if key not in self.active_connections:
+    def _drop_client(self, client: _ClientConnection) -> None:
+        for key in list(client.keys):
+            self.disconnect(key, client.websocket)
+
+    def send_personal(self, websocket: WebSocket, message: dict) -> None:
+        """Queue a message for one socket (goes through its writer, like broadcasts)."""
+        client = self._clients.get(websocket)
+        if client:
+            client.enqueue(dumps(message))
+
+    def subscribe(self, key: str, handler: Callable[[str], None]) -> None:
+        """Handle messages published on ``key`` in every worker instead of sending them to sockets."""
+        self._handlers[key] = handler
+
+    async def publish_message(self, key: str, msg: str) -> None:
+        """Publish a raw message to the ``subscribe`` handlers of all workers."""
+        await self._publish(key, msg)
+
+    async def _deliver_local(self, key: str, msg: str) -> None:
+        handler = self._handlers.get(key)
+        if handler is not None:
+            handler(msg)
             return
-        dead: set[WebSocket] = set()
-        msg = json.dumps(message, default=str)
-        for ws in self.active_connections[key]:
-            try:
-                await ws.send_text(msg)
-            except Exception:
-                dead.add(ws)
-        for ws in dead:
-            self.disconnect(key, ws)
+        for ws in list(self.active_connections.get(key, ())):
+            client = self._clients.get(ws)
+            if client:
+                client.enqueue(msg)
+
+    async def _publish(self, key: str, msg: str) -> None:
+        if not self._started:
+            # Broker not running (e.g. scripts, startup) — deliver locally only
+            await self._deliver_local(key, msg)
+            return
+        try:
+            await self.broker.publish(key, msg)
+        except Exception:
+            logger.exception("Broker publish failed for %s — delivering locally", key)
+            await self._deliver_local(key, msg)
+
+    async def _broadcast(self, key: str, message: dict | BroadcastEvent) -> None:
+        if isinstance(message, BroadcastEvent):
+            msg = message.encode()
+        else:
+            msg = dumps(message)
+        await self._publish(key, msg)
+
+    async def publish(
+        self,
+        event: BroadcastEvent,
+        *,
+        boards: Iterable[tuple[str, str]] = (),
+        projects: Iterable[str] = (),
+        users: Iterable[str] = (),
+    ) -> None:
+        """Send one event to several channels, encoding it only once."""
+        msg = event.encode()
+        for project_id, board_id in boards:
+            await self._publish(f"{project_id}:{board_id}", msg)
+        for project_id in projects:
+            await self._publish(project_id, msg)
+        for user_id in users:
+            await self._publish(f"user:{user_id}", msg)
 
     async def broadcast_to_board(
-        self, project_id: str, board_id: str, message: dict
+        self, project_id: str, board_id: str, message: dict | BroadcastEvent
     ) -> None:
         key = f"{project_id}:{board_id}"
         await self._broadcast(key, message)
 
     async def broadcast_to_project(
-        self, project_id: str, message: dict
+        self, project_id: str, message: dict | BroadcastEvent
     ) -> None:
         await self._broadcast(project_id, message)
 
     async def broadcast_to_user(
-        self, user_id: str, message: dict
+        self, user_id: str, message: dict | BroadcastEvent
     ) -> None:
         await self._broadcast(f"user:{user_id}", message)
 
 
-manager = ConnectionManager()
+manager = ConnectionManager(_build_broker())
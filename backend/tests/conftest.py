@@ -0,0 +1,102 @@
+import os
+
+# Settings are read at import time, so point the app at a throwaway database
+# before anything under app/ is imported
+os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///:memory:"
+os.environ["WS_BROKER"] = "memory"
+
+import asyncio
+
+import pytest
+from sqlalchemy import event
+
+from app.core.database import Base, async_session, engine, init_db
+from app.crud import crud_webhook
+from app.models import Board, Project, Status, Task, User
+from app.services import event_outbox
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _enforce_foreign_keys(dbapi_connection, _record) -> None:
+    # Off by default in SQLite; on here so tests see what PostgreSQL does
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+@pytest.fixture
+async def db():
+    await init_db()
+    crud_webhook.invalidate_subscriptions()
+    async with async_session() as session:
+        yield session
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+
+async def drain_outbox() -> None:
+    """Wait for post-commit outbox effects that have been dispatched."""
+    while event_outbox._background:
+        await asyncio.gather(*event_outbox._background)
+
+
+def make_user(name: str) -> User:
+    return User(email=f"{name}@example.com", username=name, password_hash="x")
+
+
+@pytest.fixture
+async def client(db):
+    from httpx import ASGITransport, AsyncClient
+
+    from app.main import app
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+def auth_headers(user: User) -> dict[str, str]:
+    from app.core.security import create_access_token
+
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+
+@pytest.fixture
+async def user(db) -> User:
+    user = make_user("owner")
+    db.add(user)
+    await db.commit()
+    return user
+
+
+@pytest.fixture
+async def project(db, user) -> Project:
+    project = Project(name="Board", slug="board", owner_id=user.id)
+    db.add(project)
+    await db.commit()
+    return project
+
+
+@pytest.fixture
+async def status(db, project) -> Status:
+    board = Board(project_id=project.id, name="Main", slug="main")
+    db.add(board)
+    await db.flush()
+    status = Status(project_id=project.id, board_id=board.id, name="Todo", slug="todo", position=0)
+    db.add(status)
+    await db.commit()
+    return status
+
+
+async def add_task(db, status: Status, title: str, description: str | None = None) -> Task:
+    project = await db.get(Project, status.project_id)
+    task = Task(
+        project_id=status.project_id,
+        board_id=status.board_id,
+        status_id=status.id,
+        title=title,
+        description_text=description,
+        creator_id=project.owner_id,
+    )
+    db.add(task)
+    await db.commit()
+    return task
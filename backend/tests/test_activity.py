@@ -0,0 +1,21 @@
+from app.crud import crud_activity_log
+from app.schemas.activity_log import ActivityLogResponse
+
+from .conftest import add_task
+
+
+async def test_activity_pages_load_their_users(db, status, user):
+    task = await add_task(db, status, "Task")
+    await crud_activity_log.log(
+        db, project_id=task.project_id, task_id=task.id, user_id=user.id,
+        action="created", entity_type="task", changes={},
+    )
+    await db.commit()
+    db.expunge_all()
+
+    for entries in (
+        await crud_activity_log.get_multi_by_task(db, task.id),
+        await crud_activity_log.get_multi_by_project(db, task.project_id),
+    ):
+        [entry] = [ActivityLogResponse.model_validate(e) for e in entries]
+        assert entry.user.username == user.username
@@ -0,0 +1,38 @@
+from app.core.security import hash_api_key
+from app.crud import crud_api_key
+from app.models import APIKey
+from app.services.api_key_usage import APIKeyUsageTracker
+
+
+async def test_flush_writes_all_pending_timestamps(db, user):
+    keys = [
+        APIKey(user_id=user.id, key_hash=hash_api_key(name), name=name, prefix=name)
+        for name in ("one", "two", "unused")
+    ]
+    db.add_all(keys)
+    await db.commit()
+    tracker = APIKeyUsageTracker(interval=60)
+    tracker.touch(keys[0].id)
+    tracker.touch(keys[1].id)
+
+    await tracker.flush()
+
+    for key in keys:
+        await db.refresh(key)
+    assert keys[0].last_used_at is not None
+    assert keys[1].last_used_at is not None
+    assert keys[2].last_used_at is None
+    assert tracker._pending == {}
+
+
+async def test_failed_flush_drops_the_batch(db, user, monkeypatch):
+    async def fail(*_args):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(crud_api_key, "bulk_update_last_used", fail)
+    tracker = APIKeyUsageTracker(interval=60)
+    tracker.touch(user.id)
+
+    await tracker.flush()
+
+    assert tracker._pending == {}
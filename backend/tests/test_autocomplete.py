@@ -0,0 +1,34 @@
+import uuid
+
+from app.services.autocomplete_service import AutocompleteService, _mention_indexes
+
+from .conftest import add_task, drain_outbox
+
+
+async def test_task_references_match_substrings(db, status, user):
+    await add_task(db, status, "Fix dashboard layout")
+    await add_task(db, status, "Board cleanup")
+
+    data = await AutocompleteService.referenceables(db, status.project_id, user.id, "board")
+    titles = [t["title"] for t in data["tasks"]]
+    # Word-prefix hit ranks ahead of the substring-only match
+    assert titles == ["Board cleanup", "Fix dashboard layout"]
+
+
+async def test_invalidate_drops_one_project_or_all(db):
+    project_id, other_id = uuid.uuid4(), uuid.uuid4()
+    _mention_indexes.set(project_id, "index")
+    _mention_indexes.set(other_id, "index")
+
+    AutocompleteService.invalidate(db, project_id)
+    assert _mention_indexes.get(project_id) is None
+    assert _mention_indexes.get(other_id) == "index"
+
+    # Re-cached by a request racing the uncommitted change
+    _mention_indexes.set(project_id, "stale")
+    await db.commit()
+    await drain_outbox()
+    assert _mention_indexes.get(project_id) is None
+
+    AutocompleteService.invalidate(db)
+    assert len(_mention_indexes) == 0
@@ -0,0 +1,102 @@
+import pytest
+from sqlalchemy import select
+
+from app.core.security import hash_api_key
+from app.models import Agent, AgentProject, APIKey, Task, WebhookDelivery
+from app.services.websocket_manager import manager
+
+from .conftest import add_task, auth_headers, drain_outbox
+from .test_webhooks import add_webhook
+
+
+@pytest.fixture
+def broadcasts(monkeypatch) -> list:
+    sent = []
+
+    async def broadcast_to_board(project_id, board_id, message):
+        sent.append(message)
+
+    monkeypatch.setattr(manager, "broadcast_to_board", broadcast_to_board)
+    return sent
+
+
+@pytest.fixture
+async def tasks(db, status) -> list[Task]:
+    return [await add_task(db, status, f"Task {i}") for i in range(3)]
+
+
+@pytest.fixture
+async def agent_headers(db, user, project) -> dict[str, str]:
+    agent = Agent(name="Builder", color="#336699", created_by=user.id)
+    db.add(agent)
+    await db.flush()
+    db.add(AgentProject(agent_id=agent.id, project_id=project.id))
+    db.add(APIKey(
+        user_id=user.id, agent_id=agent.id, key_hash=hash_api_key("agent-key"),
+        name="builder", prefix="ab_test",
+    ))
+    await db.commit()
+    return {"X-API-Key": "agent-key"}
+
+
+def url(status, action: str) -> str:
+    return f"/api/v1/projects/{status.project_id}/boards/{status.board_id}/tasks/{action}"
+
+
+async def test_bulk_update_keeps_request_order(client, user, status, tasks, broadcasts):
+    ids = [str(tasks[2].id), str(tasks[0].id)]
+    response = await client.post(
+        url(status, "bulk-update"),
+        json={"task_ids": ids, "updates": {"priority": "high"}},
+        headers=auth_headers(user),
+    )
+    await drain_outbox()
+
+    assert response.status_code == 200
+    assert [t["id"] for t in response.json()["data"]] == ids
+    assert all(t["priority"] == "high" for t in response.json()["data"])
+    [event] = broadcasts
+    assert event.type == "task.bulk_updated"
+    assert event.user == {"id": str(user.id), "username": user.username}
+
+
+async def test_bulk_move_by_agent_is_attributed_to_agent(
+    client, db, project, status, tasks, broadcasts, agent_headers
+):
+    await add_webhook(db, project, events=["task.bulk_moved"])
+    ids = [str(tasks[1].id), str(tasks[0].id)]
+    response = await client.post(
+        url(status, "bulk-move"),
+        json={"task_ids": ids, "status_id": str(status.id)},
+        headers=agent_headers,
+    )
+    await drain_outbox()
+
+    assert response.status_code == 200
+    assert [t["id"] for t in response.json()["data"]] == ids
+    [event] = broadcasts
+    assert event.type == "task.bulk_moved"
+    assert event.user["agent"]["name"] == "Builder"
+    [delivery] = (await db.execute(select(WebhookDelivery))).scalars().all()
+    assert delivery.event_type == "task.bulk_moved"
+    assert delivery.payload["task_ids"] == ids
+
+
+async def test_bulk_delete(client, db, user, status, tasks, broadcasts):
+    ids = [str(tasks[0].id), str(tasks[2].id)]
+    response = await client.post(
+        url(status, "bulk-delete"), json={"task_ids": ids}, headers=auth_headers(user)
+    )
+    await drain_outbox()
+
+    assert response.status_code == 204
+    remaining = (await db.execute(select(Task.id))).scalars().all()
+    assert remaining == [tasks[1].id]
+    [event] = broadcasts
+    assert event.data == {"task_ids": ids}
+
+
+def test_bulk_task_events_are_subscribable():
+    from app.api.v1.webhooks import VALID_EVENTS
+
+    assert {"task.bulk_updated", "task.bulk_moved", "task.bulk_deleted"} <= VALID_EVENTS
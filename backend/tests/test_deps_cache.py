@@ -0,0 +1,63 @@
+import uuid
+
+from app.api.deps import access_cache, actor_cache, invalidate_api_key, invalidate_project_access
+from app.services import cache_invalidation
+from app.services.websocket_manager import manager
+
+from .conftest import drain_outbox
+
+
+async def test_project_access_invalidated_now_and_after_commit(db):
+    project_id, other_id = uuid.uuid4(), uuid.uuid4()
+    access_cache.set(("user:1", project_id, None), True)
+    access_cache.set(("user:1", other_id, None), True)
+
+    invalidate_project_access(db, project_id)
+    assert access_cache.get(("user:1", project_id, None)) is None
+
+    # A request racing the uncommitted change re-caches the old grant
+    access_cache.set(("user:2", project_id, None), True)
+    await db.commit()
+    await drain_outbox()
+
+    assert access_cache.get(("user:2", project_id, None)) is None
+    assert access_cache.get(("user:1", other_id, None))
+    access_cache.clear()
+
+
+async def test_invalidation_after_rollback_is_not_repeated(db):
+    project_id = uuid.uuid4()
+    invalidate_project_access(db, project_id)
+    access_cache.set(("user:1", project_id, None), True)
+    await db.rollback()
+    await drain_outbox()
+
+    assert access_cache.get(("user:1", project_id, None))
+    access_cache.clear()
+
+
+async def test_revocation_reaches_other_workers(db, monkeypatch):
+    published = []
+
+    async def publish_message(key, msg):
+        published.append((key, msg))
+
+    monkeypatch.setattr(manager, "publish_message", publish_message)
+    invalidate_api_key(db, "abc")
+    await db.commit()
+    await drain_outbox()
+    assert published == [(cache_invalidation.CHANNEL, "api_key:abc")]
+
+    # What another worker does when the broker delivers the message
+    actor_cache.set(("api_key", "abc"), object())
+    await manager._deliver_local(*published[0])
+    assert actor_cache.get(("api_key", "abc")) is None
+
+
+async def test_member_removal_reaches_other_workers(db):
+    project_id = uuid.uuid4()
+    access_cache.set(("user:1", project_id, "board"), True)
+
+    await manager._deliver_local(cache_invalidation.CHANNEL, f"project_access:{project_id}")
+
+    assert access_cache.get(("user:1", project_id, "board")) is None
@@ -0,0 +1,70 @@
+from app.services import event_outbox
+
+from .conftest import drain_outbox, make_user
+
+
+def recorder(log: list, name: str):
+    async def effect() -> None:
+        log.append(name)
+
+    return effect
+
+
+async def test_effects_run_only_after_commit(db):
+    ran = []
+    db.add(make_user("dave"))
+    event_outbox.add(db, recorder(ran, "created"))
+    await db.flush()
+    await drain_outbox()
+    assert ran == []
+
+    await db.commit()
+    await drain_outbox()
+    assert ran == ["created"]
+
+
+async def test_effects_are_dropped_on_rollback(db):
+    ran = []
+    db.add(make_user("erin"))
+    await db.flush()
+    event_outbox.add(db, recorder(ran, "created"))
+    await db.rollback()
+    await db.commit()
+    await drain_outbox()
+    assert ran == []
+
+
+async def test_effects_survive_released_savepoints(db):
+    ran = []
+    db.add(make_user("frank"))
+    event_outbox.add(db, recorder(ran, "outer"))
+    async with db.begin_nested():
+        db.add(make_user("grace"))
+        event_outbox.add(db, recorder(ran, "released"))
+
+    try:
+        async with db.begin_nested():
+            db.add(make_user("heidi"))
+            event_outbox.add(db, recorder(ran, "undone"))
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    event_outbox.add(db, recorder(ran, "after"))
+
+    await db.commit()
+    await drain_outbox()
+    assert ran == ["outer", "released", "after"]
+
+
+async def test_failing_effect_does_not_block_later_ones(db):
+    ran = []
+
+    async def broken() -> None:
+        raise RuntimeError("socket closed")
+
+    db.add(make_user("ivan"))
+    event_outbox.add(db, broken)
+    event_outbox.add(db, recorder(ran, "next"))
+    await db.commit()
+    await drain_outbox()
+    assert ran == ["next"]
@@ -0,0 +1,11 @@
+from app.core.config import settings
+
+
+async def test_pool_stats_are_opt_in(client, monkeypatch):
+    assert (await client.get("/health/db")).status_code == 404
+
+    monkeypatch.setattr(settings, "DB_POOL_STATS", True)
+    response = await client.get("/health/db")
+
+    assert response.status_code == 200
+    assert "primary" in response.json()["pools"]
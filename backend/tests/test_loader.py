@@ -0,0 +1,59 @@
+import uuid
+
+from sqlalchemy import event
+
+from app.crud.loader import get_loader
+from app.models import User
+
+from .conftest import make_user
+
+
+def test_app_imports():
+    from app.main import app
+
+    assert app.title == "AgentBoard API"
+
+
+async def test_load_many_batches_and_memoizes(db):
+    alice, bob = make_user("alice"), make_user("bob")
+    db.add_all([alice, bob])
+    await db.commit()
+    db.expunge_all()
+
+    statements = []
+    sync_engine = db.bind.sync_engine
+
+    def count(_conn, _cursor, statement, *_args):
+        # Selectin relationships load alongside; only count user lookups
+        if statement.lstrip().startswith("SELECT users."):
+            statements.append(statement)
+
+    event.listen(sync_engine, "before_cursor_execute", count)
+    try:
+        missing = uuid.uuid4()
+        loader = get_loader(db)
+        rows = await loader.load_many(User, [alice.id, bob.id, missing, None])
+        assert set(rows) == {alice.id, bob.id}
+        assert len(statements) == 1
+
+        # Memoized, misses included
+        assert (await loader.load(User, missing)) is None
+        assert (await loader.load(User, alice.id)).username == "alice"
+        assert len(statements) == 1
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", count)
+
+
+async def test_load_reuses_session_identity_map(db):
+    carol = make_user("carol")
+    db.add(carol)
+    await db.flush()
+
+    assert (await get_loader(db).load(User, carol.id)) is carol
+
+
+async def test_rollback_drops_loader(db):
+    loader = get_loader(db)
+    await loader.load(User, uuid.uuid4())
+    await db.rollback()
+    assert get_loader(db) is not loader
@@ -0,0 +1,75 @@
+from sqlalchemy import select
+
+from app.crud import crud_task
+from app.models import Notification, TaskAssignee, TaskWatcher
+from app.services.notification_service import NotificationDraft, NotificationService
+from app.services.task_service import _notify_bulk
+
+from .conftest import add_task, drain_outbox, make_user
+
+
+async def test_bulk_create_filters_by_prefs_and_pings_each_user_once(db, project, user, monkeypatch):
+    pings, emails = [], []
+
+    async def broadcast_to_users(user_ids):
+        pings.append(set(user_ids))
+
+    async def dispatch_email(*, to, **_kwargs):
+        emails.append(to)
+
+    monkeypatch.setattr(NotificationService, "_broadcast_to_users", broadcast_to_users)
+    monkeypatch.setattr(NotificationService, "_dispatch_email", dispatch_email)
+    alice, bob, carol = make_user("alice"), make_user("bob"), make_user("carol")
+    bob.notification_preferences = {"task_moved": False, "email_enabled": True, "email_digest": "instant"}
+    carol.notification_preferences = {"muted_projects": [str(project.id)]}
+    db.add_all([alice, bob, carol])
+    await db.flush()
+
+    def draft(recipient, type_="task_assigned"):
+        return NotificationDraft(
+            user_id=recipient.id, type=type_, title="t", message="m", project_id=project.id
+        )
+
+    await NotificationService.create_notifications_bulk(
+        db, [draft(alice), draft(bob, "task_moved"), draft(carol)], actor_id=user.id
+    )
+    await NotificationService.create_notifications_bulk(
+        db, [draft(alice), draft(bob)], actor_id=user.id
+    )
+    # System notifications (no actor) ignore preferences
+    await NotificationService.create_notifications_bulk(db, [draft(carol)])
+    await db.commit()
+    await drain_outbox()
+
+    recipients = (await db.execute(select(Notification.user_id))).scalars().all()
+    assert sorted(recipients) == sorted([alice.id, alice.id, bob.id, carol.id])
+    assert pings == [{alice.id, bob.id, carol.id}]
+    assert emails == [bob.email]
+
+
+async def test_bulk_operation_sends_one_summary_per_recipient(db, status, user):
+    alice, bob = make_user("alice"), make_user("bob")
+    db.add_all([alice, bob])
+    tasks = [await add_task(db, status, f"Task {i}") for i in range(3)]
+    db.add_all([
+        TaskAssignee(task_id=tasks[0].id, user_id=alice.id),
+        TaskAssignee(task_id=tasks[1].id, user_id=alice.id),
+        TaskWatcher(task_id=tasks[1].id, user_id=alice.id),
+        TaskWatcher(task_id=tasks[2].id, user_id=bob.id),
+        TaskAssignee(task_id=tasks[2].id, user_id=user.id),
+    ])
+    await db.commit()
+    loaded = await crud_task.get_many_with_relations(db, [t.id for t in tasks])
+
+    await _notify_bulk(db, loaded, user.id, "task_moved", "Tasks moved", "moved")
+    await db.commit()
+
+    notes = {
+        n.user_id: n for n in (await db.execute(select(Notification))).scalars().all()
+    }
+    assert set(notes) == {alice.id, bob.id}
+    assert notes[alice.id].message == f"{user.username} moved 2 tasks"
+    assert notes[alice.id].title == "Tasks moved"
+    assert sorted(notes[alice.id].data["task_ids"]) == sorted([str(tasks[0].id), str(tasks[1].id)])
+    assert notes[bob.id].title == "Watching: Tasks moved"
+    assert notes[bob.id].data["task_id"] == str(tasks[2].id)
@@ -0,0 +1,45 @@
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+import pytest
+
+from app.core.errors import ValidationError
+from app.core.pagination import decode_cursor, encode_cursor, next_cursor, total_pages
+
+
+@dataclass
+class Row:
+    created_at: datetime
+    id: uuid.UUID
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 10, 17, 9, 30, 15, 123456, tzinfo=UTC)
+    row_id = uuid.uuid4()
+    cursor = encode_cursor(created_at, row_id, 2.5)
+    assert "=" not in cursor
+    assert decode_cursor(cursor, (datetime, uuid.UUID, float)) == (created_at, row_id, 2.5)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["not-a-cursor", "", "W10", encode_cursor("yesterday", "x"), encode_cursor(1)],
+)
+def test_bad_cursors_raise_validation_error(cursor):
+    with pytest.raises(ValidationError):
+        decode_cursor(cursor, (datetime, uuid.UUID))
+
+
+def test_next_cursor_only_for_full_pages():
+    rows = [Row(datetime.now(UTC), uuid.uuid4()) for _ in range(3)]
+    assert next_cursor(rows, 4, "created_at", "id") is None
+    assert next_cursor([], 3, "created_at", "id") is None
+    cursor = next_cursor(rows, 3, "created_at", "id")
+    assert decode_cursor(cursor, (datetime, uuid.UUID)) == (rows[-1].created_at, rows[-1].id)
+
+
+def test_total_pages():
+    assert total_pages(None, 20) is None
+    assert total_pages(0, 20) == 0
+    assert total_pages(41, 20) == 3
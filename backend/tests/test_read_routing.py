@@ -0,0 +1,59 @@
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, select, text
+
+from app.core.database import RoutingSession, engine
+from app.middleware.read_your_writes import (
+    READ_PRIMARY_COOKIE,
+    READ_PRIMARY_HEADER,
+    ReadYourWritesMiddleware,
+    wants_primary,
+)
+from app.models import User
+
+
+def test_routing_session_pins_writes_to_primary():
+    for clause in (delete(User), text("UPDATE users SET role = 'user'"), text("  pragma optimize")):
+        session = RoutingSession()
+        assert session.get_bind(clause=clause) is engine.sync_engine
+        assert session.info["wrote"]
+
+    for clause in (select(User), text("select 1")):
+        session = RoutingSession()
+        session.get_bind(clause=clause)
+        assert not session.info.get("wrote")
+
+
+def test_write_responses_carry_read_primary_marker():
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware)
+
+    @app.get("/items")
+    async def read():
+        return {}
+
+    @app.post("/items")
+    async def write():
+        return {}
+
+    client = TestClient(app)
+    assert READ_PRIMARY_HEADER not in client.get("/items").headers
+    response = client.post("/items")
+    assert float(response.headers[READ_PRIMARY_HEADER]) > time.time()
+    assert READ_PRIMARY_COOKIE in response.cookies
+
+
+def test_wants_primary():
+    class FakeRequest:
+        def __init__(self, headers=None, cookies=None):
+            self.headers = headers or {}
+            self.cookies = cookies or {}
+
+    future, past = str(time.time() + 5), str(time.time() - 5)
+    assert wants_primary(FakeRequest(headers={READ_PRIMARY_HEADER: future}))
+    assert wants_primary(FakeRequest(cookies={READ_PRIMARY_COOKIE: future}))
+    assert not wants_primary(FakeRequest(cookies={READ_PRIMARY_COOKIE: past}))
+    assert not wants_primary(FakeRequest(headers={READ_PRIMARY_HEADER: "garbage"}))
+    assert not wants_primary(FakeRequest())
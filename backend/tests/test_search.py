@@ -0,0 +1,88 @@
+from app.core.database import engine
+from sqlalchemy import select
+
+from app.core.search import SQLITE_FTS_TRIGGERS, ensure_search_schema, highlight, task_hits
+from app.crud import crud_task
+from app.models import Comment, Project
+from app.services.search_service import SearchService
+
+from .conftest import add_task
+
+
+def test_highlight_escapes_content():
+    assert highlight("<b>\x02x\x03</b>") == "&lt;b&gt;<mark>x</mark>&lt;/b&gt;"
+    assert highlight(None) is None
+
+
+async def test_task_snippet_is_escaped(db, status, user):
+    task = await add_task(db, status, "Deploy <script> pipeline")
+
+    results, total = await SearchService.search(db, user.id, "pipeline", types={"task"})
+    assert total == 1
+    assert results[0].id == task.id
+    assert "&lt;script&gt;" in results[0].snippet
+    assert "<mark>pipeline</mark>" in results[0].snippet
+
+
+async def test_fts_follows_updates_and_deletes(db, status, user):
+    task = await add_task(db, status, "Old title")
+    db.add(Comment(task_id=task.id, user_id=user.id, content={}, content_text="needle in comment"))
+    task.title = "Fresh title"
+    await db.commit()
+
+    assert (await SearchService.search(db, user.id, "old", types={"task"}))[1] == 0
+    assert (await SearchService.search(db, user.id, "fresh", types={"task"}))[1] == 1
+    assert (await SearchService.search(db, user.id, "needle", types={"comment"}))[1] == 1
+
+    await db.delete(task)
+    await db.commit()
+    assert (await SearchService.search(db, user.id, "fresh", types={"task"}))[1] == 0
+
+
+async def test_rowid_keyed_tables_are_rebuilt(db, status, user):
+    await add_task(db, status, "Legacy pipeline")
+    async with engine.begin() as conn:
+        for trigger in SQLITE_FTS_TRIGGERS:
+            await conn.exec_driver_sql(f"DROP TRIGGER {trigger}")
+        await conn.exec_driver_sql("DROP TABLE tasks_fts")
+        await conn.exec_driver_sql(
+            "CREATE VIRTUAL TABLE tasks_fts USING fts5(title, description_text, content='tasks')"
+        )
+        await conn.run_sync(ensure_search_schema)
+
+    assert (await SearchService.search(db, user.id, "legacy", types={"task"}))[1] == 1
+
+
+async def test_ranks_are_normalized_per_type(db, status, user):
+    project = await db.get(Project, status.project_id)
+    project.name = "Pipeline"
+    await add_task(db, status, "Pipeline pipeline pipeline", "pipeline")
+    await add_task(db, status, "Unrelated", "mentions pipeline once in a long description of other work")
+
+    results, total = await SearchService.search(db, user.id, "pipeline")
+    assert total == 3
+    assert all(0.0 <= r.rank <= 1.0 for r in results)
+    by_type = {}
+    for r in results:
+        by_type.setdefault(r.type, []).append(r.rank)
+    assert max(by_type["task"]) == max(by_type["project"]) == 1.0
+    assert results[-1].type == "task"
+
+
+async def test_board_search_matches_title_substrings(db, status):
+    task = await add_task(db, status, "Dashboard widgets")
+
+    found = await crud_task.get_multi_by_board(db, status.board_id, search="board")
+
+    assert [t.id for t in found] == [task.id]
+    assert await crud_task.count_by_board(db, status.board_id, search="board") == 1
+
+
+async def test_like_fallback_escapes_wildcards(db, status):
+    await add_task(db, status, "Plain")
+    percent = await add_task(db, status, "Done 100%")
+
+    hits = task_hits("%", with_snippet=False)
+    found = (await db.execute(select(hits.c.task_id))).scalars().all()
+
+    assert found == [percent.id]
@@ -0,0 +1,63 @@
+from datetime import datetime, timezone
+
+from app.models import Checklist, ChecklistItem, Comment, Task
+
+from .conftest import add_task, auth_headers
+
+
+def url(status) -> str:
+    return f"/api/v1/projects/{status.project_id}/boards/{status.board_id}/tasks/"
+
+
+async def test_card_view_returns_lean_cards_with_counts(client, db, user, status):
+    task = await add_task(db, status, "Parent")
+    checklist = Checklist(task_id=task.id, title="Steps")
+    db.add(checklist)
+    await db.flush()
+    db.add_all([
+        ChecklistItem(checklist_id=checklist.id, title="a", is_completed=True),
+        ChecklistItem(checklist_id=checklist.id, title="b"),
+        Task(
+            project_id=task.project_id, board_id=task.board_id, status_id=status.id,
+            title="Child", creator_id=user.id, parent_id=task.id,
+            completed_at=datetime.now(timezone.utc),
+        ),
+        Comment(task_id=task.id, user_id=user.id, content={}, content_text="hi"),
+    ])
+    await db.commit()
+
+    response = await client.get(url(status), params={"view": "card"}, headers=auth_headers(user))
+
+    assert response.status_code == 200
+    [card] = response.json()["data"]
+    assert "attachments" not in card and "children" not in card
+    assert card["checklist_progress"] == {"total": 2, "completed": 1}
+    assert card["subtask_progress"] == {"total": 1, "completed": 1}
+    assert card["comments_count"] == 1
+
+
+async def test_card_view_pages_in_position_then_id_order(client, db, user, status):
+    tasks = [await add_task(db, status, f"Task {i}") for i in range(3)]
+    expected = [str(t.id) for t in sorted(tasks, key=lambda t: (t.position, t.id))]
+
+    first = await client.get(
+        url(status), params={"view": "card", "per_page": 2}, headers=auth_headers(user)
+    )
+    body = first.json()
+    rest = await client.get(
+        url(status),
+        params={"view": "card", "per_page": 2, "cursor": body["pagination"]["next_cursor"]},
+        headers=auth_headers(user),
+    )
+
+    assert body["pagination"]["total_pages"] == 2
+    assert [t["id"] for t in body["data"] + rest.json()["data"]] == expected
+
+
+async def test_full_view_is_the_default(client, db, user, status):
+    await add_task(db, status, "Task")
+
+    response = await client.get(url(status), headers=auth_headers(user))
+
+    assert response.status_code == 200
+    assert "attachments" in response.json()["data"][0]
@@ -0,0 +1,40 @@
+from datetime import UTC, datetime
+
+from app.crud import crud_task
+from app.models import Checklist, ChecklistItem, Task
+from app.schemas.task import TaskResponse
+
+from .conftest import add_task
+
+
+async def test_progress_is_counted_per_task_in_sql(db, status, user):
+    parent = await add_task(db, status, "Parent")
+    bare = await add_task(db, status, "Bare")
+    checklists = [Checklist(task_id=parent.id, title=t) for t in ("One", "Two")]
+    db.add_all(checklists)
+    await db.flush()
+    db.add_all([
+        ChecklistItem(checklist_id=checklists[0].id, title="a", is_completed=True),
+        ChecklistItem(checklist_id=checklists[0].id, title="b"),
+        ChecklistItem(checklist_id=checklists[1].id, title="c", is_completed=True),
+        *[
+            Task(
+                project_id=parent.project_id, board_id=parent.board_id, status_id=status.id,
+                title=f"Child {i}", creator_id=user.id, parent_id=parent.id,
+                completed_at=datetime.now(UTC) if i == 0 else None,
+            )
+            for i in range(2)
+        ],
+    ])
+    await db.commit()
+    db.expunge_all()
+
+    tasks = {t.id: t for t in await crud_task.get_multi_by_board(db, status.board_id)}
+    full = TaskResponse.model_validate(tasks[parent.id])
+    empty = TaskResponse.model_validate(tasks[bare.id])
+
+    assert full.checklist_progress.model_dump() == {"total": 3, "completed": 2}
+    assert full.subtask_progress.model_dump() == {"total": 2, "completed": 1}
+    assert full.children_count == 2
+    assert empty.checklist_progress.model_dump() == {"total": 0, "completed": 0}
+    assert empty.subtask_progress.model_dump() == {"total": 0, "completed": 0}
@@ -0,0 +1,126 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.models import WebhookDelivery
+from app.services.notification_service import NotificationService
+from app.services.webhook_dispatcher import WebhookDispatcher
+
+from .test_webhooks import add_webhook
+
+
+class Sent(list):
+    """Outgoing POSTs; ``status`` is the response every endpoint returns."""
+
+    status = 200
+
+
+def make_dispatcher(**overrides) -> WebhookDispatcher:
+    options = dict(
+        workers=4,
+        per_endpoint=2,
+        timeout=1.0,
+        max_attempts=2,
+        retry_base=10.0,
+        retry_max=60.0,
+        poll_interval=1.0,
+        retention_days=1,
+    )
+    options.update(overrides)
+    return WebhookDispatcher(**options)
+
+
+async def run_pass(dispatcher: WebhookDispatcher) -> None:
+    await dispatcher._dispatch_due()
+    if dispatcher._deliveries:
+        await asyncio.gather(*dispatcher._deliveries)
+
+
+async def deliveries(db) -> list[WebhookDelivery]:
+    db.expunge_all()
+    result = await db.execute(select(WebhookDelivery).order_by(WebhookDelivery.created_at))
+    rows = list(result.scalars().all())
+    # The in-memory database has one connection; free it for the dispatcher
+    await db.commit()
+    return rows
+
+
+@pytest.fixture
+def sent(monkeypatch) -> Sent:
+    sent = Sent()
+
+    async def send_webhook(url, secret, event, **kwargs):
+        sent.append(event)
+        return sent.status
+
+    async def send_webhook_batch(url, secret, events, **kwargs):
+        sent.append(events)
+        return sent.status
+
+    monkeypatch.setattr(NotificationService, "send_webhook", staticmethod(send_webhook))
+    monkeypatch.setattr(NotificationService, "send_webhook_batch", staticmethod(send_webhook_batch))
+    return sent
+
+
+def test_backoff_grows_exponentially_with_jitter_and_cap():
+    dispatcher = make_dispatcher()
+    for attempts, expected in ((1, 10.0), (2, 20.0), (3, 40.0), (4, 60.0), (10, 60.0)):
+        delay = dispatcher.backoff(attempts)
+        assert expected * 0.8 <= delay <= expected * 1.2
+
+
+async def test_delivers_due_events(db, project, sent):
+    await add_webhook(db, project)
+    await NotificationService.fire_webhooks(db, project.id, "task.created", {"id": 1})
+    await db.commit()
+
+    await run_pass(make_dispatcher())
+
+    assert sent == [{"event": "task.created", "data": {"id": 1}}]
+    [delivery] = await deliveries(db)
+    assert (delivery.status, delivery.attempts, delivery.response_status) == ("delivered", 1, 200)
+
+
+async def test_failures_back_off_then_give_up(db, project, sent):
+    sent.status = 500
+    await add_webhook(db, project)
+    await NotificationService.fire_webhooks(db, project.id, "task.created", {"id": 1})
+    await db.commit()
+    dispatcher = make_dispatcher()
+
+    before = datetime.now(UTC)
+    await run_pass(dispatcher)
+    [delivery] = await deliveries(db)
+    assert (delivery.status, delivery.attempts, delivery.error) == ("pending", 1, "HTTP 500")
+    assert delivery.next_attempt_at >= before + timedelta(seconds=8)
+
+    # Not due yet: nothing is sent
+    await run_pass(dispatcher)
+    assert len(sent) == 1
+
+    delivery.next_attempt_at = datetime.now(UTC)
+    await db.merge(delivery)
+    await db.commit()
+    await run_pass(dispatcher)
+    [delivery] = await deliveries(db)
+    assert (delivery.status, delivery.attempts) == ("failed", 2)
+    assert len(sent) == 2
+
+
+async def test_batches_are_sent_once_full(db, project, sent):
+    await add_webhook(db, project, batch_window_seconds=60, batch_max_size=2)
+    for i in range(3):
+        await NotificationService.fire_webhooks(db, project.id, "task.created", {"id": i})
+    await db.commit()
+    dispatcher = make_dispatcher()
+
+    await run_pass(dispatcher)
+    [batch] = sent
+    assert [event["data"] for event in batch] == [{"id": 0}, {"id": 1}]
+    assert [d.status for d in await deliveries(db)] == ["delivered", "delivered", "pending"]
+
+    # The leftover event waits out its window
+    await run_pass(dispatcher)
+    assert len(sent) == 1
@@ -0,0 +1,65 @@
+from sqlalchemy import delete, func, select
+
+from app.crud import crud_webhook
+from app.models import Project, Webhook, WebhookDelivery
+from app.services.notification_service import NotificationService
+
+
+async def add_webhook(db, project, **kwargs) -> Webhook:
+    kwargs.setdefault("events", ["task.created"])
+    webhook = Webhook(project_id=project.id, url="https://example.com/hook", **kwargs)
+    db.add(webhook)
+    await db.commit()
+    return webhook
+
+
+async def delivery_count(db) -> int:
+    return await db.scalar(select(func.count()).select_from(WebhookDelivery))
+
+
+async def test_fire_webhooks_queues_in_callers_transaction(db, project):
+    await add_webhook(db, project)
+
+    project.name = "Renamed"
+    await NotificationService.fire_webhooks(db, project.id, "task.created", {"id": 1})
+    await NotificationService.fire_webhooks(db, project.id, "task.deleted", {"id": 1})
+    await db.commit()
+
+    assert await delivery_count(db) == 1
+
+
+async def test_fire_webhooks_failure_keeps_callers_write(db, project, monkeypatch):
+    await add_webhook(db, project)
+
+    async def broken(*_args, **_kwargs):
+        raise RuntimeError("index unavailable")
+
+    monkeypatch.setattr(crud_webhook, "get_active_for_event", broken)
+
+    project.name = "Renamed"
+    await NotificationService.fire_webhooks(db, project.id, "task.created", {"id": 1})
+    await db.commit()
+
+    db.expunge_all()
+    assert (await db.get(Project, project.id)).name == "Renamed"
+    assert await delivery_count(db) == 0
+
+
+async def test_webhook_deleted_by_another_worker_is_dropped(db, project):
+    stale = await add_webhook(db, project)
+    # Build this process's index, then delete behind its back
+    assert await crud_webhook.get_active_for_event(db, project.id, "task.created")
+    await db.execute(delete(Webhook).where(Webhook.id == stale.id))
+    await db.commit()
+    live = await add_webhook(db, project)
+
+    project.name = "Renamed"
+    await NotificationService.fire_webhooks(db, project.id, "task.created", {"id": 1})
+    await db.commit()
+
+    db.expunge_all()
+    assert (await db.get(Project, project.id)).name == "Renamed"
+    deliveries = (await db.execute(select(WebhookDelivery))).scalars().all()
+    assert [d.webhook_id for d in deliveries] == [live.id]
+    subscriptions = await crud_webhook.get_active_for_event(db, project.id, "task.created")
+    assert [s.id for s in subscriptions] == [live.id]
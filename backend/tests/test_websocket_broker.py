@@ -0,0 +1,63 @@
+import asyncio
+
+from app.services import websocket_manager
+from app.services.websocket_manager import RedisBroker
+
+
+class FakePubSub:
+    def __init__(self, messages, fail: bool):
+        self.messages = messages
+        self.fail = fail
+        self.subscribed = []
+        self.closed = False
+
+    async def subscribe(self, channel):
+        self.subscribed.append(channel)
+
+    async def listen(self):
+        for message in self.messages:
+            yield message
+        if self.fail:
+            raise ConnectionError("connection reset")
+        await asyncio.Event().wait()
+
+    async def aclose(self):
+        self.closed = True
+
+
+class FakeRedis:
+    def __init__(self):
+        self.pubsubs = [
+            FakePubSub([{"data": "board:1\nfirst"}], fail=True),
+            FakePubSub([{"data": "board:1\nsecond"}], fail=False),
+        ]
+        self.created = []
+
+    def pubsub(self, **_kwargs):
+        pubsub = self.pubsubs.pop(0)
+        self.created.append(pubsub)
+        return pubsub
+
+
+async def test_listener_resubscribes_after_connection_loss(monkeypatch):
+    monkeypatch.setattr(websocket_manager, "RECONNECT_MIN_DELAY", 0.0)
+    broker = RedisBroker("redis://unused", "ws")
+    broker._redis = FakeRedis()
+    await broker._subscribe()
+
+    delivered = []
+    second = asyncio.Event()
+
+    async def deliver(key, payload):
+        delivered.append((key, payload))
+        if payload == "second":
+            second.set()
+
+    listener = asyncio.create_task(broker._listen(deliver))
+    await asyncio.wait_for(second.wait(), 1)
+    listener.cancel()
+
+    assert delivered == [("board:1", "first"), ("board:1", "second")]
+    first, resubscribed = broker._redis.created
+    assert first.closed
+    assert resubscribed.subscribed == ["ws"]
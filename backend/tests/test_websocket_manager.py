@@ -0,0 +1,123 @@
+import asyncio
+import json
+import uuid
+from datetime import UTC, datetime
+
+from app.services.notification_service import NotificationService
+from app.services.websocket_manager import (
+    SYNC_REQUIRED,
+    BroadcastEvent,
+    ConnectionManager,
+    _ClientConnection,
+    dumps,
+    manager,
+)
+
+
+class FakeWebSocket:
+    def __init__(self, *, block: bool = False):
+        self.sent: list[str] = []
+        self.closed_with: int | None = None
+        self._gate = asyncio.Event()
+        if not block:
+            self._gate.set()
+
+    async def send_text(self, msg: str) -> None:
+        await self._gate.wait()
+        self.sent.append(msg)
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed_with = code
+
+    def unblock(self) -> None:
+        self._gate.set()
+
+
+async def settle() -> None:
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+def test_dumps_matches_stdlib_values():
+    payload = {
+        "at": datetime(2026, 10, 17, 9, 30, tzinfo=UTC),
+        "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "name": "Zoë",
+        "n": [1, 2.5, None],
+    }
+    assert json.loads(dumps(payload)) == json.loads(json.dumps(payload, default=str))
+
+
+async def test_publish_encodes_once_for_every_channel(monkeypatch):
+    target = ConnectionManager()
+    sockets = {key: FakeWebSocket() for key in ("p1:b1", "p1", "user:u1", "user:u2")}
+    for key, ws in sockets.items():
+        await target.connect(key, ws)
+
+    event = BroadcastEvent(type="task.updated", data={"id": 1})
+    encodes = []
+    original = BroadcastEvent.encode
+    monkeypatch.setattr(
+        BroadcastEvent, "encode", lambda self: encodes.append(1) or original(self)
+    )
+    await target.publish(event, boards=[("p1", "b1")], projects=["p1"], users=["u1", "u2"])
+    await settle()
+
+    assert len(encodes) == 1
+    assert {ws.sent[0] for ws in sockets.values()} == {event.encode()}
+
+
+async def test_notification_ping_reaches_each_user(monkeypatch):
+    published = []
+
+    async def publish(event, *, users=(), **_kwargs):
+        published.append((event.type, sorted(users)))
+
+    monkeypatch.setattr(manager, "publish", publish)
+    u1, u2 = uuid.uuid4(), uuid.uuid4()
+    await NotificationService._broadcast_to_users({u1, u2})
+
+    assert published == [("notification.new", sorted([str(u1), str(u2)]))]
+
+
+async def slow_client(policy: str, dead: list) -> tuple[_ClientConnection, FakeWebSocket]:
+    """A client whose writer is stuck sending "m0", with "m1" and "m2" queued (full)."""
+    ws = FakeWebSocket(block=True)
+    client = _ClientConnection(ws, dead.append, max_queue=2, policy=policy, send_timeout=5)
+    client.enqueue("m0")
+    await settle()
+    client.enqueue("m1")
+    client.enqueue("m2")
+    return client, ws
+
+
+async def test_drop_oldest_discards_the_oldest_pending_frame():
+    client, ws = await slow_client("drop_oldest", dead := [])
+    client.enqueue("m3")
+    ws.unblock()
+    await settle()
+
+    assert ws.sent == ["m0", "m2", "m3"]
+    assert dead == []
+    client.close()
+
+
+async def test_coalesce_replaces_the_backlog_with_sync_required():
+    client, ws = await slow_client("coalesce", dead := [])
+    client.enqueue("m3")
+    ws.unblock()
+    await settle()
+
+    assert ws.sent == ["m0", SYNC_REQUIRED]
+    assert dead == []
+    client.close()
+
+
+async def test_disconnect_drops_and_closes_the_socket():
+    client, ws = await slow_client("disconnect", dead := [])
+    client.enqueue("m3")
+    await client._closer
+
+    assert dead == [client]
+    assert ws.closed_with == 1013
+    client.close()
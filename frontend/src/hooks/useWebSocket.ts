@@ -161,10 +161,45 @@ export function useWebSocket(projectId: string, boardId: string) {
       queryClient.invalidateQueries({ queryKey: ['tasks', projectId, boardId] })
     }
 
+    const handleBulkUpdated = (e: Record<string, unknown>) => {
+      for (const task of e.data as Task[]) {
+        handleUpdated({ ...e, data: task })
+      }
+    }
+    const handleBulkMoved = (e: Record<string, unknown>) => {
+      const tasks = e.data as Task[]
+      for (const task of tasks) {
+        if (localMoves.has(task.id)) continue
+        if (useBoardStore.getState().isDragging) {
+          pendingWSUpdates.push(task)
+        } else {
+          animatedRelocate(task)
+        }
+      }
+      const user = e.user as { username: string; agent?: { name: string } } | undefined
+      if (user) toast.info(`${wsActorName(user)} moved ${tasks.length} tasks`)
+      invalidateActivity()
+    }
+    const handleBulkDeleted = (e: Record<string, unknown>) => {
+      const data = e.data as { task_ids: string[] }
+      data.task_ids.forEach((id) => removeTask(id))
+      invalidateActivity()
+    }
+
+    // Server dropped our backlog (client fell behind) — refetch everything
+    const handleSyncRequired = () => {
+      queryClient.invalidateQueries({ queryKey: ['tasks', projectId, boardId] })
+      queryClient.invalidateQueries({ queryKey: ['notifications'] })
+      invalidateActivity()
+    }
+
     wsManager.on('task.created', handleCreated)
     wsManager.on('task.updated', handleUpdated)
     wsManager.on('task.deleted', handleDeleted)
     wsManager.on('task.moved', handleMoved)
+    wsManager.on('task.bulk_updated', handleBulkUpdated)
+    wsManager.on('task.bulk_moved', handleBulkMoved)
+    wsManager.on('task.bulk_deleted', handleBulkDeleted)
     wsManager.on('notification.new', handleNotification)
     wsManager.on('checklist.updated', handleChecklistUpdated)
     wsManager.on('reaction.updated', handleReactionUpdated)
@@ -176,12 +211,16 @@ export function useWebSocket(projectId: string, boardId: string) {
     wsManager.on('subtask.updated', handleSubtaskChange)
     wsManager.on('subtask.deleted', handleSubtaskChange)
     wsManager.on('subtask.reordered', handleSubtaskChange)
+    wsManager.on('sync.required', handleSyncRequired)
 
     return () => {
       wsManager.off('task.created', handleCreated)
       wsManager.off('task.updated', handleUpdated)
       wsManager.off('task.deleted', handleDeleted)
       wsManager.off('task.moved', handleMoved)
+      wsManager.off('task.bulk_updated', handleBulkUpdated)
+      wsManager.off('task.bulk_moved', handleBulkMoved)
+      wsManager.off('task.bulk_deleted', handleBulkDeleted)
       wsManager.off('notification.new', handleNotification)
       wsManager.off('checklist.updated', handleChecklistUpdated)
       wsManager.off('reaction.updated', handleReactionUpdated)
@@ -193,6 +232,7 @@ export function useWebSocket(projectId: string, boardId: string) {
       wsManager.off('subtask.updated', handleSubtaskChange)
       wsManager.off('subtask.deleted', handleSubtaskChange)
       wsManager.off('subtask.reordered', handleSubtaskChange)
+      wsManager.off('sync.required', handleSyncRequired)
     }
   }, [projectId, boardId, accessToken, addTask, updateTask, relocateTask, removeTask, queryClient])
 }